@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+FEMALE_NAMES = (
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Merve", "Şule", "Özlem", "Gül",
+    "Büşra", "İrem", "Çiğdem", "Derya", "Esra", "Gökçe", "Hülya", "Nur", "Sevgi", "Yasemin",
+)
+MALE_NAMES = (
+    "Mehmet", "Mustafa", "Ahmet", "Ali", "Hüseyin", "Hasan", "İbrahim", "İsmail", "Osman", "Yusuf",
+    "Murat", "Ömer", "Emre", "Burak", "Çağlar", "Doğan", "Gökhan", "Şükrü", "Uğur", "Kerem",
+)
+SURNAMES = (
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Öz", "Korkmaz", "Çakır", "Erdoğan", "Güneş", "Akın", "Ağaoğlu", "Işık", "Uçar",
+)
+VISIT_NOTES = (
+    "Kontrol muayenesi yapıldı.",
+    "Tansiyon ölçüldü, normal sınırlarda.",
+    "Reçete yenilendi.",
+    "Kan tahlili istendi.",
+    "Tahlil sonuçları değerlendirildi.",
+    "Boğaz enfeksiyonu, antibiyotik başlandı.",
+    "Baş ağrısı şikayeti, ağrı kesici önerildi.",
+    "Aşı yapıldı.",
+    "Pansuman yapıldı.",
+    "Diyet önerileri verildi.",
+)
+APPOINTMENT_NOTES = ("Kontrol", "Tahlil sonucu", "Aşı", "Pansuman", "Reçete", "İlk muayene")
+PHONE_PREFIXES = ("530", "532", "533", "535", "536", "541", "542", "505", "506", "555")
+
+HISTORY_START = datetime(2023, 1, 1, 8, 0)
+HISTORY_DAYS = 730
+AGENDA_START = datetime(2025, 1, 6, 9, 0)
+AGENDA_DAYS = 60
+
+
+def iter_patients(count: int, seed: int = 42) -> Iterator[Patient]:
+    rng = random.Random(seed)
+    for number in range(1, count + 1):
+        female = rng.random() < 0.52
+        first = rng.choice(FEMALE_NAMES if female else MALE_NAMES)
+        patient = Patient(
+            patient_id=f"P-{number:07d}",
+            full_name=f"{first} {rng.choice(SURNAMES)}",
+            phone=f"0{rng.choice(PHONE_PREFIXES)} {rng.randint(100, 999)} "
+            f"{rng.randint(10, 99)} {rng.randint(10, 99)}",
+            age=rng.randint(0, 95),
+            gender="Kadın" if female else "Erkek",
+        )
+        visit_times = sorted(
+            HISTORY_START + timedelta(days=rng.randrange(HISTORY_DAYS), minutes=rng.randrange(600))
+            for _ in range(rng.randint(0, 6))
+        )
+        for created_at in visit_times:
+            patient.add_visit(note=rng.choice(VISIT_NOTES), created_at=created_at)
+        for _ in range(rng.randint(0, 2)):
+            patient.add_appointment(scheduled_at=appointment_slot(rng), note=rng.choice(APPOINTMENT_NOTES))
+        yield patient
+
+
+def appointment_slot(rng: random.Random) -> datetime:
+    return AGENDA_START + timedelta(days=rng.randrange(AGENDA_DAYS), minutes=15 * rng.randrange(32))
+
+
+def write_json_dataset(path: Path, count: int, seed: int = 42) -> None:
+    repository = JsonPatientRepository(path)
+    with repository.batch():
+        for patient in iter_patients(count, seed):
+            repository.add(patient)
+    repository.close()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from app.infrastructure.serialization import deserialize_patient
+
+_NOTES = ("Kontrol", "Tansiyon ölçüldü", "Reçete yenilendi", "Tahlil sonuçları değerlendirildi")
+_GENDERS = ("Kadın", "Erkek", "Belirtilmedi")
+
+
+@dataclass(frozen=True)
+class _LegacyVisit:
+    note: str
+    created_at: datetime
+
+
+@dataclass
+class _LegacyPatient:
+    patient_id: str
+    full_name: str
+    phone: str
+    age: int
+    gender: str
+    visits: List[_LegacyVisit] = field(default_factory=list)
+
+
+def _payloads(patients: int, visits: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    records = [
+        {
+            "patient_id": f"P-{number}",
+            "full_name": f"Hasta {number}",
+            "phone": f"555-{number:07d}",
+            "age": rng.randint(1, 90),
+            "gender": rng.choice(_GENDERS),
+            "visits": [
+                {
+                    "note": rng.choice(_NOTES),
+                    "created_at": (start + timedelta(minutes=rng.randint(0, 3_000_000))).isoformat(),
+                }
+                for _ in range(visits)
+            ],
+        }
+        for number in range(patients)
+    ]
+    return json.loads(json.dumps(records))
+
+
+def _legacy_patient(payload: dict) -> _LegacyPatient:
+    return _LegacyPatient(
+        patient_id=payload["patient_id"],
+        full_name=payload["full_name"],
+        phone=payload["phone"],
+        age=payload["age"],
+        gender=payload["gender"],
+        visits=[
+            _LegacyVisit(note=item["note"], created_at=datetime.fromisoformat(item["created_at"]))
+            for item in payload["visits"]
+        ],
+    )
+
+
+def _measure(build: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    data = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Muayene başına bellek kullanımı ölçümü")
+    parser.add_argument("--patients", type=int, default=2_000)
+    parser.add_argument("--visits", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    payloads = _payloads(args.patients, args.visits, args.seed)
+    total = args.patients * args.visits
+    cases = [
+        ("önce: dataclass", lambda: [_legacy_patient(item) for item in payloads]),
+        ("sonra: slotlu liste", lambda: [deserialize_patient(item) for item in payloads]),
+        ("sonra: dizi tabanlı", lambda: [deserialize_patient(item, packed=True) for item in payloads]),
+    ]
+    print(f"{args.patients} hasta, {total} muayene")
+    for label, build in cases:
+        print(f"{label:<22} {_measure(build) / total:8.1f} bayt/muayene")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Type
+
+from app.domain.entities import Patient
+from app.infrastructure.binary_repository import BinaryPatientRepository
+from app.infrastructure.json_repository import JsonPatientRepository
+
+_NOTES = ("Kontrol", "Tansiyon ölçüldü", "Reçete yenilendi", "Tahlil sonuçları değerlendirildi")
+_GENDERS = ("Kadın", "Erkek", "Belirtilmedi")
+_VISITS_PER_PATIENT = 10
+
+
+def _patients(visits: int, seed: int) -> List[Patient]:
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    patients = []
+    for number in range(max(1, visits // _VISITS_PER_PATIENT)):
+        patient = Patient(
+            patient_id=f"P-{number}",
+            full_name=f"Hasta {number}",
+            phone=f"555-{number:07d}",
+            age=rng.randint(1, 90),
+            gender=rng.choice(_GENDERS),
+        )
+        for _ in range(_VISITS_PER_PATIENT):
+            patient.add_visit(
+                note=rng.choice(_NOTES),
+                created_at=start + timedelta(seconds=rng.randint(0, 150_000_000)),
+            )
+        patients.append(patient)
+    return patients
+
+
+def _measure(
+    repository_type: Type[JsonPatientRepository], path: Path, patients: List[Patient], packed: bool
+):
+    repository = repository_type(path, packed_records=packed)
+    started = time.perf_counter()
+    repository._write_snapshot(patients)
+    saved = time.perf_counter() - started
+    started = time.perf_counter()
+    loaded = repository_type(path, packed_records=packed)
+    load = time.perf_counter() - started
+    assert len(list(loaded.list_all())) == len(patients)
+    return saved, load, path.stat().st_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JSON ve ikili anlık görüntü yükleme/kaydetme süreleri")
+    parser.add_argument("--visits", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'muayene':>9} {'biçim':<14} {'kaydet sn':>10} {'yükle sn':>10} {'boyut MB':>9}")
+    for visits in args.visits:
+        patients = _patients(visits, args.seed)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for label, repository_type, name, packed in (
+                ("json", JsonPatientRepository, "patients.json", False),
+                ("binary", BinaryPatientRepository, "patients.bin", False),
+                ("binary+packed", BinaryPatientRepository, "packed.bin", True),
+            ):
+                path = Path(temp_dir) / name
+                saved, load, size = _measure(repository_type, path, patients, packed)
+                print(f"{visits:>9} {label:<14} {saved:>10.3f} {load:>10.3f} {size / 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
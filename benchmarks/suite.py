@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+import app
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.interface.gui import SEARCH_LIMIT, GuiApp
+from benchmarks.datagen import appointment_slot, write_json_dataset
+
+RESULT_VERSION = 1
+DEFAULT_SCALES = (1_000, 10_000)
+FILTER_QUERIES = ("ay", "yılmaz", "ŞAHİN", "mehmet ö", "0532", "P-00001", "zzz")
+NOTE_QUERIES = ("yapıldı", "kontrol", "kontrol yapıldı", '"baş ağrısı"')
+VISIBLE_ROWS = 30
+COLD_START_RUNS = 3
+
+_COLD_START = textwrap.dedent(
+    """
+    import time
+
+    started = time.perf_counter()
+    import app.gui_main
+    imported = time.perf_counter()
+    from app.application.use_cases import PatientService
+    from app.config import get_storage_settings
+    from app.infrastructure.factory import create_repository
+
+    repository = create_repository(get_storage_settings())
+    PatientService(repository)
+    print(imported - started, time.perf_counter() - imported)
+    repository.close()
+    """
+)
+
+
+class Regression(NamedTuple):
+    scale: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def run_scale(scale: int, operations: int, seed: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "data" / "patients.json"
+        path.parent.mkdir()
+        write_json_dataset(path, scale, seed)
+        metrics: Dict[str, float] = {"file_bytes": float(path.stat().st_size)}
+        metrics.update(_cold_start(path))
+
+        started = time.perf_counter()
+        repository = JsonPatientRepository(path)
+        metrics["load_s"] = time.perf_counter() - started
+        service = PatientService(repository)
+        rng = random.Random(seed)
+        existing = [f"P-{rng.randint(1, scale):07d}" for _ in range(operations)]
+
+        metrics["register_patient_ms"] = _per_call_ms(
+            operations,
+            lambda index: service.register_patient(
+                RegisterPatientRequest(
+                    patient_id=f"B-{index:07d}",
+                    full_name="Deneme Hasta",
+                    phone="0555 000 00 00",
+                    age=40,
+                    gender="Belirtilmedi",
+                )
+            ),
+        )
+        metrics["add_visit_ms"] = _per_call_ms(
+            operations,
+            lambda index: service.add_visit(
+                AddVisitRequest(
+                    patient_id=existing[index],
+                    note="Kontrol muayenesi yapıldı.",
+                    created_at=datetime(2025, 1, 6, 9, 0) + timedelta(minutes=index),
+                )
+            ),
+        )
+        metrics["schedule_appointment_ms"] = _per_call_ms(
+            operations,
+            lambda index: service.schedule_appointment(
+                ScheduleAppointmentRequest(
+                    patient_id=existing[index], scheduled_at=appointment_slot(rng), note="Kontrol"
+                )
+            ),
+        )
+
+        started = time.perf_counter()
+        count = sum(1 for _ in service.list_patients())
+        metrics["list_patients_s"] = time.perf_counter() - started
+        assert count == scale + operations
+
+        started = time.perf_counter()
+        service.search("a")
+        metrics["search_index_build_s"] = time.perf_counter() - started
+        metrics["gui_filter_ms"] = _per_call_ms(
+            len(FILTER_QUERIES) * 3,
+            lambda index: _gui_filter(service, FILTER_QUERIES[index % len(FILTER_QUERIES)]),
+        )
+
+        started = time.perf_counter()
+        service.search_notes("kontrol")
+        metrics["note_index_build_s"] = time.perf_counter() - started
+        metrics["note_search_common_ms"] = _per_call_ms(
+            len(NOTE_QUERIES) * 3,
+            lambda index: service.search_notes(NOTE_QUERIES[index % len(NOTE_QUERIES)]),
+        )
+        repository.close()
+
+        metrics["peak_memory_bytes"] = float(_peak_memory(lambda: JsonPatientRepository(path)))
+        return metrics
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> List[Regression]:
+    regressions = []
+    for scale, metrics in current["results"].items():
+        reference = baseline["results"].get(scale)
+        if reference is None:
+            continue
+        for metric, value in metrics.items():
+            previous = reference.get(metric)
+            if previous is None or metric == "file_bytes":
+                continue
+            if value > previous * (1 + threshold):
+                regressions.append(Regression(scale, metric, previous, value))
+    return regressions
+
+
+def _cold_start(path: Path) -> Dict[str, float]:
+    env = {name: value for name, value in os.environ.items() if not name.startswith("HASTA_")}
+    env["PYTHONPATH"] = str(Path(app.__file__).resolve().parents[1])
+    imports, loads = [], []
+    for _ in range(COLD_START_RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", _COLD_START],
+            cwd=path.parents[1],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        imports.append(float(output[0]))
+        loads.append(float(output[1]))
+    gui_import = statistics.median(imports)
+    load = statistics.median(loads)
+    return {
+        "cold_gui_import_s": gui_import,
+        "cold_repository_load_s": load,
+        "cold_start_s": gui_import + load,
+    }
+
+
+def _gui_filter(service: PatientService, query: str) -> None:
+    patients = service.search(query, limit=SEARCH_LIMIT)
+    for patient in patients[:VISIBLE_ROWS]:
+        GuiApp._patient_row(patient)
+
+
+def _per_call_ms(count: int, call: Callable[[int], object]) -> float:
+    timings = []
+    for index in range(count):
+        started = time.perf_counter()
+        call(index)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def _peak_memory(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        result = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def _run(args: argparse.Namespace) -> int:
+    document = {
+        "version": RESULT_VERSION,
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "operations": args.operations,
+        },
+        "results": {},
+    }
+    for scale in args.scales:
+        print(f"Ölçek {scale}...", file=sys.stderr)
+        metrics = run_scale(scale, args.operations, args.seed)
+        document["results"][str(scale)] = metrics
+        for metric, value in metrics.items():
+            print(f"  {metric:<24} {value:,.4f}", file=sys.stderr)
+    payload = json.dumps(document, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    if args.baseline:
+        return _report(document, _load(args.baseline), args.threshold)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    return _report(_load(args.current), _load(args.baseline), args.threshold)
+
+
+def _report(current: dict, baseline: dict, threshold: float) -> int:
+    regressions = compare_results(current, baseline, threshold)
+    for item in regressions:
+        print(
+            f"GERİLEME {item.scale} {item.metric}: {item.baseline:.4f} -> {item.current:.4f} "
+            f"(x{item.ratio:.2f})",
+            file=sys.stderr,
+        )
+    if not regressions:
+        print(f"Gerileme yok (eşik %{threshold * 100:.0f}).", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _load(path: str) -> dict:
+    document = json.loads(Path(path).read_text(encoding="utf-8"))
+    if document.get("version") != RESULT_VERSION:
+        raise SystemExit(f"Desteklenmeyen sonuç dosyası: {path}")
+    return document
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Performans ölçümleri")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Ölçümleri çalıştır")
+    run.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES))
+    run.add_argument("--operations", type=int, default=20, help="İşlem başına tekrar sayısı")
+    run.add_argument("--seed", type=int, default=42)
+    run.add_argument("--output", help="Sonuç JSON dosyası (varsayılan: standart çıktı)")
+    run.add_argument("--baseline", help="Karşılaştırılacak temel sonuç dosyası")
+    run.add_argument("--threshold", type=float, default=0.25, help="İzin verilen yavaşlama oranı")
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser("compare", help="İki sonuç dosyasını karşılaştır")
+    compare.add_argument("current")
+    compare.add_argument("baseline")
+    compare.add_argument("--threshold", type=float, default=0.25)
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.application.attribute_index import PatientQuery, QueryPlan
+from app.application.calendar_index import AgendaEntry
+from app.application.note_index import NoteHit
+from app.application.use_cases import (
+    NOTE_SEARCH_LIMIT,
+    PAGE_SIZE,
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Appointment, Patient
+from app.domain.paging import PageCursor, PatientPage
+
+T = TypeVar("T")
+
+DEFAULT_READERS = 8
+DEFAULT_WRITERS = 2
+
+
+class _PatientLock:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class AsyncPatientService:
+    def __init__(
+        self,
+        service: PatientService,
+        max_readers: int = DEFAULT_READERS,
+        max_writers: int = DEFAULT_WRITERS,
+    ) -> None:
+        if max_readers < 1 or max_writers < 1:
+            raise ValueError("İş parçacığı sayısı pozitif olmalı.")
+        self._service = service
+        self._readers = ThreadPoolExecutor(max_readers, thread_name_prefix="patient-read")
+        self._writers = ThreadPoolExecutor(max_writers, thread_name_prefix="patient-write")
+        self._locks: Dict[str, _PatientLock] = {}
+
+    @property
+    def service(self) -> PatientService:
+        return self._service
+
+    async def register_patient(self, request: RegisterPatientRequest) -> Patient:
+        return await self._write(request.patient_id, self._service.register_patient, request)
+
+    async def add_visit(self, request: AddVisitRequest) -> Patient:
+        return await self._write(request.patient_id, self._service.add_visit, request)
+
+    async def schedule_appointment(self, request: ScheduleAppointmentRequest) -> Patient:
+        return await self._write(request.patient_id, self._service.schedule_appointment, request)
+
+    async def get_patient(self, patient_id: str) -> Optional[Patient]:
+        return await self._read(self._service.get_patient, patient_id)
+
+    async def list_patients_page(
+        self, after: Optional[PageCursor] = None, limit: int = PAGE_SIZE
+    ) -> PatientPage:
+        return await self._read(self._service.list_patients_page, after, limit)
+
+    async def search(self, query: str, limit: int = 50) -> List[Patient]:
+        return await self._read(self._service.search, query, limit)
+
+    async def search_notes(self, query: str, limit: int = NOTE_SEARCH_LIMIT) -> List[NoteHit]:
+        return await self._read(self._service.search_notes, query, limit)
+
+    async def query(self, spec: PatientQuery, limit: Optional[int] = None) -> List[Patient]:
+        return await self._read(self._service.query, spec, limit)
+
+    async def query_with_plan(
+        self, spec: PatientQuery, limit: Optional[int] = None
+    ) -> Tuple[List[Patient], QueryPlan]:
+        return await self._read(self._service.query_with_plan, spec, limit)
+
+    async def explain_query(self, spec: PatientQuery) -> QueryPlan:
+        return await self._read(self._service.explain_query, spec)
+
+    async def agenda(self, start: datetime, end: datetime) -> List[AgendaEntry]:
+        return await self._read(self._service.agenda, start, end)
+
+    async def patient_appointments(
+        self,
+        patient_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        series_from: Optional[datetime] = None,
+    ) -> List[Appointment]:
+        return await self._read(
+            self._service.patient_appointments, patient_id, start, end, series_from
+        )
+
+    async def next_appointment(self, patient_id: str, after: datetime) -> Optional[Appointment]:
+        return await self._read(self._service.next_appointment, patient_id, after)
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    async def __aenter__(self) -> "AsyncPatientService":
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        await self.close()
+
+    async def _read(self, call: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, partial(call, *args))
+
+    async def _write(self, patient_id: str, call: Callable[..., T], *args: Any) -> T:
+        entry = self._locks.get(patient_id)
+        if entry is None:
+            entry = self._locks[patient_id] = _PatientLock()
+        entry.users += 1
+        try:
+            await entry.lock.acquire()
+        except BaseException:
+            self._release(patient_id, entry, locked=False)
+            raise
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._writers, partial(call, *args))
+        future.add_done_callback(partial(self._finish, patient_id, entry))
+        return await asyncio.shield(future)
+
+    def _finish(self, patient_id: str, entry: _PatientLock, future: "asyncio.Future[Any]") -> None:
+        if not future.cancelled():
+            future.exception()
+        self._release(patient_id, entry, locked=True)
+
+    def _release(self, patient_id: str, entry: _PatientLock, locked: bool) -> None:
+        if locked:
+            entry.lock.release()
+        entry.users -= 1
+        if not entry.users and self._locks.get(patient_id) is entry:
+            del self._locks[patient_id]
+
+    def _shutdown(self) -> None:
+        self._writers.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
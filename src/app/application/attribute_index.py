@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from app.domain.entities import Patient
+from app.domain.recurrence import RecurringAppointment
+from app.domain.text import turkish_casefold, turkish_sort_key
+
+_MAX_AGE = 1 << 31
+
+
+@dataclass(frozen=True)
+class PatientQuery:
+    min_age: Optional[int] = None
+    max_age: Optional[int] = None
+    gender: Optional[str] = None
+    visited_since: Optional[datetime] = None
+    not_visited_since: Optional[datetime] = None
+    appointment_from: Optional[datetime] = None
+    appointment_until: Optional[datetime] = None
+
+
+class PlanStep(NamedTuple):
+    index: str
+    predicate: str
+    estimated: int
+    method: str
+    remaining: int
+
+
+@dataclass
+class QueryPlan:
+    total: int
+    steps: List[PlanStep] = field(default_factory=list)
+
+    def describe(self) -> List[str]:
+        if not self.steps:
+            return [f"Koşul yok: tüm hastalar ({self.total})"]
+        return [
+            f"{number}. {step.index} [{step.predicate}] tahmin={step.estimated} "
+            f"yöntem={step.method} kalan={step.remaining}"
+            for number, step in enumerate(self.steps, 1)
+        ]
+
+
+class _Record(NamedTuple):
+    age: int
+    gender: str
+    last_visit: Optional[datetime]
+    appointments: List[datetime]
+    series: List[RecurringAppointment]
+
+
+class _Step(NamedTuple):
+    index: str
+    predicate: str
+    estimated: int
+    fetch: Callable[[], Set[str]]
+    test: Callable[[str], bool]
+
+
+class PatientAttributeIndex:
+    def __init__(self, patients: Iterable[Patient] = ()) -> None:
+        self._ages: List[Tuple[int, str]] = []
+        self._genders: Dict[str, Set[str]] = {}
+        self._last_visits: List[Tuple[datetime, str]] = []
+        self._appointments: List[Tuple[datetime, str]] = []
+        self._series_owners: Set[str] = set()
+        self._records: Dict[str, _Record] = {}
+        self._sort_keys: Dict[str, Tuple[str, str]] = {}
+        for patient in patients:
+            self._store(patient, sort=False)
+        self._ages.sort()
+        self._last_visits.sort()
+        self._appointments.sort()
+
+    def add(self, patient: Patient) -> None:
+        self.remove(patient.patient_id)
+        self._store(patient, sort=True)
+
+    def remove(self, patient_id: str) -> None:
+        record = self._records.pop(patient_id, None)
+        if record is None:
+            return
+        age, gender, last_visit, appointments, _ = record
+        self._series_owners.discard(patient_id)
+        del self._sort_keys[patient_id]
+        _discard(self._ages, (age, patient_id))
+        bucket = self._genders[gender]
+        bucket.discard(patient_id)
+        if not bucket:
+            del self._genders[gender]
+        if last_visit is not None:
+            _discard(self._last_visits, (last_visit, patient_id))
+        for scheduled_at in appointments:
+            _discard(self._appointments, (scheduled_at, patient_id))
+
+    def query(self, spec: PatientQuery) -> Tuple[List[str], QueryPlan]:
+        plan = QueryPlan(total=len(self._records))
+        steps = sorted(self._steps(spec), key=lambda step: step.estimated)
+        if not steps:
+            candidates = set(self._records)
+        else:
+            first = steps[0]
+            candidates = first.fetch()
+            plan.steps.append(
+                PlanStep(first.index, first.predicate, first.estimated, "indeks", len(candidates))
+            )
+            for step in steps[1:]:
+                if len(candidates) <= step.estimated:
+                    candidates = {patient_id for patient_id in candidates if step.test(patient_id)}
+                    method = "süzme"
+                else:
+                    candidates &= step.fetch()
+                    method = "kesişim"
+                plan.steps.append(
+                    PlanStep(step.index, step.predicate, step.estimated, method, len(candidates))
+                )
+        return sorted(candidates, key=self._sort_keys.__getitem__), plan
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _steps(self, spec: PatientQuery) -> List[_Step]:
+        steps = []
+        if spec.min_age is not None or spec.max_age is not None:
+            low = spec.min_age if spec.min_age is not None else -_MAX_AGE
+            high = spec.max_age if spec.max_age is not None else _MAX_AGE
+            steps.append(
+                _Step(
+                    "yaş",
+                    f"{_bound(spec.min_age)}..{_bound(spec.max_age)}",
+                    _count(self._ages, (low,), (high + 1,)),
+                    lambda: _ids(self._ages, (low,), (high + 1,)),
+                    lambda patient_id: low <= self._records[patient_id].age <= high,
+                )
+            )
+        if spec.gender is not None:
+            gender = _fold(spec.gender)
+            bucket = self._genders.get(gender, set())
+            steps.append(
+                _Step(
+                    "cinsiyet",
+                    spec.gender,
+                    len(bucket),
+                    lambda: set(bucket),
+                    lambda patient_id: self._records[patient_id].gender == gender,
+                )
+            )
+        if spec.visited_since is not None:
+            since = spec.visited_since
+            steps.append(
+                _Step(
+                    "son muayene",
+                    f">= {_bound(since)}",
+                    _count(self._last_visits, (since,), None),
+                    lambda: _ids(self._last_visits, (since,), None),
+                    lambda patient_id: self._visited_since(patient_id, since),
+                )
+            )
+        if spec.not_visited_since is not None:
+            cutoff = spec.not_visited_since
+            steps.append(
+                _Step(
+                    "son muayene",
+                    f"yok veya < {_bound(cutoff)}",
+                    len(self._records) - _count(self._last_visits, (cutoff,), None),
+                    lambda: set(self._records) - _ids(self._last_visits, (cutoff,), None),
+                    lambda patient_id: not self._visited_since(patient_id, cutoff),
+                )
+            )
+        if spec.appointment_from is not None or spec.appointment_until is not None:
+            start = (spec.appointment_from,) if spec.appointment_from is not None else None
+            end = (spec.appointment_until,) if spec.appointment_until is not None else None
+            steps.append(
+                _Step(
+                    "randevu",
+                    f"{_bound(spec.appointment_from)}..{_bound(spec.appointment_until)}",
+                    _count(self._appointments, start, end) + len(self._series_owners),
+                    lambda: _ids(self._appointments, start, end) | {
+                        patient_id
+                        for patient_id in self._series_owners
+                        if self._has_occurrence(patient_id, spec)
+                    },
+                    lambda patient_id: any(
+                        _within(scheduled_at, spec.appointment_from, spec.appointment_until)
+                        for scheduled_at in self._records[patient_id].appointments
+                    )
+                    or self._has_occurrence(patient_id, spec),
+                )
+            )
+        return steps
+
+    def _has_occurrence(self, patient_id: str, spec: PatientQuery) -> bool:
+        return any(
+            next(series.occurrences(spec.appointment_from, spec.appointment_until), None)
+            is not None
+            for series in self._records[patient_id].series
+        )
+
+    def _visited_since(self, patient_id: str, since: datetime) -> bool:
+        last_visit = self._records[patient_id].last_visit
+        return last_visit is not None and last_visit >= since
+
+    def _store(self, patient: Patient, sort: bool) -> None:
+        gender = _fold(patient.gender)
+        last_visit = max((visit.created_at for visit in patient.visits), default=None)
+        appointments = [appointment.scheduled_at for appointment in patient.appointments]
+        series = list(patient.recurring)
+        self._records[patient.patient_id] = _Record(
+            patient.age, gender, last_visit, appointments, series
+        )
+        if series:
+            self._series_owners.add(patient.patient_id)
+        self._sort_keys[patient.patient_id] = (
+            turkish_sort_key(patient.full_name),
+            patient.patient_id,
+        )
+        self._genders.setdefault(gender, set()).add(patient.patient_id)
+        entries: List[Tuple[List, tuple]] = [(self._ages, (patient.age, patient.patient_id))]
+        if last_visit is not None:
+            entries.append((self._last_visits, (last_visit, patient.patient_id)))
+        entries.extend(
+            (self._appointments, (scheduled_at, patient.patient_id))
+            for scheduled_at in appointments
+        )
+        for keys, key in entries:
+            if sort:
+                insort(keys, key)
+            else:
+                keys.append(key)
+
+
+def _fold(text: str) -> str:
+    return turkish_casefold(text.strip())
+
+
+def _bound(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return f"{value:%Y-%m-%d %H:%M}"
+    return str(value)
+
+
+def _within(value: datetime, start: Optional[datetime], end: Optional[datetime]) -> bool:
+    return (start is None or value >= start) and (end is None or value < end)
+
+
+def _bounds(keys: List, start: Optional[tuple], end: Optional[tuple]) -> Tuple[int, int]:
+    first = bisect_left(keys, start) if start is not None else 0
+    last = bisect_left(keys, end, lo=first) if end is not None else len(keys)
+    return first, last
+
+
+def _count(keys: List, start: Optional[tuple], end: Optional[tuple]) -> int:
+    first, last = _bounds(keys, start, end)
+    return last - first
+
+
+def _ids(keys: List, start: Optional[tuple], end: Optional[tuple]) -> Set[str]:
+    first, last = _bounds(keys, start, end)
+    return {patient_id for _, patient_id in keys[first:last]}
+
+
+def _discard(keys: List, key: tuple) -> None:
+    position = bisect_left(keys, key)
+    if position < len(keys) and keys[position] == key:
+        del keys[position]
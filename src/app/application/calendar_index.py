@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.entities import Appointment, Patient
+from app.domain.recurrence import RecurringAppointment
+
+SERIES_HORIZON = timedelta(days=365)
+
+
+@dataclass(frozen=True)
+class AgendaEntry:
+    scheduled_at: datetime
+    patient_id: str
+    full_name: str
+    note: str
+
+
+_Slot = Tuple[datetime, str, int]
+_PatientSlot = Tuple[datetime, int, Appointment]
+_Series = Tuple[str, str, RecurringAppointment]
+
+
+class AppointmentCalendar:
+    def __init__(self, patients: Iterable[Patient] = ()) -> None:
+        self._slots: List[_Slot] = []
+        self._entries: Dict[int, AgendaEntry] = {}
+        self._by_patient: Dict[str, List[_PatientSlot]] = {}
+        self._series: List[_Series] = []
+        self._series_by_patient: Dict[str, List[RecurringAppointment]] = {}
+        self._sequence = 0
+        for patient in patients:
+            self.add_patient(patient)
+        self._slots.sort()
+        for slots in self._by_patient.values():
+            slots.sort()
+
+    def add_patient(self, patient: Patient) -> None:
+        for appointment in patient.appointments:
+            self._store(patient, appointment, sort=False)
+        for series in patient.recurring:
+            self.add_series(patient, series)
+
+    def sync_patient(self, patient: Patient) -> None:
+        known = len(self._by_patient.get(patient.patient_id, ()))
+        for appointment in islice(patient.appointments, known, None):
+            self.add(patient, appointment)
+        known = len(self._series_by_patient.get(patient.patient_id, ()))
+        for series in islice(patient.recurring, known, None):
+            self.add_series(patient, series)
+
+    def add(self, patient: Patient, appointment: Appointment) -> None:
+        self._store(patient, appointment, sort=True)
+
+    def add_series(self, patient: Patient, series: RecurringAppointment) -> None:
+        self._series.append((patient.patient_id, patient.full_name, series))
+        self._series_by_patient.setdefault(patient.patient_id, []).append(series)
+
+    def agenda(self, start: datetime, end: datetime) -> List[AgendaEntry]:
+        first = bisect_left(self._slots, (start,))
+        last = bisect_left(self._slots, (end,), lo=first)
+        entries = [self._entries[sequence] for _, _, sequence in self._slots[first:last]]
+        if not self._series:
+            return entries
+        expansions = [
+            _series_entries(patient_id, full_name, series, start, end)
+            for patient_id, full_name, series in self._series
+        ]
+        return list(heapq.merge(entries, *expansions, key=_agenda_order))
+
+    def for_patient(
+        self,
+        patient_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        series_from: Optional[datetime] = None,
+    ) -> List[Appointment]:
+        slots = self._by_patient.get(patient_id, [])
+        first = bisect_left(slots, (start,)) if start is not None else 0
+        last = bisect_left(slots, (end,), lo=first) if end is not None else len(slots)
+        appointments = [appointment for _, _, appointment in slots[first:last]]
+        series = self._series_by_patient.get(patient_id)
+        if not series:
+            return appointments
+        if series_from is not None:
+            start = max(start, series_from) if start is not None else series_from
+        expansions = [
+            _series_appointments(
+                item, start, end if end is not None else (start or item.starts_at) + SERIES_HORIZON
+            )
+            for item in series
+        ]
+        return list(heapq.merge(appointments, *expansions, key=attrgetter("scheduled_at")))
+
+    def next_for_patient(self, patient_id: str, after: datetime) -> Optional[Appointment]:
+        slots = self._by_patient.get(patient_id, [])
+        position = bisect_left(slots, (after,))
+        candidates = [slots[position][2]] if position < len(slots) else []
+        for series in self._series_by_patient.get(patient_id, []):
+            moment = series.next_after(after)
+            if moment is not None:
+                candidates.append(Appointment(scheduled_at=moment, note=series.note))
+        return min(candidates, key=attrgetter("scheduled_at"), default=None)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _store(self, patient: Patient, appointment: Appointment, sort: bool) -> None:
+        sequence = self._sequence
+        self._sequence += 1
+        self._entries[sequence] = AgendaEntry(
+            scheduled_at=appointment.scheduled_at,
+            patient_id=patient.patient_id,
+            full_name=patient.full_name,
+            note=appointment.note,
+        )
+        slot = (appointment.scheduled_at, patient.patient_id, sequence)
+        patient_slot = (appointment.scheduled_at, sequence, appointment)
+        patient_slots = self._by_patient.setdefault(patient.patient_id, [])
+        if sort:
+            insort(self._slots, slot)
+            insort(patient_slots, patient_slot)
+        else:
+            self._slots.append(slot)
+            patient_slots.append(patient_slot)
+
+
+def _agenda_order(entry: AgendaEntry) -> Tuple[datetime, str]:
+    return entry.scheduled_at, entry.patient_id
+
+
+def _series_entries(
+    patient_id: str,
+    full_name: str,
+    series: RecurringAppointment,
+    start: datetime,
+    end: datetime,
+) -> Iterator[AgendaEntry]:
+    for moment in series.occurrences(start, end):
+        yield AgendaEntry(
+            scheduled_at=moment, patient_id=patient_id, full_name=full_name, note=series.note
+        )
+
+
+def _series_appointments(
+    series: RecurringAppointment, start: Optional[datetime], end: datetime
+) -> Iterator[Appointment]:
+    for moment in series.occurrences(start, end):
+        yield Appointment(scheduled_at=moment, note=series.note)
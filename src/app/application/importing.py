@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+    build_register_request,
+)
+from app.domain.recurrence import RecurrenceRule
+
+ImportRequest = Union[RegisterPatientRequest, AddVisitRequest, ScheduleAppointmentRequest]
+RawRecord = Union[dict, str]
+
+LIST_SEPARATOR = ";"
+ParsedRow = Tuple[int, Union[List[ImportRequest], "ImportReject"]]
+
+CSV_COLUMNS = (
+    "type",
+    "patient_id",
+    "full_name",
+    "phone",
+    "age",
+    "gender",
+    "note",
+    "created_at",
+    "scheduled_at",
+    "starts_at",
+    "frequency",
+    "interval",
+    "weekdays",
+    "until",
+    "count",
+    "exceptions",
+)
+
+
+@dataclass(frozen=True)
+class ImportReject:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    accepted: int = 0
+    rejected: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    rejects: List[ImportReject] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        total = self.accepted + self.rejected
+        if self.elapsed_seconds <= 0:
+            return float(total)
+        return total / self.elapsed_seconds
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Tuple[int, RawRecord]]:
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def read_csv(stream: TextIO) -> Iterator[Tuple[int, dict]]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {key: value for key, value in row.items() if value not in (None, "")}
+
+
+def parse_records(records: Iterable[Tuple[int, RawRecord]]) -> Iterator[ParsedRow]:
+    for line_number, record in records:
+        try:
+            requests = _requests_from_record(_decode(record))
+        except (KeyError, TypeError, ValueError) as exc:
+            yield line_number, ImportReject(line_number, _describe(exc))
+            continue
+        yield line_number, requests
+
+
+class BulkImporter:
+    def __init__(
+        self,
+        service: PatientService,
+        batch_size: int = 1000,
+        on_reject: Optional[Callable[[ImportReject], None]] = None,
+        keep_rejects: int = 1000,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Parti boyutu en az 1 olmalı.")
+        self._service = service
+        self._batch_size = batch_size
+        self._on_reject = on_reject
+        self._keep_rejects = keep_rejects
+
+    def run(self, rows: Iterable[ParsedRow]) -> ImportReport:
+        report = ImportReport()
+        started = time.perf_counter()
+        iterator = iter(rows)
+        while True:
+            batch = list(islice(iterator, self._batch_size))
+            if not batch:
+                break
+            with self._service.transaction():
+                for line_number, item in batch:
+                    if isinstance(item, ImportReject):
+                        self._reject(report, item)
+                        continue
+                    try:
+                        with self._service.transaction():
+                            for request in item:
+                                self._apply(request)
+                    except ValueError as exc:
+                        self._reject(report, ImportReject(line_number, str(exc)))
+                        continue
+                    report.accepted += 1
+            report.batches += 1
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def _apply(self, request: ImportRequest) -> None:
+        if isinstance(request, RegisterPatientRequest):
+            self._service.register_patient(request)
+        elif isinstance(request, AddVisitRequest):
+            self._service.add_visit(request)
+        else:
+            self._service.schedule_appointment(request)
+
+    def _reject(self, report: ImportReport, reject: ImportReject) -> None:
+        report.rejected += 1
+        if len(report.rejects) < self._keep_rejects:
+            report.rejects.append(reject)
+        if self._on_reject is not None:
+            self._on_reject(reject)
+
+
+def _decode(record: RawRecord) -> dict:
+    if isinstance(record, str):
+        try:
+            record = json.loads(record)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Geçersiz JSON: {exc.msg}") from None
+    if not isinstance(record, dict):
+        raise ValueError("Kayıt bir JSON nesnesi olmalı.")
+    return record
+
+
+def _requests_from_record(record: dict) -> List[ImportRequest]:
+    record_type = record.get("type") or "patient"
+    patient_id = str(record["patient_id"]).strip()
+    if not patient_id:
+        raise ValueError("Hasta numarası boş olamaz.")
+    if record_type == "visit":
+        return [_visit_request(patient_id, record)]
+    if record_type == "appointment":
+        return [_appointment_request(patient_id, record)]
+    if record_type == "series":
+        return [_series_request(patient_id, record)]
+    if record_type != "patient":
+        raise ValueError(f"Bilinmeyen kayıt türü: {record_type}")
+    requests: List[ImportRequest] = [
+        build_register_request(
+            patient_id,
+            str(record["full_name"]).strip(),
+            str(record.get("phone", "")).strip(),
+            str(record.get("age", "")).strip(),
+            str(record.get("gender", "")).strip(),
+        )
+    ]
+    requests.extend(_visit_request(patient_id, item) for item in _nested(record, "visits"))
+    requests.extend(
+        _appointment_request(patient_id, item) for item in _nested(record, "appointments")
+    )
+    requests.extend(_series_request(patient_id, item) for item in _nested(record, "recurring"))
+    return requests
+
+
+def _visit_request(patient_id: str, record: dict) -> AddVisitRequest:
+    created_at = record.get("created_at")
+    return AddVisitRequest(
+        patient_id=patient_id,
+        note=str(record.get("note", "")),
+        created_at=_parse_datetime(created_at) if created_at else None,
+    )
+
+
+def _appointment_request(patient_id: str, record: dict) -> ScheduleAppointmentRequest:
+    return ScheduleAppointmentRequest(
+        patient_id=patient_id,
+        scheduled_at=_parse_datetime(record["scheduled_at"]),
+        note=str(record.get("note", "")),
+    )
+
+
+def _series_request(patient_id: str, record: dict) -> ScheduleAppointmentRequest:
+    until = record.get("until")
+    interval = record.get("interval")
+    excluded_days = _list_field(record, "exceptions")
+    try:
+        exceptions = frozenset(date.fromisoformat(str(day).strip()) for day in excluded_days)
+    except ValueError:
+        raise ValueError("Tarih formatı geçersiz.") from None
+    rule = RecurrenceRule(
+        frequency=str(record.get("frequency", "")),
+        interval=_int_field(interval, "interval") if interval is not None else 1,
+        weekdays=frozenset(_int_field(day, "weekdays") for day in _list_field(record, "weekdays")),
+        until=_parse_datetime(until) if until else None,
+        count=_int_field(record["count"], "count") if record.get("count") is not None else None,
+        exceptions=exceptions,
+    )
+    return ScheduleAppointmentRequest(
+        patient_id=patient_id,
+        scheduled_at=_parse_datetime(record["starts_at"]),
+        note=str(record.get("note", "")),
+        recurrence=rule,
+    )
+
+
+def _nested(record: dict, name: str) -> List[dict]:
+    items = record.get(name) or []
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"'{name}' alanı JSON nesnelerinden oluşan bir liste olmalı.")
+    return items
+
+
+def _list_field(record: dict, name: str) -> List[str]:
+    value = record.get(name) or []
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(LIST_SEPARATOR) if part.strip()]
+    if not isinstance(value, list):
+        raise ValueError(f"'{name}' alanı liste olmalı.")
+    return value
+
+
+def _int_field(value: object, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"'{name}' alanı tam sayı olmalı.")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' alanı tam sayı olmalı.") from None
+
+
+def _parse_datetime(value: str) -> datetime:
+    try:
+        moment = datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        raise ValueError("Tarih formatı geçersiz.") from None
+    if moment.tzinfo is not None:
+        raise ValueError("Tarih saat dilimi içermemeli.")
+    return moment
+
+
+def _describe(exc: Exception) -> str:
+    if isinstance(exc, KeyError):
+        return f"Eksik alan: {exc.args[0]}"
+    if isinstance(exc, TypeError):
+        return "Alan türü geçersiz."
+    return str(exc)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import heapq
+import math
+import re
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from app.domain.entities import Patient
+from app.domain.text import turkish_casefold
+
+_TOKEN = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"')
+_K1 = 1.2
+_B = 0.75
+
+
+@dataclass(frozen=True)
+class NoteHit:
+    patient_id: str
+    full_name: str
+    created_at: datetime
+    note: str
+    score: float
+
+
+class NoteMatch(NamedTuple):
+    patient_id: str
+    position: int
+    score: float
+
+
+class NoteQuery(NamedTuple):
+    terms: Tuple[str, ...]
+    phrases: Tuple[Tuple[str, ...], ...]
+
+
+class VisitNoteIndex:
+    def __init__(self, patients: Iterable[Patient] = ()) -> None:
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._impacts: Dict[str, Dict[Tuple[int, int], array]] = {}
+        self._max_frequency: Dict[str, int] = {}
+        self._owners: List[str] = []
+        self._visit_counts: Dict[str, int] = {}
+        self._positions = array("I")
+        self._total_length = 0
+        for patient in patients:
+            self.add_patient(patient)
+
+    def add_patient(self, patient: Patient) -> None:
+        known = self._visit_counts.get(patient.patient_id, 0)
+        for position, visit in enumerate(islice(patient.visits, known, None), known):
+            self.add(patient.patient_id, position, visit.note)
+
+    def add(self, patient_id: str, position: int, note: str) -> None:
+        document = len(self._owners)
+        tokens = tokenize(note)
+        masks: Dict[str, int] = {}
+        for offset, token in enumerate(tokens):
+            masks[token] = masks.get(token, 0) | 1 << offset
+        for token, mask in masks.items():
+            token = sys.intern(token)
+            self._postings.setdefault(token, {})[document] = mask
+            frequency = mask.bit_count()
+            impact = (len(tokens), frequency)
+            self._impacts.setdefault(token, {}).setdefault(impact, array("I")).append(document)
+            if frequency > self._max_frequency.get(token, 0):
+                self._max_frequency[token] = frequency
+        self._owners.append(patient_id)
+        self._visit_counts[patient_id] = self._visit_counts.get(patient_id, 0) + 1
+        self._positions.append(position)
+        self._total_length += len(tokens)
+
+    def search(self, query: str, limit: int = 50) -> List[NoteMatch]:
+        parsed = parse_query(query)
+        if not parsed.terms or limit <= 0:
+            return []
+        if any(not self._postings.get(term) for term in parsed.terms):
+            return []
+        terms = sorted(parsed.terms, key=lambda term: len(self._postings[term]))
+        rest = [self._postings[term] for term in terms[1:]]
+        weights = [
+            (self._postings[term], self._idf(len(self._postings[term])) * (_K1 + 1))
+            for term in terms
+        ]
+        scale = _K1 * _B * len(self._owners) / self._total_length
+        base = _K1 * (1 - _B)
+        blocks = []
+        for (length, frequency), documents in self._impacts[terms[0]].items():
+            norm = base + scale * length
+            bound = weights[0][1] * frequency / (frequency + norm)
+            for term, (_, weight) in zip(terms[1:], weights[1:]):
+                most = min(self._max_frequency[term], length - frequency)
+                bound += weight * most / (most + norm)
+            blocks.append((bound, norm, documents))
+        blocks.sort(key=itemgetter(0), reverse=True)
+        top: List[Tuple[float, int, int]] = []
+        for bound, norm, documents in blocks:
+            if len(top) == limit and bound < top[0][0]:
+                break
+            for document in documents:
+                if len(top) == limit and (bound, -document) < top[0][:2]:
+                    break
+                if not all(document in posting for posting in rest):
+                    continue
+                if parsed.phrases and not all(
+                    self._contains_phrase(document, phrase) for phrase in parsed.phrases
+                ):
+                    continue
+                score = 0.0
+                for posting, weight in weights:
+                    frequency = posting[document].bit_count()
+                    score += weight * frequency / (frequency + norm)
+                entry = (score, -document, document)
+                if len(top) < limit:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+        return [
+            NoteMatch(self._owners[document], self._positions[document], score)
+            for score, _, document in sorted(top, reverse=True)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def _contains_phrase(self, document: int, phrase: Tuple[str, ...]) -> bool:
+        starts = -1
+        for shift, token in enumerate(phrase):
+            starts &= self._postings[token][document] >> shift
+        return starts != 0
+
+    def _idf(self, frequency: int) -> float:
+        return math.log(1 + (len(self._owners) - frequency + 0.5) / (frequency + 0.5))
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(turkish_casefold(text).replace("ı", "i"))
+
+
+def parse_query(query: str) -> NoteQuery:
+    phrases = tuple(
+        tuple(tokens) for tokens in map(tokenize, _PHRASE.findall(query)) if len(tokens) > 1
+    )
+    terms = tuple(dict.fromkeys(tokenize(query.replace('"', " "))))
+    return NoteQuery(terms, phrases)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from app.domain.entities import Patient
+from app.domain.text import turkish_casefold, turkish_sort_key
+
+_GRAM_SIZE = 3
+_PHONE_PREFIX = "#"
+_PHONE_CHARS = frozenset("0123456789 -()+")
+
+
+class PatientSearchIndex:
+    def __init__(self, patients: Iterable[Patient] = ()) -> None:
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._fields: Dict[str, Tuple[Tuple[str, ...], str]] = {}
+        self._sort_keys: Dict[str, Tuple[str, str]] = {}
+        for patient in patients:
+            self.add(patient)
+
+    def add(self, patient: Patient) -> None:
+        if patient.patient_id in self._fields:
+            self.remove(patient.patient_id)
+        texts = (_fold(patient.full_name), _fold(patient.patient_id))
+        phone = _digits(patient.phone)
+        self._fields[patient.patient_id] = (texts, phone)
+        self._sort_keys[patient.patient_id] = (turkish_sort_key(patient.full_name), patient.patient_id)
+        for gram in self._grams_of(texts, phone):
+            self._postings[gram].add(patient.patient_id)
+
+    def remove(self, patient_id: str) -> None:
+        fields = self._fields.pop(patient_id, None)
+        if fields is None:
+            return
+        self._sort_keys.pop(patient_id, None)
+        for gram in self._grams_of(*fields):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(patient_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str, limit: int = 50) -> List[str]:
+        folded = _fold(query.strip())
+        if not folded:
+            return []
+        matches = self._candidates(_grams(folded), folded, self._text_matches)
+        digits = _digits(folded)
+        if digits and _PHONE_CHARS.issuperset(folded):
+            phone_grams = {_PHONE_PREFIX + gram for gram in _grams(digits)}
+            matches |= self._candidates(phone_grams, digits, self._phone_matches)
+        return heapq.nsmallest(
+            limit, matches, key=lambda patient_id: self._rank(patient_id, folded)
+        )
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _candidates(
+        self, grams: Set[str], needle: str, verify: Callable[[str, str], bool]
+    ) -> Set[str]:
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        return {patient_id for patient_id in candidates if verify(patient_id, needle)}
+
+    def _text_matches(self, patient_id: str, needle: str) -> bool:
+        texts, _ = self._fields[patient_id]
+        return any(needle in text for text in texts)
+
+    def _phone_matches(self, patient_id: str, needle: str) -> bool:
+        _, phone = self._fields[patient_id]
+        return needle in phone
+
+    def _rank(self, patient_id: str, folded: str) -> Tuple[int, Tuple[str, str]]:
+        texts, _ = self._fields[patient_id]
+        prefix = any(word.startswith(folded) for text in texts for word in text.split())
+        return (0 if prefix else 1, self._sort_keys[patient_id])
+
+    @staticmethod
+    def _grams_of(texts: Tuple[str, ...], phone: str) -> Set[str]:
+        grams: Set[str] = set()
+        for text in texts:
+            grams.update(_all_grams(text))
+        grams.update(_PHONE_PREFIX + gram for gram in _all_grams(phone))
+        return grams
+
+
+def _fold(text: str) -> str:
+    return turkish_casefold(text).replace("ı", "i")
+
+
+def _digits(text: str) -> str:
+    return "".join(char for char in text if char.isdigit())
+
+
+def _grams(text: str) -> Set[str]:
+    size = min(_GRAM_SIZE, len(text))
+    return {text[start:start + size] for start in range(len(text) - size + 1)}
+
+
+def _all_grams(text: str) -> Set[str]:
+    grams: Set[str] = set()
+    for size in range(1, _GRAM_SIZE + 1):
+        grams.update(text[start:start + size] for start in range(len(text) - size + 1))
+    return grams
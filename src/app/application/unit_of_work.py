@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from app.domain.entities import Patient
+from app.domain.repositories import PatientRepository
+
+Counts = Tuple[int, int, int]
+
+
+class _Savepoint:
+    __slots__ = ("new_count", "touched_count", "counts")
+
+    def __init__(self, new_count: int, touched_count: int) -> None:
+        self.new_count = new_count
+        self.touched_count = touched_count
+        self.counts: Dict[str, Counts] = {}
+
+
+class UnitOfWork:
+    def __init__(self, repository: PatientRepository) -> None:
+        self._repository = repository
+        self._new: Dict[str, Patient] = {}
+        self._touched: Dict[str, Tuple[Patient, int, int, int]] = {}
+        self._savepoints: List[_Savepoint] = []
+
+    @property
+    def new_patients(self) -> List[Patient]:
+        return list(self._new.values())
+
+    @property
+    def changed_patients(self) -> List[Patient]:
+        return [*self._new.values(), *(touched[0] for touched in self._touched.values())]
+
+    def get(self, patient_id: str) -> Optional[Patient]:
+        if patient_id in self._new:
+            return self._new[patient_id]
+        if patient_id in self._touched:
+            return self._touched[patient_id][0]
+        return self._repository.get(patient_id)
+
+    def register(self, patient: Patient) -> None:
+        self._new[patient.patient_id] = patient
+
+    def get_for_update(self, patient_id: str) -> Optional[Patient]:
+        patient = self.get(patient_id)
+        if patient is None:
+            return None
+        if patient_id in self._new or patient_id in self._touched:
+            if self._savepoints:
+                self._savepoints[-1].counts.setdefault(patient_id, _counts(patient))
+            return patient
+        working = _working_copy(patient)
+        self._touched[patient_id] = (working, *_counts(patient))
+        return working
+
+    def savepoint(self) -> None:
+        self._savepoints.append(_Savepoint(len(self._new), len(self._touched)))
+
+    def release_savepoint(self) -> None:
+        savepoint = self._savepoints.pop()
+        if self._savepoints:
+            outer = self._savepoints[-1].counts
+            for patient_id, counts in savepoint.counts.items():
+                outer.setdefault(patient_id, counts)
+
+    def rollback_to_savepoint(self) -> None:
+        savepoint = self._savepoints.pop()
+        for patient_id, counts in savepoint.counts.items():
+            patient = self.get(patient_id)
+            assert patient is not None
+            _truncate(patient, counts)
+        for patient_id in list(self._touched)[savepoint.touched_count:]:
+            del self._touched[patient_id]
+        for patient_id in list(self._new)[savepoint.new_count:]:
+            del self._new[patient_id]
+
+    def commit(self) -> None:
+        if not self._new and not self._touched:
+            return
+        if self._repository.supports_batching:
+            with self._repository.batch():
+                self._write()
+        else:
+            self._write()
+
+    def rollback(self) -> None:
+        self._new.clear()
+        self._touched.clear()
+        self._savepoints.clear()
+
+    def _write(self) -> None:
+        for patient in self._new.values():
+            self._repository.add(patient)
+        for touched in self._touched.values():
+            self._repository.save(touched[0])
+
+
+def _counts(patient: Patient) -> Counts:
+    return len(patient.visits), len(patient.appointments), len(patient.recurring)
+
+
+def _working_copy(patient: Patient) -> Patient:
+    return replace(
+        patient,
+        visits=copy(patient.visits),
+        appointments=copy(patient.appointments),
+        recurring=copy(patient.recurring),
+    )
+
+
+def _truncate(patient: Patient, counts: Counts) -> None:
+    visit_count, appointment_count, series_count = counts
+    del patient.visits[visit_count:]
+    del patient.appointments[appointment_count:]
+    del patient.recurring[series_count:]
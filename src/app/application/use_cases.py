@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Iterable
+from datetime import datetime, time
+from typing import Iterable, Iterator, List, Optional, Tuple
 
-from app.domain.entities import Patient
+from app.application.attribute_index import PatientAttributeIndex, PatientQuery, QueryPlan
+from app.application.calendar_index import AgendaEntry, AppointmentCalendar
+from app.application.note_index import NoteHit, VisitNoteIndex
+from app.application.search_index import PatientSearchIndex
+from app.application.unit_of_work import UnitOfWork
+from app.domain.entities import Appointment, Patient
+from app.domain.paging import PageCursor, PatientPage
+from app.domain.recurrence import DAILY, MONTHLY, WEEKLY, RecurrenceRule
 from app.domain.repositories import PatientRepository
 
+PAGE_SIZE = 50
+NOTE_SEARCH_LIMIT = 50
+RECURRENCE_CHOICES = {"g": DAILY, "h": WEEKLY, "a": MONTHLY}
+
 
 @dataclass
 class RegisterPatientRequest:
@@ -21,6 +34,7 @@ class RegisterPatientRequest:
 class AddVisitRequest:
     patient_id: str
     note: str
+    created_at: Optional[datetime] = None
 
 
 @dataclass
@@ -28,41 +42,301 @@ class ScheduleAppointmentRequest:
     patient_id: str
     scheduled_at: datetime
     note: str
+    recurrence: Optional[RecurrenceRule] = None
+
+
+def build_register_request(
+    patient_id: str,
+    full_name: str,
+    phone: str,
+    age: str,
+    gender: str,
+) -> RegisterPatientRequest:
+    if not age.isdigit():
+        raise ValueError("Yaş sayısal olmalı.")
+    return RegisterPatientRequest(
+        patient_id=patient_id,
+        full_name=full_name,
+        phone=phone,
+        age=int(age),
+        gender=gender or "Belirtilmedi",
+    )
+
+
+def build_recurrence_rule(
+    frequency: str,
+    interval: str = "",
+    weekdays: str = "",
+    count: str = "",
+    until: str = "",
+    exceptions: str = "",
+) -> Optional[RecurrenceRule]:
+    choice = frequency.strip().lower()
+    if not choice:
+        return None
+    if choice not in RECURRENCE_CHOICES:
+        raise ValueError("Tekrar seçimi g, h veya a olmalı.")
+    interval, count, until = interval.strip(), count.strip(), until.strip()
+    if not all(text.isdigit() for text in (interval, count) if text):
+        raise ValueError("Tekrar aralığı ve sayısı sayısal olmalı.")
+    try:
+        days = frozenset(int(part) - 1 for part in _split_list(weekdays))
+        until_day = datetime.strptime(until, "%Y-%m-%d").date() if until else None
+        skipped = frozenset(
+            datetime.strptime(part, "%Y-%m-%d").date() for part in _split_list(exceptions)
+        )
+    except ValueError:
+        raise ValueError("Tekrar günleri veya tarihleri geçersiz.") from None
+    if any(day not in range(7) for day in days):
+        raise ValueError("Günler 1 (Pazartesi) ile 7 (Pazar) arasında olmalı.")
+    return RecurrenceRule(
+        frequency=RECURRENCE_CHOICES[choice],
+        interval=int(interval) if interval else 1,
+        weekdays=days,
+        until=datetime.combine(until_day, time.max) if until_day is not None else None,
+        count=int(count) if count else None,
+        exceptions=skipped,
+    )
+
+
+def _split_list(text: str) -> List[str]:
+    return [part.strip() for part in text.split(",") if part.strip()]
 
 
 class PatientService:
     def __init__(self, repository: PatientRepository) -> None:
         self._repository = repository
+        self._search_index: Optional[PatientSearchIndex] = None
+        self._calendar: Optional[AppointmentCalendar] = None
+        self._attributes: Optional[PatientAttributeIndex] = None
+        self._notes: Optional[VisitNoteIndex] = None
+        self._index_lock = threading.RLock()
+        self._generation: Optional[int] = None
+        self._local = threading.local()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        active = self._active_work()
+        if active is not None:
+            active.savepoint()
+            try:
+                yield
+            except BaseException:
+                active.rollback_to_savepoint()
+                raise
+            active.release_savepoint()
+            return
+        work = UnitOfWork(self._repository)
+        with self._index_lock:
+            indexes = (self._search_index, self._calendar, self._attributes, self._notes)
+        self._local.work = work
+        try:
+            with self._repository.for_update():
+                yield
+                work.commit()
+        except BaseException:
+            work.rollback()
+            self._reconcile_indexes(indexes, None)
+            raise
+        finally:
+            self._local.work = None
+        self._reconcile_indexes(indexes, work)
 
     def register_patient(self, request: RegisterPatientRequest) -> Patient:
-        existing = self._repository.get(request.patient_id)
-        if existing is not None:
-            raise ValueError("Bu hasta numarası zaten kayıtlı.")
-        patient = Patient(
-            patient_id=request.patient_id,
-            full_name=request.full_name,
-            phone=request.phone,
-            age=request.age,
-            gender=request.gender,
-        )
-        self._repository.add(patient)
+        with self.transaction():
+            work = self._require_work()
+            if work.get(request.patient_id) is not None:
+                raise ValueError("Bu hasta numarası zaten kayıtlı.")
+            patient = Patient(
+                patient_id=request.patient_id,
+                full_name=request.full_name,
+                phone=request.phone,
+                age=request.age,
+                gender=request.gender,
+            )
+            work.register(patient)
         return patient
 
     def list_patients(self) -> Iterable[Patient]:
         return self._repository.list_all()
 
+    def list_patients_page(
+        self, after: Optional[PageCursor] = None, limit: int = PAGE_SIZE
+    ) -> PatientPage:
+        if limit <= 0:
+            raise ValueError("Sayfa boyutu pozitif olmalı.")
+        return self._repository.list_page(after, limit)
+
+    def get_patient(self, patient_id: str) -> Optional[Patient]:
+        return self._repository.get(patient_id)
+
+    def search(self, query: str, limit: int = 50) -> List[Patient]:
+        with self._index_lock:
+            patient_ids = self._get_search_index().search(query, limit)
+        matches = [self._repository.get(patient_id) for patient_id in patient_ids]
+        return [patient for patient in matches if patient is not None]
+
+    def search_notes(self, query: str, limit: int = NOTE_SEARCH_LIMIT) -> List[NoteHit]:
+        with self._index_lock:
+            matches = self._get_notes().search(query, limit)
+        hits = []
+        for match in matches:
+            patient = self._repository.get(match.patient_id)
+            if patient is None or match.position >= len(patient.visits):
+                continue
+            visit = patient.visits[match.position]
+            hits.append(
+                NoteHit(
+                    patient_id=patient.patient_id,
+                    full_name=patient.full_name,
+                    created_at=visit.created_at,
+                    note=visit.note,
+                    score=match.score,
+                )
+            )
+        return hits
+
     def add_visit(self, request: AddVisitRequest) -> Patient:
-        patient = self._repository.get(request.patient_id)
-        if patient is None:
-            raise ValueError("Hasta bulunamadı.")
-        patient.add_visit(note=request.note, created_at=datetime.utcnow())
-        self._repository.save(patient)
+        with self.transaction():
+            patient = self._get_for_update(request.patient_id)
+            patient.add_visit(note=request.note, created_at=request.created_at or datetime.utcnow())
         return patient
 
     def schedule_appointment(self, request: ScheduleAppointmentRequest) -> Patient:
-        patient = self._repository.get(request.patient_id)
+        with self.transaction():
+            patient = self._get_for_update(request.patient_id)
+            if request.recurrence is not None:
+                patient.add_recurring_appointment(
+                    starts_at=request.scheduled_at, note=request.note, rule=request.recurrence
+                )
+            else:
+                patient.add_appointment(scheduled_at=request.scheduled_at, note=request.note)
+        return patient
+
+    def query(self, spec: PatientQuery, limit: Optional[int] = None) -> List[Patient]:
+        return self._run_query(spec, limit)[0]
+
+    def query_with_plan(
+        self, spec: PatientQuery, limit: Optional[int] = None
+    ) -> Tuple[List[Patient], QueryPlan]:
+        return self._run_query(spec, limit)
+
+    def explain_query(self, spec: PatientQuery) -> QueryPlan:
+        with self._index_lock:
+            _, plan = self._get_attributes().query(spec)
+        return plan
+
+    def agenda(self, start: datetime, end: datetime) -> List[AgendaEntry]:
+        with self._index_lock:
+            return self._get_calendar().agenda(start, end)
+
+    def patient_appointments(
+        self,
+        patient_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        series_from: Optional[datetime] = None,
+    ) -> List[Appointment]:
+        with self._index_lock:
+            return self._get_calendar().for_patient(patient_id, start, end, series_from)
+
+    def next_appointment(self, patient_id: str, after: datetime) -> Optional[Appointment]:
+        with self._index_lock:
+            return self._get_calendar().next_for_patient(patient_id, after)
+
+    def _active_work(self) -> Optional[UnitOfWork]:
+        return getattr(self._local, "work", None)
+
+    def _require_work(self) -> UnitOfWork:
+        work = self._active_work()
+        assert work is not None
+        return work
+
+    def _get_for_update(self, patient_id: str) -> Patient:
+        patient = self._require_work().get_for_update(patient_id)
         if patient is None:
             raise ValueError("Hasta bulunamadı.")
-        patient.add_appointment(scheduled_at=request.scheduled_at, note=request.note)
-        self._repository.save(patient)
         return patient
+
+    def _run_query(
+        self, spec: PatientQuery, limit: Optional[int]
+    ) -> Tuple[List[Patient], QueryPlan]:
+        with self._index_lock:
+            patient_ids, plan = self._get_attributes().query(spec)
+        matches = [self._repository.get(patient_id) for patient_id in patient_ids[:limit]]
+        return [patient for patient in matches if patient is not None], plan
+
+    def _reconcile_indexes(
+        self,
+        indexes: Tuple[
+            Optional[PatientSearchIndex],
+            Optional[AppointmentCalendar],
+            Optional[PatientAttributeIndex],
+            Optional[VisitNoteIndex],
+        ],
+        work: Optional[UnitOfWork],
+    ) -> None:
+        search_index, calendar, attributes, notes = indexes
+        with self._index_lock:
+            if self._search_index is not search_index:
+                self._search_index = None
+            if self._calendar is not calendar:
+                self._calendar = None
+            if self._attributes is not attributes:
+                self._attributes = None
+            if self._notes is not notes:
+                self._notes = None
+            if work is not None:
+                self._sync_indexes(work.changed_patients, work.new_patients)
+
+    def _sync_indexes(self, changed: List[Patient], registered: List[Patient]) -> None:
+        if self._search_index is not None:
+            for patient in registered:
+                self._search_index.add(patient)
+        for patient in changed:
+            if self._attributes is not None:
+                self._attributes.add(patient)
+            if self._calendar is not None:
+                self._calendar.sync_patient(patient)
+            if self._notes is not None:
+                self._notes.add_patient(patient)
+
+    def _check_generation(self) -> None:
+        if self._generation is None:
+            self._generation = self._repository.generation
+            return
+        generation, changed = self._repository.changes_since(self._generation)
+        if generation == self._generation:
+            return
+        self._generation = generation
+        if changed is not None:
+            self._sync_indexes(changed, changed)
+            return
+        self._search_index = None
+        self._calendar = None
+        self._attributes = None
+        self._notes = None
+
+    def _get_search_index(self) -> PatientSearchIndex:
+        self._check_generation()
+        if self._search_index is None:
+            self._search_index = self._repository.load_index("search", PatientSearchIndex)
+        return self._search_index
+
+    def _get_attributes(self) -> PatientAttributeIndex:
+        self._check_generation()
+        if self._attributes is None:
+            self._attributes = self._repository.load_index("attributes", PatientAttributeIndex)
+        return self._attributes
+
+    def _get_notes(self) -> VisitNoteIndex:
+        self._check_generation()
+        if self._notes is None:
+            self._notes = self._repository.load_index("notes", VisitNoteIndex)
+        return self._notes
+
+    def _get_calendar(self) -> AppointmentCalendar:
+        self._check_generation()
+        if self._calendar is None:
+            self._calendar = self._repository.load_index("calendar", AppointmentCalendar)
+        return self._calendar
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import List, Optional
+
+from app.application.importing import BulkImporter, ImportReject, parse_records, read_csv, read_jsonl
+from app.application.use_cases import PatientService
+from app.config import get_storage_settings
+from app.infrastructure.factory import create_repository
+
+
+def main(argv: Optional[List[str]] = None, prog: str = "python -m app.bulk_import") -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Hasta, muayene ve randevu kayıtlarını CSV veya JSONL dosyasından toplu aktarır.",
+    )
+    parser.add_argument("source", help="Aktarılacak dosya; standart girdi için '-'")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Dosya biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Tek işlemde yazılacak kayıt sayısı")
+    args = parser.parse_args(argv)
+
+    data_format = args.format or _guess_format(args.source)
+    if data_format is None:
+        parser.error("Dosya biçimi anlaşılamadı, --format ile belirtin.")
+    if args.batch_size < 1:
+        parser.error("--batch-size en az 1 olmalı.")
+
+    repository = create_repository(get_storage_settings())
+    try:
+        importer = BulkImporter(PatientService(repository), args.batch_size, on_reject=_print_reject)
+        with _open_source(args.source) as stream:
+            records = read_csv(stream) if data_format == "csv" else read_jsonl(stream)
+            report = importer.run(parse_records(records))
+    finally:
+        repository.close()
+
+    print(
+        f"Aktarılan: {report.accepted}, reddedilen: {report.rejected}, "
+        f"süre: {report.elapsed_seconds:.2f} sn, hız: {report.rows_per_second:.0f} kayıt/sn"
+    )
+    return 1 if report.rejected else 0
+
+
+def _guess_format(source: str) -> Optional[str]:
+    suffix = Path(source).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return None
+
+
+def _open_source(source: str):
+    if source == "-":
+        return nullcontext(sys.stdin)
+    return open(source, "r", encoding="utf-8", newline="")
+
+
+def _print_reject(reject: ImportReject) -> None:
+    print(f"Satır {reject.line}: {reject.message}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
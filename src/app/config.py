@@ -1,7 +1,31 @@
 from __future__ import annotations
 
-from pathlib import Path
+import os
 import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class StorageSettings:
+    backend: str = "json"
+    journal: bool = False
+    fsync_policy: str = "always"
+    fsync_interval_ms: int = 1000
+    compact_threshold_bytes: int = 4 * 1024 * 1024
+    cache_size: int = 256
+    packed_records: bool = False
+    snapshot_format: str = "json"
+    write_behind_ms: int = 0
+    write_behind_max_dirty: int = 100
+    shared: bool = False
+    shared_poll_ms: int = 250
+
+
+@dataclass(frozen=True)
+class ProfilingSettings:
+    enabled: bool = False
+    slow_threshold_ms: float = 100.0
 
 
 def get_data_path() -> Path:
@@ -18,3 +42,51 @@ def get_credentials_path() -> Path:
     else:
         base_dir = Path.cwd()
     return base_dir / "data" / "credentials.json"
+
+
+def get_sqlite_path() -> Path:
+    return get_data_path().with_name("patients.db")
+
+
+def get_indexed_data_path() -> Path:
+    return get_data_path().with_name("patients.jsonl")
+
+
+def get_sharded_data_path() -> Path:
+    return get_data_path().with_name("patients")
+
+
+def get_binary_data_path() -> Path:
+    return get_data_path().with_name("patients.bin")
+
+
+def get_storage_settings() -> StorageSettings:
+    defaults = StorageSettings()
+    return StorageSettings(
+        backend=os.environ.get("HASTA_KAYIT_STORAGE", defaults.backend),
+        journal=os.environ.get("HASTA_KAYIT_JOURNAL", "0") == "1",
+        fsync_policy=os.environ.get("HASTA_KAYIT_FSYNC", defaults.fsync_policy),
+        fsync_interval_ms=int(
+            os.environ.get("HASTA_KAYIT_FSYNC_INTERVAL_MS", defaults.fsync_interval_ms)
+        ),
+        compact_threshold_bytes=int(
+            os.environ.get("HASTA_KAYIT_COMPACT_BYTES", defaults.compact_threshold_bytes)
+        ),
+        cache_size=int(os.environ.get("HASTA_KAYIT_CACHE_SIZE", defaults.cache_size)),
+        packed_records=os.environ.get("HASTA_KAYIT_PACKED", "0") == "1",
+        snapshot_format=os.environ.get("HASTA_KAYIT_SNAPSHOT", defaults.snapshot_format),
+        write_behind_ms=int(os.environ.get("HASTA_KAYIT_WRITE_BEHIND_MS", defaults.write_behind_ms)),
+        write_behind_max_dirty=int(
+            os.environ.get("HASTA_KAYIT_WRITE_BEHIND_MAX", defaults.write_behind_max_dirty)
+        ),
+        shared=os.environ.get("HASTA_KAYIT_SHARED", "0") == "1",
+        shared_poll_ms=int(os.environ.get("HASTA_KAYIT_SHARED_POLL_MS", defaults.shared_poll_ms)),
+    )
+
+
+def get_profiling_settings(force: bool = False) -> ProfilingSettings:
+    defaults = ProfilingSettings()
+    return ProfilingSettings(
+        enabled=force or os.environ.get("HASTA_KAYIT_PROFILE", "0") == "1",
+        slow_threshold_ms=float(os.environ.get("HASTA_KAYIT_SLOW_MS", defaults.slow_threshold_ms)),
+    )
@@ -1,34 +1,46 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import MutableSequence
 
+from app.domain.recurrence import RecurrenceRule, RecurringAppointment
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Visit:
     note: str
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Appointment:
     scheduled_at: datetime
     note: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Patient:
     patient_id: str
     full_name: str
     phone: str
     age: int
     gender: str
-    visits: List[Visit] = field(default_factory=list)
-    appointments: List[Appointment] = field(default_factory=list)
+    visits: MutableSequence[Visit] = field(default_factory=list)
+    appointments: MutableSequence[Appointment] = field(default_factory=list)
+    recurring: MutableSequence[RecurringAppointment] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.gender = sys.intern(self.gender)
 
     def add_visit(self, note: str, created_at: datetime) -> None:
         self.visits.append(Visit(note=note, created_at=created_at))
 
     def add_appointment(self, scheduled_at: datetime, note: str) -> None:
         self.appointments.append(Appointment(scheduled_at=scheduled_at, note=note))
+
+    def add_recurring_appointment(
+        self, starts_at: datetime, note: str, rule: RecurrenceRule
+    ) -> None:
+        self.recurring.append(RecurringAppointment(starts_at=starts_at, note=note, rule=rule))
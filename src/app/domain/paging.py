@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from app.domain.entities import Patient
+from app.domain.text import turkish_sort_key
+
+PageCursor = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class PatientPage:
+    patients: List[Patient]
+    next_cursor: Optional[PageCursor]
+    total_estimate: int
+
+
+def cursor_for(patient: Patient) -> PageCursor:
+    return (turkish_sort_key(patient.full_name), patient.patient_id)
+
+
+def next_cursor(keys: Sequence[PageCursor], limit: int) -> Optional[PageCursor]:
+    return keys[limit - 1] if len(keys) > limit else None
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from array import array
+from datetime import datetime, timedelta
+from typing import Generic, Iterable, Iterator, MutableSequence, Sequence, Tuple, TypeVar, overload
+
+from app.domain.entities import Appointment, Patient, Visit
+
+T = TypeVar("T")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(moment: datetime) -> int:
+    if moment.tzinfo is not None:
+        raise ValueError("Saat dilimli tarih sıkıştırılmış kayıtta saklanamaz.")
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class _PackedRecords(MutableSequence[T], Generic[T]):
+    __slots__ = ("_stamps", "_note_ends", "_notes")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._stamps = array("q")
+        self._note_ends = array("Q")
+        self._notes = bytearray()
+        self.extend(items)
+
+    @classmethod
+    def from_columns(cls, stamps: Iterable[int], notes: Iterable[bytes]):
+        records = cls()
+        records._stamps.extend(stamps)
+        for note in notes:
+            records._notes += note
+            records._note_ends.append(len(records._notes))
+        return records
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(position) for position in range(*index.indices(len(self)))]
+        return self._build(self._position(index))
+
+    def __setitem__(self, index, value) -> None:
+        items = list(self)
+        items[index] = value
+        self._reset(items)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice) and index.step in (None, 1):
+            start, stop, _ = index.indices(len(self))
+            if stop >= len(self):
+                self._truncate(start)
+                return
+        items = list(self)
+        del items[index]
+        self._reset(items)
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(len(self)):
+            yield self._build(position)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __copy__(self):
+        records = type(self)()
+        records._stamps = self._stamps[:]
+        records._note_ends = self._note_ends[:]
+        records._notes = self._notes[:]
+        return records
+
+    def insert(self, index: int, value: T) -> None:
+        if index >= len(self):
+            self.append(value)
+            return
+        items = list(self)
+        items.insert(index, value)
+        self._reset(items)
+
+    def append(self, value: T) -> None:
+        moment, note = self._unpack(value)
+        self._stamps.append(to_epoch_micros(moment))
+        self._notes += note.encode("utf-8")
+        self._note_ends.append(len(self._notes))
+
+    def extend(self, values: Iterable[T]) -> None:
+        for value in values:
+            self.append(value)
+
+    def payload_bytes(self) -> int:
+        return (
+            self._stamps.itemsize * len(self._stamps)
+            + self._note_ends.itemsize * len(self._note_ends)
+            + len(self._notes)
+        )
+
+    def _position(self, index: int) -> int:
+        position = index + len(self) if index < 0 else index
+        if not 0 <= position < len(self):
+            raise IndexError("kayıt dizini aralık dışında")
+        return position
+
+    def _moment(self, position: int) -> datetime:
+        return from_epoch_micros(self._stamps[position])
+
+    def _note(self, position: int) -> str:
+        start = self._note_ends[position - 1] if position else 0
+        return self._notes[start:self._note_ends[position]].decode("utf-8")
+
+    def _truncate(self, length: int) -> None:
+        del self._stamps[length:]
+        del self._note_ends[length:]
+        del self._notes[self._note_ends[-1] if self._note_ends else 0:]
+
+    def _reset(self, items: Iterable[T]) -> None:
+        self._truncate(0)
+        self.extend(items)
+
+    @abstractmethod
+    def _build(self, position: int) -> T:
+        ...
+
+    @abstractmethod
+    def _unpack(self, value: T) -> Tuple[datetime, str]:
+        ...
+
+
+class PackedVisits(_PackedRecords[Visit]):
+    __slots__ = ()
+
+    def _build(self, position: int) -> Visit:
+        return Visit(note=self._note(position), created_at=self._moment(position))
+
+    def _unpack(self, value: Visit) -> Tuple[datetime, str]:
+        return value.created_at, value.note
+
+
+class PackedAppointments(_PackedRecords[Appointment]):
+    __slots__ = ()
+
+    def _build(self, position: int) -> Appointment:
+        return Appointment(scheduled_at=self._moment(position), note=self._note(position))
+
+    def _unpack(self, value: Appointment) -> Tuple[datetime, str]:
+        return value.scheduled_at, value.note
+
+
+def pack_patient(patient: Patient) -> Patient:
+    if not isinstance(patient.visits, PackedVisits):
+        patient.visits = PackedVisits(patient.visits)
+    if not isinstance(patient.appointments, PackedAppointments):
+        patient.appointments = PackedAppointments(patient.appointments)
+    return patient
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import count as counter
+from typing import FrozenSet, Iterator, Optional, Tuple
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+FREQUENCIES = (DAILY, WEEKLY, MONTHLY)
+
+_FREQUENCY_LABELS = {
+    DAILY: ("gün", "günde"),
+    WEEKLY: ("hafta", "haftada"),
+    MONTHLY: ("ay", "ayda"),
+}
+WEEKDAY_LABELS = ("Pzt", "Sal", "Çar", "Per", "Cum", "Cmt", "Paz")
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    frequency: str = WEEKLY
+    interval: int = 1
+    weekdays: FrozenSet[int] = frozenset()
+    until: Optional[datetime] = None
+    count: Optional[int] = None
+    exceptions: FrozenSet[date] = frozenset()
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "weekdays", frozenset(self.weekdays))
+        object.__setattr__(self, "exceptions", frozenset(self.exceptions))
+        if self.frequency not in FREQUENCIES:
+            raise ValueError(f"Geçersiz tekrar sıklığı: {self.frequency}")
+        if self.interval < 1:
+            raise ValueError("Tekrar aralığı pozitif olmalı.")
+        if self.count is not None and self.count < 1:
+            raise ValueError("Tekrar sayısı pozitif olmalı.")
+        if any(day not in range(7) for day in self.weekdays):
+            raise ValueError("Haftanın günü 0 (Pazartesi) ile 6 (Pazar) arasında olmalı.")
+
+    def expand(
+        self,
+        first: datetime,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[datetime]:
+        for position, moment in self._candidates(first, start):
+            if self.count is not None and position >= self.count:
+                return
+            if self.until is not None and moment > self.until:
+                return
+            if end is not None and moment >= end:
+                return
+            if start is not None and moment < start:
+                continue
+            if moment.date() in self.exceptions:
+                continue
+            yield moment
+
+    def describe(self) -> str:
+        unit, per_unit = _FREQUENCY_LABELS[self.frequency]
+        text = f"her {unit}" if self.interval == 1 else f"her {self.interval} {per_unit} bir"
+        if self.frequency == WEEKLY and self.weekdays:
+            text += " (" + ", ".join(WEEKDAY_LABELS[day] for day in sorted(self.weekdays)) + ")"
+        if self.count is not None:
+            text += f", {self.count} kez"
+        if self.until is not None:
+            text += f", {self.until:%Y-%m-%d} tarihine kadar"
+        if self.exceptions:
+            text += f", {len(self.exceptions)} istisna"
+        return text
+
+    def _candidates(
+        self, first: datetime, start: Optional[datetime]
+    ) -> Iterator[Tuple[int, datetime]]:
+        if self.frequency == WEEKLY:
+            yield from self._weekly_candidates(first, start)
+            return
+        skip = 0
+        if start is not None and start > first:
+            if self.frequency == DAILY:
+                skip = (start - first) // timedelta(days=self.interval)
+            else:
+                months = (start.year - first.year) * 12 + start.month - first.month
+                skip = max(0, months // self.interval - 1)
+        for position in counter(skip):
+            if self.frequency == DAILY:
+                yield position, first + timedelta(days=position * self.interval)
+            else:
+                yield position, _add_months(first, position * self.interval)
+
+    def _weekly_candidates(
+        self, first: datetime, start: Optional[datetime]
+    ) -> Iterator[Tuple[int, datetime]]:
+        days = sorted(self.weekdays or {first.weekday()})
+        anchor = first - timedelta(days=first.weekday())
+        skipped = sum(1 for day in days if day < first.weekday())
+        period = timedelta(weeks=self.interval)
+        week = 0
+        if start is not None and start > anchor:
+            week = (start - anchor) // period
+        for week in counter(week):
+            for offset, day in enumerate(days):
+                position = week * len(days) + offset - skipped
+                if position < 0:
+                    continue
+                yield position, anchor + week * period + timedelta(days=day)
+
+
+@dataclass(frozen=True)
+class RecurringAppointment:
+    starts_at: datetime
+    note: str
+    rule: RecurrenceRule
+
+    def occurrences(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Iterator[datetime]:
+        return self.rule.expand(self.starts_at, start, end)
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        return next(self.occurrences(moment), None)
+
+
+def _add_months(moment: datetime, months: int) -> datetime:
+    month_index = moment.month - 1 + months
+    year = moment.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(moment.day, calendar.monthrange(year, month)[1])
+    return moment.replace(year=year, month=month, day=day)
@@ -1,19 +1,46 @@
 from __future__ import annotations
 
-from typing import Iterable, Protocol
+from typing import Callable, ContextManager, Iterable, List, Optional, Protocol, Tuple, TypeVar
 
 from app.domain.entities import Patient
+from app.domain.paging import PageCursor, PatientPage
+
+T = TypeVar("T")
 
 
 class PatientRepository(Protocol):
+    supports_batching: bool
+
+    @property
+    def generation(self) -> int:
+        ...
+
+    def changes_since(self, generation: int) -> Tuple[int, Optional[List[Patient]]]:
+        ...
+
     def add(self, patient: Patient) -> None:
         ...
 
     def list_all(self) -> Iterable[Patient]:
         ...
 
+    def load_index(self, name: str, build: Callable[[Iterable[Patient]], T]) -> T:
+        ...
+
+    def list_page(self, after: Optional[PageCursor], limit: int) -> PatientPage:
+        ...
+
     def get(self, patient_id: str) -> Patient | None:
         ...
 
     def save(self, patient: Patient) -> None:
         ...
+
+    def batch(self) -> ContextManager[None]:
+        ...
+
+    def for_update(self) -> ContextManager[None]:
+        ...
+
+    def close(self) -> None:
+        ...
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import unicodedata
+
+_COLLATION_ALPHABET = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+_COLLATION_BASE = 0xE000
+_COLLATION_MAP = {
+    letter: chr(_COLLATION_BASE + index) for index, letter in enumerate(_COLLATION_ALPHABET)
+}
+
+
+def turkish_casefold(text: str) -> str:
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+def turkish_sort_key(text: str) -> str:
+    return "".join(_collate_char(char) for char in turkish_casefold(text))
+
+
+def _collate_char(char: str) -> str:
+    mapped = _COLLATION_MAP.get(char)
+    if mapped is not None:
+        return mapped
+    base = unicodedata.normalize("NFD", char)[0]
+    return _COLLATION_MAP.get(base, char)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import io
+import os
+import sys
+from contextlib import nullcontext
+from typing import List, Optional, TextIO
+
+from app.config import get_storage_settings
+from app.infrastructure.exporting import (
+    ROW_KINDS,
+    check_csv_fields,
+    default_fields,
+    iter_rows,
+    write_csv,
+    write_jsonl,
+)
+from app.infrastructure.factory import create_repository
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.export",
+        description="Hasta veritabanını satır satır JSONL veya CSV olarak dışa aktarır.",
+    )
+    parser.add_argument("target", nargs="?", default="-", help="Çıktı dosyası; standart çıktı için '-'")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="Çıktı biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--rows", choices=ROW_KINDS, default="patients", help="Satır başına kayıt türü")
+    parser.add_argument("--fields", help="Virgülle ayrılmış alan listesi")
+    parser.add_argument("--gzip", action="store_true", help="Çıktıyı gzip ile sıkıştır (.gz uzantısında otomatik)")
+    args = parser.parse_args(argv)
+
+    compress = args.gzip or args.target.endswith(".gz")
+    data_format = args.format or _guess_format(args.target)
+    fields = (
+        [name.strip() for name in args.fields.split(",") if name.strip()]
+        if args.fields
+        else list(default_fields(args.rows, flat=data_format == "csv"))
+    )
+
+    repository = create_repository(get_storage_settings())
+    try:
+        rows = iter_rows(repository.list_all(), args.rows, fields)
+        if data_format == "csv":
+            check_csv_fields(fields)
+        with _open_target(args.target, compress) as stream:
+            if data_format == "csv":
+                count = write_csv(rows, stream, fields)
+            else:
+                count = write_jsonl(rows, stream)
+    except ValueError as exc:
+        parser.error(str(exc))
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        repository.close()
+
+    print(f"Dışa aktarılan satır: {count}", file=sys.stderr)
+    return 0
+
+
+def _guess_format(target: str) -> str:
+    name = target[:-3] if target.endswith(".gz") else target
+    return "csv" if name.lower().endswith(".csv") else "jsonl"
+
+
+def _open_target(target: str, compress: bool):
+    if target == "-":
+        if not compress:
+            return nullcontext(sys.stdout)
+        return _text_writer(gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb"))
+    if compress:
+        return gzip.open(target, "wt", encoding="utf-8", newline="")
+    return open(target, "w", encoding="utf-8", newline="")
+
+
+def _text_writer(binary: gzip.GzipFile) -> TextIO:
+    return io.TextIOWrapper(binary, encoding="utf-8", newline="")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
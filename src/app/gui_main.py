@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+import argparse
+import time
+from typing import List, Optional
+
 from app.application.use_cases import PatientService
-from app.config import get_data_path
-from app.infrastructure.json_repository import JsonPatientRepository
+from app.domain.repositories import PatientRepository
 from app.interface.gui import GuiApp
+from app.profiling import create_metrics, instrument_service, print_report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    started_at = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Hasta Kayıt Sistemi")
+    parser.add_argument(
+        "--profile", action="store_true", help="İşlem sürelerini ölç ve çıkışta raporla"
+    )
+    args = parser.parse_args(argv)
+    metrics = create_metrics(args.profile)
+    repositories: List[PatientRepository] = []
+
+    def load_service() -> PatientService:
+        from app.config import get_storage_settings
+        from app.infrastructure.factory import create_repository
 
+        repository = create_repository(get_storage_settings(), metrics)
+        repositories.append(repository)
+        return instrument_service(PatientService(repository), metrics)
 
-def main() -> None:
-    repository = JsonPatientRepository(get_data_path())
-    service = PatientService(repository)
-    app = GuiApp(service)
-    app.run()
+    app = GuiApp(load_service, metrics, started_at=started_at)
+    try:
+        app.run()
+    finally:
+        for repository in repositories:
+            repository.close()
+        print_report(metrics)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import sys
+
+from app.bulk_import import main
+
+if __name__ == "__main__":
+    sys.exit(main(prog="python -m app.import"))
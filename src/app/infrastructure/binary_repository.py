@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from app.domain.entities import Patient
+from app.infrastructure.binary_snapshot import read_snapshot, write_snapshot
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+class BinaryPatientRepository(JsonPatientRepository):
+    def _create_empty_snapshot(self) -> None:
+        write_snapshot(self._file_path, [])
+
+    def _read_snapshot(self) -> Iterable[Patient]:
+        return read_snapshot(self._file_path, self._packed_records)
+
+    def _write_snapshot(self, patients: Iterable[Patient]) -> None:
+        write_snapshot(self._file_path, patients)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, MutableSequence, Optional, Tuple
+
+from app.domain.entities import Appointment, Patient, Visit
+from app.domain.records import PackedAppointments, PackedVisits, from_epoch_micros, to_epoch_micros
+from app.infrastructure.durable_files import replace_durably, sync_file
+from app.infrastructure.serialization import deserialize_series, serialize_series
+
+MAGIC = b"HKBS"
+FORMAT_VERSION = 2
+_READABLE_VERSIONS = (1, FORMAT_VERSION)
+
+_EPOCH = from_epoch_micros(0)
+
+_HEADER = struct.Struct("<4sHHII")
+_U32 = struct.Struct("<I")
+_PATIENT_TAIL = struct.Struct("<iII")
+_EVENT = struct.Struct("<qI")
+
+
+def write_snapshot(path: Path, patients: Iterable[Patient]) -> None:
+    strings: Dict[str, int] = {}
+    records: List[bytes] = []
+    count = 0
+    for patient in patients:
+        records.append(_encode_patient(patient, strings))
+        count += 1
+    temp_path = path.with_name(path.name + ".tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, count, len(strings)))
+        for value in strings:
+            handle.write(_encode_string(value))
+        for record in records:
+            handle.write(_U32.pack(len(record)))
+            handle.write(record)
+        sync_file(handle)
+    replace_durably(temp_path, path)
+
+
+def read_snapshot(path: Path, packed: bool = False) -> List[Patient]:
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return _decode(view, packed)
+            finally:
+                view.release()
+
+
+def _decode(view: memoryview, packed: bool) -> List[Patient]:
+    if len(view) < _HEADER.size:
+        raise ValueError("Anlık görüntü dosyası bozuk.")
+    magic, version, _, count, string_count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Anlık görüntü dosyası tanınmadı.")
+    if version not in _READABLE_VERSIONS:
+        raise ValueError(f"Desteklenmeyen anlık görüntü sürümü: {version}")
+    offset = _HEADER.size
+    strings: List[str] = []
+    for _ in range(string_count):
+        value, offset = _read_string(view, offset)
+        strings.append(value)
+    encoded = [value.encode("utf-8") for value in strings] if packed else None
+    patients = []
+    for _ in range(count):
+        (length,) = _U32.unpack_from(view, offset)
+        start = offset + _U32.size
+        patient, end = _decode_patient(view, start, strings, encoded, version)
+        if end != start + length:
+            raise ValueError("Anlık görüntü dosyası bozuk.")
+        patients.append(patient)
+        offset = end
+    return patients
+
+
+def _encode_patient(patient: Patient, strings: Dict[str, int]) -> bytes:
+    parts = [
+        _encode_string(patient.patient_id),
+        _encode_string(patient.full_name),
+        _encode_string(patient.phone),
+        _PATIENT_TAIL.pack(patient.age, _string_ref(patient.gender, strings), len(patient.visits)),
+    ]
+    parts.extend(
+        _EVENT.pack(to_epoch_micros(visit.created_at), _string_ref(visit.note, strings))
+        for visit in patient.visits
+    )
+    parts.append(_U32.pack(len(patient.appointments)))
+    parts.extend(
+        _EVENT.pack(to_epoch_micros(appointment.scheduled_at), _string_ref(appointment.note, strings))
+        for appointment in patient.appointments
+    )
+    parts.append(_U32.pack(len(patient.recurring)))
+    parts.extend(
+        _encode_string(json.dumps(serialize_series(series), ensure_ascii=False))
+        for series in patient.recurring
+    )
+    return b"".join(parts)
+
+
+def _decode_patient(
+    view: memoryview,
+    offset: int,
+    strings: List[str],
+    encoded: Optional[List[bytes]],
+    version: int,
+) -> Tuple[Patient, int]:
+    patient_id, offset = _read_string(view, offset)
+    full_name, offset = _read_string(view, offset)
+    phone, offset = _read_string(view, offset)
+    age, gender_ref, visit_count = _PATIENT_TAIL.unpack_from(view, offset)
+    offset += _PATIENT_TAIL.size
+    visit_events, offset = _read_events(view, offset, visit_count)
+    (appointment_count,) = _U32.unpack_from(view, offset)
+    offset += _U32.size
+    appointment_events, offset = _read_events(view, offset, appointment_count)
+    recurring = []
+    if version >= 2:
+        (series_count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        for _ in range(series_count):
+            raw, offset = _read_string(view, offset)
+            recurring.append(deserialize_series(json.loads(raw)))
+    if encoded is not None:
+        visits: MutableSequence[Visit] = PackedVisits.from_columns(
+            (stamp for stamp, _ in visit_events), (encoded[ref] for _, ref in visit_events)
+        )
+        appointments: MutableSequence[Appointment] = PackedAppointments.from_columns(
+            (stamp for stamp, _ in appointment_events),
+            (encoded[ref] for _, ref in appointment_events),
+        )
+    else:
+        visits = [
+            Visit(note=strings[note_ref], created_at=_EPOCH + timedelta(microseconds=stamp))
+            for stamp, note_ref in visit_events
+        ]
+        appointments = [
+            Appointment(scheduled_at=_EPOCH + timedelta(microseconds=stamp), note=strings[note_ref])
+            for stamp, note_ref in appointment_events
+        ]
+    patient = Patient(
+        patient_id=patient_id,
+        full_name=full_name,
+        phone=phone,
+        age=age,
+        gender=strings[gender_ref],
+        visits=visits,
+        appointments=appointments,
+        recurring=recurring,
+    )
+    return patient, offset
+
+
+def _read_events(view: memoryview, offset: int, count: int) -> Tuple[List[Tuple[int, int]], int]:
+    end = offset + count * _EVENT.size
+    if end > len(view):
+        raise ValueError("Anlık görüntü dosyası bozuk.")
+    return list(_EVENT.iter_unpack(view[offset:end])), end
+
+
+def _encode_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return _U32.pack(len(encoded)) + encoded
+
+
+def _read_string(view: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _U32.unpack_from(view, offset)
+    start = offset + _U32.size
+    end = start + length
+    if end > len(view):
+        raise ValueError("Anlık görüntü dosyası bozuk.")
+    return str(view[start:end], "utf-8"), end
+
+
+def _string_ref(value: str, strings: Dict[str, int]) -> int:
+    ref = strings.get(value)
+    if ref is None:
+        ref = strings[value] = len(strings)
+    return ref
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
 import json
 import os
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+from app.infrastructure.file_stamp import FileStamp, file_stamp
+
+FORMAT_VERSION = 2
+PBKDF2_SHA256 = "pbkdf2_sha256"
+LEGACY_SHA256 = "sha256"
+DEFAULT_TARGET_MS = 250.0
+MIN_ITERATIONS = 10_000
+_PROBE_ITERATIONS = 20_000
 
 
 @dataclass(frozen=True)
@@ -13,37 +25,140 @@ class Credentials:
     username: str
     salt: str
     password_hash: str
+    algorithm: str = PBKDF2_SHA256
+    iterations: int = 0
 
 
 class CredentialsStore:
-    def __init__(self, file_path: Path) -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        target_ms: float = DEFAULT_TARGET_MS,
+        iterations: Optional[int] = None,
+    ) -> None:
         self._file_path = file_path
+        self._target_ms = target_ms
+        self._iterations = iterations
+        self._users: Dict[str, Credentials] = {}
+        self._stamp: Optional[FileStamp] = None
+        self._lock = threading.RLock()
 
-    def load(self) -> Optional[Credentials]:
-        if not self._file_path.exists():
-            return None
-        payload = json.loads(self._file_path.read_text(encoding="utf-8"))
-        return Credentials(
-            username=payload["username"],
-            salt=payload["salt"],
-            password_hash=payload["password_hash"],
-        )
+    @property
+    def iterations(self) -> int:
+        with self._lock:
+            if self._iterations is None:
+                self._iterations = calibrate_iterations(self._target_ms)
+            return self._iterations
 
-    def save(self, username: str, password: str) -> None:
-        salt = os.urandom(16).hex()
-        password_hash = self._hash_password(password, salt)
-        payload = {"username": username, "salt": salt, "password_hash": password_hash}
-        self._file_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    def has_users(self) -> bool:
+        with self._lock:
+            return bool(self._current())
+
+    def usernames(self) -> List[str]:
+        with self._lock:
+            return sorted(self._current())
+
+    def get(self, username: str) -> Optional[Credentials]:
+        with self._lock:
+            return self._current().get(username)
+
+    def add_user(self, username: str, password: str) -> Credentials:
+        with self._lock:
+            if username in self._current():
+                raise ValueError("Bu kullanıcı adı zaten kayıtlı.")
+            return self.save(username, password)
+
+    def save(self, username: str, password: str) -> Credentials:
+        with self._lock:
+            credentials = self._derive(username, password)
+            users = dict(self._current())
+            users[username] = credentials
+            self._write(users)
+            return credentials
+
+    def remove_user(self, username: str) -> None:
+        with self._lock:
+            users = dict(self._current())
+            if users.pop(username, None) is None:
+                raise ValueError("Kullanıcı bulunamadı.")
+            self._write(users)
 
     def verify(self, username: str, password: str) -> bool:
-        credentials = self.load()
+        with self._lock:
+            credentials = self._current().get(username)
         if credentials is None:
+            self._derive(username, password)
             return False
-        if credentials.username != username:
+        expected = _hash_password(password, credentials)
+        if not hmac.compare_digest(expected, credentials.password_hash):
             return False
-        return credentials.password_hash == self._hash_password(password, credentials.salt)
+        if credentials.algorithm != PBKDF2_SHA256:
+            with self._lock:
+                if self._current().get(username) == credentials:
+                    self.save(username, password)
+        return True
+
+    def _derive(self, username: str, password: str) -> Credentials:
+        salt = os.urandom(16).hex()
+        iterations = self.iterations
+        return Credentials(
+            username=username,
+            salt=salt,
+            password_hash=_pbkdf2(password, salt, iterations),
+            iterations=iterations,
+        )
+
+    def _current(self) -> Dict[str, Credentials]:
+        stamp = file_stamp(self._file_path)
+        if stamp != self._stamp:
+            self._users = _read_users(self._file_path) if stamp is not None else {}
+            self._stamp = stamp
+        return self._users
+
+    def _write(self, users: Dict[str, Credentials]) -> None:
+        payload = {
+            "version": FORMAT_VERSION,
+            "users": [asdict(users[username]) for username in sorted(users)],
+        }
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(temp_path, self._file_path)
+        self._users = users
+        self._stamp = file_stamp(self._file_path)
+
+
+def calibrate_iterations(target_ms: float = DEFAULT_TARGET_MS) -> int:
+    started = time.perf_counter()
+    hashlib.pbkdf2_hmac("sha256", b"calibration", b"0" * 16, _PROBE_ITERATIONS)
+    elapsed_ms = max((time.perf_counter() - started) * 1000, 0.001)
+    return max(MIN_ITERATIONS, int(_PROBE_ITERATIONS * target_ms / elapsed_ms))
+
 
-    @staticmethod
-    def _hash_password(password: str, salt: str) -> str:
-        return hashlib.sha256(f"{salt}:{password}".encode("utf-8")).hexdigest()
+def _hash_password(password: str, credentials: Credentials) -> str:
+    if credentials.algorithm == LEGACY_SHA256:
+        return hashlib.sha256(f"{credentials.salt}:{password}".encode("utf-8")).hexdigest()
+    if credentials.algorithm != PBKDF2_SHA256:
+        raise ValueError(f"Desteklenmeyen şifreleme yöntemi: {credentials.algorithm}")
+    return _pbkdf2(password, credentials.salt, credentials.iterations)
+
+
+def _pbkdf2(password: str, salt: str, iterations: int) -> str:
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), bytes.fromhex(salt), iterations).hex()
+
+
+def _read_users(path: Path) -> Dict[str, Credentials]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if "users" not in payload:
+        legacy = Credentials(
+            username=payload["username"],
+            salt=payload["salt"],
+            password_hash=payload["password_hash"],
+            algorithm=LEGACY_SHA256,
+            iterations=1,
+        )
+        return {legacy.username: legacy}
+    if payload.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen kullanıcı dosyası sürümü: {payload.get('version')}")
+    users = [Credentials(**item) for item in payload["users"]]
+    return {credentials.username: credentials for credentials in users}
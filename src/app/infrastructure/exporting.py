@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import csv
+import json
+from typing import Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+from app.domain.entities import Patient
+from app.infrastructure.serialization import serialize_patient, serialize_series
+
+ROW_KINDS = ("patients", "visits", "appointments", "all")
+LIST_SEPARATOR = ";"
+
+_SERIES_FIELDS = (
+    "starts_at",
+    "frequency",
+    "interval",
+    "weekdays",
+    "until",
+    "count",
+    "exceptions",
+)
+
+_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "patients": (
+        "type",
+        "patient_id",
+        "full_name",
+        "phone",
+        "age",
+        "gender",
+        "visits",
+        "appointments",
+        "recurring",
+    ),
+    "visits": ("type", "patient_id", "note", "created_at"),
+    "appointments": ("type", "patient_id", "scheduled_at", "note", *_SERIES_FIELDS),
+    "all": (
+        "type",
+        "patient_id",
+        "full_name",
+        "phone",
+        "age",
+        "gender",
+        "note",
+        "created_at",
+        "scheduled_at",
+        *_SERIES_FIELDS,
+    ),
+}
+_NESTED_FIELDS = frozenset({"visits", "appointments", "recurring"})
+
+
+def default_fields(kind: str, flat: bool = False) -> Tuple[str, ...]:
+    fields = _fields_for(kind)
+    if flat:
+        return tuple(name for name in fields if name not in _NESTED_FIELDS)
+    return fields
+
+
+def iter_rows(
+    patients: Iterable[Patient],
+    kind: str = "patients",
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[dict]:
+    selected = _select_fields(kind, fields)
+    return _project(patients, kind, selected)
+
+
+def write_jsonl(rows: Iterable[dict], stream: TextIO) -> int:
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def check_csv_fields(fields: Sequence[str]) -> None:
+    nested = _NESTED_FIELDS.intersection(fields)
+    if nested:
+        raise ValueError(f"CSV çıktısında iç içe alan kullanılamaz: {', '.join(sorted(nested))}")
+
+
+def write_csv(rows: Iterable[dict], stream: TextIO, fields: Sequence[str]) -> int:
+    check_csv_fields(fields)
+    writer = csv.DictWriter(stream, fieldnames=list(fields), extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow({name: _flat(value) for name, value in row.items()})
+        count += 1
+    return count
+
+
+def _project(patients: Iterable[Patient], kind: str, selected: Tuple[str, ...]) -> Iterator[dict]:
+    for patient in patients:
+        for row in _rows_of(patient, kind):
+            yield {name: row[name] for name in selected if name in row}
+
+
+def _flat(value: object) -> object:
+    if isinstance(value, list):
+        return LIST_SEPARATOR.join(str(item) for item in value)
+    return value
+
+
+def _fields_for(kind: str) -> Tuple[str, ...]:
+    fields = _FIELDS.get(kind)
+    if fields is None:
+        raise ValueError(f"Bilinmeyen satır türü: {kind}")
+    return fields
+
+
+def _select_fields(kind: str, fields: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    available = _fields_for(kind)
+    if fields is None:
+        return available
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ValueError(f"Bilinmeyen alan: {', '.join(unknown)}")
+    return tuple(fields)
+
+
+def _rows_of(patient: Patient, kind: str) -> Iterator[dict]:
+    if kind == "patients":
+        yield {"type": "patient", **serialize_patient(patient)}
+        return
+    if kind == "all":
+        payload = serialize_patient(patient)
+        yield {
+            "type": "patient",
+            **{name: value for name, value in payload.items() if name not in _NESTED_FIELDS},
+        }
+    if kind in ("visits", "all"):
+        for visit in patient.visits:
+            yield {
+                "type": "visit",
+                "patient_id": patient.patient_id,
+                "note": visit.note,
+                "created_at": visit.created_at.isoformat(),
+            }
+    if kind in ("appointments", "all"):
+        for appointment in patient.appointments:
+            yield {
+                "type": "appointment",
+                "patient_id": patient.patient_id,
+                "scheduled_at": appointment.scheduled_at.isoformat(),
+                "note": appointment.note,
+            }
+        for series in patient.recurring:
+            yield {"type": "series", "patient_id": patient.patient_id, **serialize_series(series)}
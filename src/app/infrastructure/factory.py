@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from app.config import (
+    StorageSettings,
+    get_binary_data_path,
+    get_data_path,
+    get_indexed_data_path,
+    get_sharded_data_path,
+    get_sqlite_path,
+)
+from app.domain.repositories import PatientRepository
+from app.infrastructure.binary_repository import BinaryPatientRepository
+from app.infrastructure.indexed_repository import IndexedJsonPatientRepository
+from app.infrastructure.instrumentation import Metrics, instrument
+from app.infrastructure.journal import JournalOptions
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.sharded_repository import ShardedPatientRepository
+from app.infrastructure.sharing import SharingOptions
+from app.infrastructure.sqlite_repository import SqlitePatientRepository
+from app.infrastructure.write_behind import WriteBehindOptions
+
+REPOSITORY_OPERATIONS = ("add", "get", "save", "list_all", "list_page")
+
+
+def create_repository(
+    settings: StorageSettings, metrics: Optional[Metrics] = None
+) -> PatientRepository:
+    repository = _build_repository(settings, metrics)
+    if metrics is not None:
+        instrument(repository, metrics, "repository", REPOSITORY_OPERATIONS)
+    return repository
+
+
+def _build_repository(settings: StorageSettings, metrics: Optional[Metrics]) -> PatientRepository:
+    if settings.backend == "sqlite":
+        return SqlitePatientRepository(get_sqlite_path())
+    if settings.backend == "indexed":
+        return IndexedJsonPatientRepository(get_indexed_data_path(), cache_size=settings.cache_size)
+    if settings.backend == "sharded":
+        return ShardedPatientRepository(get_sharded_data_path(), cache_size=settings.cache_size)
+    if settings.backend != "json":
+        raise ValueError(f"Bilinmeyen depolama türü: {settings.backend}")
+    journal = None
+    if settings.journal or settings.shared:
+        journal = JournalOptions(
+            fsync_policy=settings.fsync_policy,
+            fsync_interval_ms=settings.fsync_interval_ms,
+            compact_threshold_bytes=settings.compact_threshold_bytes,
+            keep_open=not settings.shared,
+        )
+    sharing = SharingOptions(poll_interval_ms=settings.shared_poll_ms) if settings.shared else None
+    write_behind = None
+    if settings.write_behind_ms > 0 and not settings.shared:
+        write_behind = WriteBehindOptions(
+            delay_ms=settings.write_behind_ms,
+            max_dirty=settings.write_behind_max_dirty,
+        )
+    if settings.snapshot_format == "binary":
+        return BinaryPatientRepository(
+            get_binary_data_path(),
+            journal=journal,
+            packed_records=settings.packed_records,
+            write_behind=write_behind,
+            sharing=sharing,
+            metrics=metrics,
+        )
+    if settings.snapshot_format != "json":
+        raise ValueError(f"Bilinmeyen anlık görüntü biçimi: {settings.snapshot_format}")
+    return JsonPatientRepository(
+        get_data_path(),
+        journal=journal,
+        packed_records=settings.packed_records,
+        write_behind=write_behind,
+        sharing=sharing,
+        metrics=metrics,
+    )
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+
+class FileStamp(NamedTuple):
+    inode: int
+    size: int
+    modified_ns: int
+
+
+def file_stamp(path: Path) -> Optional[FileStamp]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return FileStamp(stat.st_ino, stat.st_size, stat.st_mtime_ns)
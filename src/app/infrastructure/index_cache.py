@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+from typing import Callable, Hashable, TypeVar
+
+from app.infrastructure.durable_files import replace_durably, sync_file
+
+T = TypeVar("T")
+
+INDEX_CACHE_VERSION = 1
+
+
+class IndexCache:
+    def __init__(self, base_path: Path) -> None:
+        self._base_path = base_path
+
+    def path_for(self, name: str) -> Path:
+        return self._base_path.with_name(f"{self._base_path.name}.{name}.index")
+
+    def load(self, name: str, token: Hashable, build: Callable[[], T]) -> T:
+        path = self.path_for(name)
+        try:
+            with path.open("rb") as handle:
+                if pickle.load(handle) == (INDEX_CACHE_VERSION, token):
+                    return pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+            pass
+        index = build()
+        self._store(path, token, index)
+        return index
+
+    def _store(self, path: Path, token: Hashable, index: object) -> None:
+        temp_path = path.with_name(path.name + ".tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                pickle.dump((INDEX_CACHE_VERSION, token), handle, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(index, handle, pickle.HIGHEST_PROTOCOL)
+                sync_file(handle)
+            replace_durably(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
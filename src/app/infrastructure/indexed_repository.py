@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import (
+    IO,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from app.domain.entities import Patient
+from app.domain.paging import PageCursor, PatientPage, next_cursor
+from app.domain.repositories import PatientRepository
+from app.infrastructure.durable_files import replace_durably, sync_file
+from app.infrastructure.index_cache import IndexCache
+from app.infrastructure.lazy_listing import LazyPatientListing
+from app.infrastructure.lru_cache import LruCache
+from app.infrastructure.name_index import SortedNameIndex
+from app.infrastructure.serialization import deserialize_patient, serialize_patient
+
+T = TypeVar("T")
+
+
+class IndexEntry(NamedTuple):
+    patient_id: str
+    full_name: str
+    offset: int
+    length: int
+
+
+class IndexedJsonPatientRepository(PatientRepository):
+    supports_batching = True
+
+    def __init__(
+        self,
+        file_path: Path,
+        cache_size: int = 256,
+        compact_min_bytes: int = 1024 * 1024,
+    ) -> None:
+        self._file_path = file_path
+        self._cache: LruCache[str, Patient] = LruCache(cache_size)
+        self._compact_min_bytes = compact_min_bytes
+        self._entries: Dict[str, IndexEntry] = {}
+        self._name_index = SortedNameIndex()
+        self._data_size = 0
+        self._live_size = 0
+        self._lock = threading.RLock()
+        self._reader: Optional[IO[bytes]] = None
+        self._pending: Optional[Dict[str, Patient]] = None
+        self._file_generation = 0
+        self._index_cache = IndexCache(file_path)
+        self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        return self._file_path.with_name(self._file_path.name + ".idx")
+
+    @property
+    def cached_count(self) -> int:
+        return len(self._cache)
+
+    @property
+    def generation(self) -> int:
+        return 0
+
+    def changes_since(self, generation: int) -> Tuple[int, Optional[List[Patient]]]:
+        return 0, []
+
+    def add(self, patient: Patient) -> None:
+        self.save(patient)
+
+    def list_all(self) -> Iterable[Patient]:
+        with self._lock:
+            ordered = list(self._name_index.ids())
+        return LazyPatientListing(ordered, self._iter_patients)
+
+    def load_index(self, name: str, build: Callable[[Iterable[Patient]], T]) -> T:
+        with self._lock:
+            token = (self._file_generation, self._data_size)
+        return self._index_cache.load(name, token, lambda: build(self.list_all()))
+
+    def list_page(self, after: Optional[PageCursor], limit: int) -> PatientPage:
+        with self._lock:
+            keys = self._name_index.page(after, limit + 1)
+            total = len(self._name_index)
+        return PatientPage(
+            patients=list(self._iter_patients(patient_id for _, patient_id in keys[:limit])),
+            next_cursor=next_cursor(keys, limit),
+            total_estimate=total,
+        )
+
+    def get(self, patient_id: str) -> Patient | None:
+        with self._lock:
+            if self._pending is not None and patient_id in self._pending:
+                return self._pending[patient_id]
+            cached = self._cache.get(patient_id)
+            if cached is not None:
+                return cached
+            entry = self._entries.get(patient_id)
+            if entry is None:
+                return None
+            patient = deserialize_patient(json.loads(self._read_record(entry)))
+            self._cache.put(patient_id, patient)
+            return patient
+
+    def save(self, patient: Patient) -> None:
+        with self._lock:
+            if self._pending is not None:
+                self._pending[patient.patient_id] = patient
+                return
+            self._append([patient])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._lock:
+            if self._pending is not None:
+                yield
+                return
+            self._pending = {}
+            try:
+                yield
+                pending = list(self._pending.values())
+                self._pending = None
+                if pending:
+                    self._append(pending)
+            finally:
+                self._pending = None
+
+    def compact(self) -> None:
+        with self._lock:
+            self._close_reader()
+            generation = self._file_generation + 1
+            header = _generation_header(generation)
+            data_temp = self._file_path.with_name(self._file_path.name + ".tmp")
+            index_temp = self.index_path.with_name(self.index_path.name + ".tmp")
+            entries: Dict[str, IndexEntry] = {}
+            offset = len(header)
+            with self._file_path.open("rb") as source, data_temp.open("wb") as target, index_temp.open(
+                "wb"
+            ) as index:
+                target.write(header)
+                index.write(header)
+                for entry in sorted(self._entries.values(), key=lambda item: item.offset):
+                    source.seek(entry.offset)
+                    target.write(source.read(entry.length))
+                    moved = entry._replace(offset=offset)
+                    index.write(_encode_entry(moved))
+                    entries[moved.patient_id] = moved
+                    offset += moved.length
+                sync_file(target)
+                sync_file(index)
+            replace_durably(data_temp, self._file_path)
+            replace_durably(index_temp, self.index_path)
+            self._file_generation = generation
+            self._entries = entries
+            self._data_size = offset
+            self._live_size = offset - len(header)
+
+    def for_update(self) -> ContextManager[None]:
+        return nullcontext()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_reader()
+
+    def _append(self, patients: List[Patient]) -> None:
+        lines = [
+            json.dumps(serialize_patient(patient), ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            )
+            + b"\n"
+            for patient in patients
+        ]
+        entries = []
+        offset = self._data_size
+        for patient, line in zip(patients, lines):
+            entries.append(IndexEntry(patient.patient_id, patient.full_name, offset, len(line)))
+            offset += len(line)
+        with self._file_path.open("ab") as handle:
+            handle.write(b"".join(lines))
+        with self.index_path.open("a", encoding="utf-8") as handle:
+            handle.writelines(json.dumps(list(entry), ensure_ascii=False) + "\n" for entry in entries)
+        self._data_size = offset
+        for patient, entry in zip(patients, entries):
+            self._track(entry)
+            self._name_index.upsert(patient.patient_id, patient.full_name)
+            self._cache.put(patient.patient_id, patient)
+        garbage = self._data_size - self._live_size
+        if garbage > max(self._compact_min_bytes, self._live_size):
+            self.compact()
+
+    def _iter_patients(self, patient_ids: Iterable[str]) -> Iterator[Patient]:
+        for patient_id in patient_ids:
+            patient = self.get(patient_id)
+            if patient is not None:
+                yield patient
+
+    def _load_index(self) -> None:
+        if not self._file_path.exists():
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file_path.touch()
+            self.index_path.write_text("", encoding="utf-8")
+            return
+        self._file_generation, data_start = _read_generation(self._file_path)
+        index_generation, index_start = (
+            _read_generation(self.index_path) if self.index_path.exists() else (None, 0)
+        )
+        if index_generation != self._file_generation:
+            self.index_path.write_bytes(
+                _generation_header(self._file_generation) if data_start else b""
+            )
+        else:
+            valid_bytes = index_start
+            with self.index_path.open("rb") as handle:
+                handle.seek(index_start)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    self._track(IndexEntry(*json.loads(line)))
+                    valid_bytes += len(line)
+            if valid_bytes < self.index_path.stat().st_size:
+                os.truncate(self.index_path, valid_bytes)
+        indexed_end = max(
+            (entry.offset + entry.length for entry in self._entries.values()), default=data_start
+        )
+        self._data_size = self._file_path.stat().st_size
+        if indexed_end < self._data_size:
+            self._recover_tail(indexed_end)
+        self._name_index.rebuild(
+            (entry.patient_id, entry.full_name) for entry in self._entries.values()
+        )
+
+    def _recover_tail(self, offset: int) -> None:
+        with self._file_path.open("rb") as source, self.index_path.open("a", encoding="utf-8") as index:
+            source.seek(offset)
+            for line in source:
+                if not line.endswith(b"\n"):
+                    break
+                payload = json.loads(line)
+                entry = IndexEntry(payload["patient_id"], payload["full_name"], offset, len(line))
+                index.write(json.dumps(list(entry), ensure_ascii=False) + "\n")
+                self._track(entry)
+                offset += len(line)
+        if offset < self._data_size:
+            os.truncate(self._file_path, offset)
+        self._data_size = offset
+
+    def _read_record(self, entry: IndexEntry) -> bytes:
+        if self._reader is None:
+            self._reader = self._file_path.open("rb")
+        self._reader.seek(entry.offset)
+        return self._reader.read(entry.length)
+
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _track(self, entry: IndexEntry) -> None:
+        previous = self._entries.get(entry.patient_id)
+        if previous is not None:
+            self._live_size -= previous.length
+        self._entries[entry.patient_id] = entry
+        self._live_size += entry.length
+
+
+def _generation_header(generation: int) -> bytes:
+    return json.dumps({"generation": generation}).encode("utf-8") + b"\n"
+
+
+def _read_generation(path: Path) -> Tuple[int, int]:
+    with path.open("rb") as handle:
+        first = handle.readline()
+    if first.endswith(b"\n"):
+        header = json.loads(first)
+        if isinstance(header, dict) and "generation" in header:
+            return int(header["generation"]), len(first)
+    return 0, 0
+
+
+def _encode_entry(entry: IndexEntry) -> bytes:
+    return (json.dumps(list(entry), ensure_ascii=False) + "\n").encode("utf-8")
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+BUCKET_BOUNDS_MS = (
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0,
+)
+
+
+class SlowOperation(NamedTuple):
+    name: str
+    finished_at: float
+    elapsed_ms: float
+
+
+@dataclass
+class Measurement:
+    name: str
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+@dataclass
+class OperationStats:
+    name: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * (len(BUCKET_BOUNDS_MS) + 1))
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, fraction: float) -> float:
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if bucket and seen >= rank:
+                if index == len(BUCKET_BOUNDS_MS):
+                    return self.max_ms
+                return min(BUCKET_BOUNDS_MS[index], self.max_ms)
+        return 0.0
+
+
+class Metrics:
+    def __init__(
+        self,
+        slow_threshold_ms: float = 100.0,
+        slow_log_size: int = 100,
+        on_slow: Optional[Callable[[SlowOperation], None]] = None,
+    ) -> None:
+        self._slow_threshold_ms = slow_threshold_ms
+        self._on_slow = on_slow if on_slow is not None else _print_slow
+        self._operations: Dict[str, OperationStats] = {}
+        self._slow: Deque[SlowOperation] = deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+
+    @property
+    def slow_threshold_ms(self) -> float:
+        return self._slow_threshold_ms
+
+    def observe(self, name: str, seconds: float, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        elapsed_ms = seconds * 1000
+        slow = None
+        with self._lock:
+            stats = self._operations.get(name)
+            if stats is None:
+                stats = self._operations[name] = OperationStats(name)
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.bytes_read += bytes_read
+            stats.bytes_written += bytes_written
+            stats.buckets[bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+            if elapsed_ms >= self._slow_threshold_ms:
+                slow = SlowOperation(name, time.time(), elapsed_ms)
+                self._slow.append(slow)
+        if slow is not None:
+            self._on_slow(slow)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[Measurement]:
+        measurement = Measurement(name)
+        started = time.perf_counter()
+        try:
+            yield measurement
+        finally:
+            self.observe(
+                name,
+                time.perf_counter() - started,
+                measurement.bytes_read,
+                measurement.bytes_written,
+            )
+
+    def operations(self) -> List[OperationStats]:
+        with self._lock:
+            stats = [replace(item, buckets=list(item.buckets)) for item in self._operations.values()]
+        return sorted(stats, key=lambda item: item.total_ms, reverse=True)
+
+    def slow_operations(self) -> List[SlowOperation]:
+        with self._lock:
+            return list(self._slow)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+            self._slow.clear()
+
+    def report(self) -> str:
+        operations = self.operations()
+        if not operations:
+            return "Henüz ölçüm yok."
+        lines = [
+            f"{'İşlem':<32} {'Adet':>7} {'Toplam ms':>11} {'Ort.':>8} {'p50':>8} {'p95':>8} "
+            f"{'p99':>8} {'En çok':>9} {'Okunan':>9} {'Yazılan':>9}"
+        ]
+        for item in operations:
+            lines.append(
+                f"{item.name:<32} {item.count:>7} {item.total_ms:>11.1f} {item.mean_ms:>8.2f} "
+                f"{item.percentile_ms(0.5):>8.2f} {item.percentile_ms(0.95):>8.2f} "
+                f"{item.percentile_ms(0.99):>8.2f} {item.max_ms:>9.1f} "
+                f"{_format_bytes(item.bytes_read):>9} {_format_bytes(item.bytes_written):>9}"
+            )
+        slow = self.slow_operations()
+        if slow:
+            lines.append("")
+            lines.append(f"Yavaş işlemler (>= {self._slow_threshold_ms:g} ms, son {len(slow)}):")
+            for item in slow:
+                stamp = time.strftime("%H:%M:%S", time.localtime(item.finished_at))
+                lines.append(f"  [{stamp}] {item.name} {item.elapsed_ms:.1f} ms")
+        return "\n".join(lines)
+
+
+def measure(metrics: Optional[Metrics], name: str) -> ContextManager[Measurement]:
+    if metrics is None:
+        return nullcontext(Measurement(name))
+    return metrics.measure(name)
+
+
+def instrument(target: Any, metrics: Metrics, prefix: str, names: Iterable[str]) -> None:
+    for name in names:
+        setattr(target, name, _timed(getattr(target, name), metrics, f"{prefix}.{name.lstrip('_')}"))
+
+
+def _timed(method: Callable[..., Any], metrics: Metrics, name: str) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.observe(name, time.perf_counter() - started)
+
+    return wrapper
+
+
+def _format_bytes(size: int) -> str:
+    if not size:
+        return "-"
+    value = float(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+def _print_slow(operation: SlowOperation) -> None:
+    print(f"Yavaş işlem: {operation.name} {operation.elapsed_ms:.1f} ms", file=sys.stderr)
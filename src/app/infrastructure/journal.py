@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from app.infrastructure.durable_files import replace_durably, sync_file
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_ON_CLOSE = "close"
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_ON_CLOSE)
+
+
+@dataclass(frozen=True)
+class JournalOptions:
+    fsync_policy: str = FSYNC_ALWAYS
+    fsync_interval_ms: int = 1000
+    compact_threshold_bytes: int = 4 * 1024 * 1024
+    background_compaction: bool = True
+    keep_open: bool = True
+
+    def __post_init__(self) -> None:
+        if self.fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Geçersiz fsync politikası: {self.fsync_policy}")
+
+
+class PatientJournal:
+    def __init__(self, file_path: Path, options: JournalOptions) -> None:
+        self._file_path = file_path
+        self._options = options
+        self._lock = threading.Lock()
+        self._handle: Optional[IO[bytes]] = None
+        self._last_sync = time.monotonic()
+        self._sync_timer: Optional[threading.Timer] = None
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    def replay(self) -> Iterator[dict]:
+        records, _ = self.read_from(0)
+        return iter(records)
+
+    def read_from(self, offset: int) -> Tuple[List[dict], int]:
+        if not self._file_path.exists():
+            return [], offset
+        records = []
+        with self._file_path.open("rb") as handle:
+            handle.seek(offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                records.append(json.loads(line))
+                offset += len(line)
+        return records, offset
+
+    def append(self, records: Iterable[dict]) -> None:
+        payload = b"".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+            for record in records
+        )
+        if not payload:
+            return
+        with self._lock:
+            handle = self._open()
+            handle.write(payload)
+            handle.flush()
+            if not self._options.keep_open:
+                self._close_handle()
+                return
+            self._sync_if_due(handle)
+
+    def size(self) -> int:
+        return self._file_path.stat().st_size if self._file_path.exists() else 0
+
+    def truncate_before(self, offset: int) -> None:
+        with self._lock:
+            self._close_handle()
+            if not self._file_path.exists():
+                return
+            with self._file_path.open("rb") as handle:
+                handle.seek(offset)
+                tail = handle.read()
+            temp_path = self._file_path.with_name(self._file_path.name + ".tmp")
+            with temp_path.open("wb") as handle:
+                handle.write(tail)
+                sync_file(handle)
+            replace_durably(temp_path, self._file_path)
+
+    def truncate_after(self, offset: int) -> None:
+        with self._lock:
+            self._close_handle()
+            if not self._file_path.exists():
+                return
+            with self._file_path.open("r+b") as handle:
+                handle.truncate(offset)
+                sync_file(handle)
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self._file_path.open("ab")
+        return self._handle
+
+    def _sync_if_due(self, handle: IO[bytes]) -> None:
+        policy = self._options.fsync_policy
+        if policy == FSYNC_ALWAYS:
+            os.fsync(handle.fileno())
+            self._last_sync = time.monotonic()
+        elif policy == FSYNC_INTERVAL:
+            now = time.monotonic()
+            remaining_ms = self._options.fsync_interval_ms - (now - self._last_sync) * 1000
+            if remaining_ms <= 0:
+                os.fsync(handle.fileno())
+                self._last_sync = now
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(remaining_ms / 1000, self._on_sync_timer)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+
+    def _on_sync_timer(self) -> None:
+        with self._lock:
+            self._sync_timer = None
+            if self._handle is not None:
+                os.fsync(self._handle.fileno())
+                self._last_sync = time.monotonic()
+
+    def _close_handle(self) -> None:
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        if self._handle is None:
+            return
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        self._handle = None
@@ -1,90 +1,405 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import (
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
-from app.domain.entities import Appointment, Patient, Visit
+from app.domain.entities import Patient
+from app.domain.paging import PageCursor, PatientPage, next_cursor
+from app.domain.records import pack_patient
 from app.domain.repositories import PatientRepository
+from app.infrastructure.durable_files import replace_durably, sync_file
+from app.infrastructure.file_stamp import FileStamp, file_stamp
+from app.infrastructure.instrumentation import Metrics, measure
+from app.infrastructure.journal import JournalOptions, PatientJournal
+from app.infrastructure.name_index import SortedNameIndex
+from app.infrastructure.serialization import deserialize_patient, serialize_patient
+from app.infrastructure.sharing import InterProcessLock, SharingOptions
+from app.infrastructure.write_behind import WriteBehindBuffer, WriteBehindOptions
+
+T = TypeVar("T")
+
+CHANGE_LOG_GENERATIONS = 64
 
 
 class JsonPatientRepository(PatientRepository):
-    def __init__(self, file_path: Path) -> None:
+    supports_batching = True
+
+    def __init__(
+        self,
+        file_path: Path,
+        journal: Optional[JournalOptions] = None,
+        packed_records: bool = False,
+        write_behind: Optional[WriteBehindOptions] = None,
+        sharing: Optional[SharingOptions] = None,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
         self._file_path = file_path
+        self._metrics = metrics
+        self._packed_records = packed_records
         self._patients: Dict[str, Patient] = {}
-        self._load()
+        self._name_index = SortedNameIndex()
+        self._lock = threading.RLock()
+        self._state_lock = threading.Lock()
+        self._journal_options = journal
+        self._journal: Optional[PatientJournal] = None
+        self._compaction: Optional[threading.Thread] = None
+        self._compaction_lock = threading.Lock()
+        self._batch_changes: Optional[Dict[str, Patient]] = None
+        self._batch_previous: Dict[str, Optional[Patient]] = {}
+        self._write_behind: Optional[WriteBehindBuffer] = None
+        self._sharing = sharing
+        if sharing is not None and write_behind is not None:
+            raise ValueError("Paylaşımlı kip geciktirilmiş yazma ile birlikte kullanılamaz.")
+        self._file_lock = InterProcessLock(self.lock_path) if sharing is not None else None
+        self._generation = 0
+        self._changes: Deque[Tuple[int, List[Patient]]] = deque(maxlen=CHANGE_LOG_GENERATIONS)
+        self._snapshot_stamp: Optional[FileStamp] = None
+        self._journal_stamp: Optional[FileStamp] = None
+        self._journal_offset = 0
+        self._last_poll = time.monotonic()
+        if journal is not None:
+            self._journal = PatientJournal(self.journal_path, journal)
+        with self._lock, self._exclusive():
+            self._load()
+        if write_behind is not None:
+            self._write_behind = WriteBehindBuffer(write_behind, self._write_changes, self._lock)
+
+    @property
+    def journal_path(self) -> Path:
+        return self._file_path.with_name(self._file_path.name + ".log")
+
+    @property
+    def lock_path(self) -> Path:
+        return self._file_path.with_name(self._file_path.name + ".lock")
+
+    @property
+    def generation(self) -> int:
+        self._poll()
+        return self._generation
+
+    def changes_since(self, generation: int) -> Tuple[int, Optional[List[Patient]]]:
+        self._poll()
+        with self._state_lock:
+            if generation == self._generation:
+                return generation, []
+            logged = [entry for entry in self._changes if entry[0] > generation]
+            if not logged or logged[0][0] != generation + 1:
+                return self._generation, None
+            return self._generation, [patient for _, changed in logged for patient in changed]
 
     def add(self, patient: Patient) -> None:
-        self._patients[patient.patient_id] = patient
-        self._persist()
+        with self._lock:
+            if self._packed_records:
+                pack_patient(patient)
+            self._replace(patient)
+            self._record_change(patient)
 
     def list_all(self) -> Iterable[Patient]:
-        return sorted(self._patients.values(), key=lambda item: item.full_name.lower())
+        self._poll()
+        with self._state_lock:
+            return [self._patients[patient_id] for patient_id in self._name_index.ids()]
+
+    def load_index(self, name: str, build: Callable[[Iterable[Patient]], T]) -> T:
+        return build(self.list_all())
+
+    def list_page(self, after: Optional[PageCursor], limit: int) -> PatientPage:
+        self._poll()
+        with self._state_lock:
+            keys = self._name_index.page(after, limit + 1)
+            return PatientPage(
+                patients=[self._patients[patient_id] for _, patient_id in keys[:limit]],
+                next_cursor=next_cursor(keys, limit),
+                total_estimate=len(self._name_index),
+            )
 
     def get(self, patient_id: str) -> Patient | None:
+        self._poll()
         return self._patients.get(patient_id)
 
     def save(self, patient: Patient) -> None:
-        self._patients[patient.patient_id] = patient
-        self._persist()
+        with self._lock:
+            if self._packed_records:
+                pack_patient(patient)
+            self._replace(patient)
+            self._record_change(patient)
+
+    def flush(self) -> None:
+        if self._write_behind is not None:
+            self._write_behind.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._lock:
+            if self._batch_changes is not None:
+                yield
+                return
+            self._batch_changes = {}
+            self._batch_previous = {}
+            try:
+                yield
+                changes = list(self._batch_changes.values())
+                self._batch_changes = None
+                if changes:
+                    self._submit_changes(changes)
+            except BaseException:
+                with self._state_lock:
+                    for patient_id, previous in self._batch_previous.items():
+                        if previous is None:
+                            self._patients.pop(patient_id, None)
+                            self._name_index.remove(patient_id)
+                        else:
+                            self._patients[patient_id] = previous
+                            self._name_index.upsert(patient_id, previous.full_name)
+                raise
+            finally:
+                self._batch_changes = None
+                self._batch_previous = {}
+
+    @contextmanager
+    def for_update(self) -> Iterator[None]:
+        if self._sharing is None:
+            yield
+            return
+        with self._lock, self._exclusive():
+            self._refresh()
+            yield
+
+    def compact(self) -> None:
+        with self._compaction_lock, self._lock, self._exclusive():
+            self.flush()
+            self._refresh()
+            if self._journal is None:
+                self._persist()
+                return
+            self._write_compaction(list(self._patients.values()), self._journal.size())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._write_behind is not None:
+                self._write_behind.close()
+        self._wait_for_compaction()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+
+    def _replace(self, patient: Patient) -> None:
+        if self._batch_changes is not None:
+            self._batch_previous.setdefault(
+                patient.patient_id, self._patients.get(patient.patient_id)
+            )
+        with self._state_lock:
+            self._patients[patient.patient_id] = patient
+            self._name_index.upsert(patient.patient_id, patient.full_name)
+
+    def _record_change(self, patient: Patient) -> None:
+        if self._batch_changes is not None:
+            self._batch_changes[patient.patient_id] = patient
+            return
+        self._submit_changes([patient])
+
+    def _submit_changes(self, patients: List[Patient]) -> None:
+        if self._write_behind is not None:
+            self._write_behind.mark(patients)
+            return
+        self._write_changes(patients)
+
+    def _write_changes(self, patients: List[Patient]) -> None:
+        with self._lock, self._exclusive():
+            self._refresh(keep=patients)
+            if self._journal is None:
+                self._persist()
+                return
+            with measure(self._metrics, "repository.append_journal") as measurement:
+                self._journal.append([serialize_patient(patient) for patient in patients])
+                self._journal_stamp = file_stamp(self.journal_path)
+                measurement.bytes_written = self._journal.size() - self._journal_offset
+            self._journal_offset = self._journal.size()
+            assert self._journal_options is not None
+            if self._journal_offset >= self._journal_options.compact_threshold_bytes:
+                self._start_compaction()
+
+    def _start_compaction(self) -> None:
+        assert self._journal is not None and self._journal_options is not None
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        if self._sharing is not None or not self._journal_options.background_compaction:
+            self._write_compaction(list(self._patients.values()), self._journal.size())
+            return
+        self._compaction = threading.Thread(
+            target=self._compact_in_background,
+            name="patient-journal-compaction",
+            daemon=True,
+        )
+        self._compaction.start()
+
+    def _compact_in_background(self) -> None:
+        assert self._journal is not None
+        with self._compaction_lock:
+            with self._lock:
+                patients = list(self._patients.values())
+                offset = self._journal.size()
+            self._write_compaction(patients, offset)
+
+    def _write_compaction(self, patients: List[Patient], offset: int) -> None:
+        assert self._journal is not None
+        with measure(self._metrics, "repository.compact") as measurement:
+            self._write_snapshot(patients)
+            measurement.bytes_written = self._file_path.stat().st_size
+        with self._lock:
+            self._journal.truncate_before(offset)
+            self._snapshot_stamp = file_stamp(self._file_path)
+            self._journal_stamp = file_stamp(self.journal_path)
+            self._journal_offset = self._journal.size()
+
+    def _wait_for_compaction(self) -> None:
+        compaction = self._compaction
+        if compaction is not None:
+            compaction.join()
 
     def _load(self) -> None:
         if not self._file_path.exists():
             self._file_path.parent.mkdir(parents=True, exist_ok=True)
-            self._file_path.write_text("[]", encoding="utf-8")
+            self._create_empty_snapshot()
+        self._reload(keep=())
+
+    def _reload(self, keep: Iterable[str]) -> None:
+        self._snapshot_stamp = file_stamp(self._file_path)
+        self._journal_stamp = file_stamp(self.journal_path)
+        with measure(self._metrics, "repository.read_snapshot") as measurement:
+            patients = {patient.patient_id: patient for patient in self._read_snapshot()}
+            measurement.bytes_read = self._snapshot_stamp.size if self._snapshot_stamp else 0
+        if self._journal is not None:
+            with measure(self._metrics, "repository.replay_journal") as measurement:
+                records, self._journal_offset = self._journal.read_from(0)
+                self._drop_torn_tail()
+                for record in records:
+                    patient = deserialize_patient(record, self._packed_records)
+                    patients[patient.patient_id] = patient
+                measurement.bytes_read = self._journal_offset
+        for patient_id in keep:
+            if patient_id in self._patients:
+                patients[patient_id] = self._patients[patient_id]
+        with self._state_lock:
+            self._patients = patients
+            self._name_index.rebuild(
+                (patient.patient_id, patient.full_name) for patient in patients.values()
+            )
+            self._changes.clear()
+            self._generation += 1
+
+    def _poll(self) -> None:
+        if self._sharing is None:
             return
-        raw = self._file_path.read_text(encoding="utf-8")
-        data = json.loads(raw or "[]")
-        self._patients = {item["patient_id"]: self._deserialize_patient(item) for item in data}
+        now = time.monotonic()
+        if (now - self._last_poll) * 1000 < self._sharing.poll_interval_ms:
+            return
+        if not self._changed_on_disk():
+            self._last_poll = now
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            with self._exclusive():
+                self._refresh()
+        finally:
+            self._lock.release()
+
+    def _refresh(self, keep: Iterable[Patient] = ()) -> None:
+        if self._sharing is None:
+            return
+        self._last_poll = time.monotonic()
+        pending = {patient.patient_id for patient in keep} | self._pending_ids()
+        snapshot_stamp = file_stamp(self._file_path)
+        journal_stamp = file_stamp(self.journal_path)
+        if snapshot_stamp != self._snapshot_stamp or self._journal_replaced(journal_stamp):
+            self._reload(pending)
+            return
+        if self._journal is None or journal_stamp is None:
+            return
+        if journal_stamp.size == self._journal_offset:
+            self._journal_stamp = journal_stamp
+            return
+        with measure(self._metrics, "repository.merge_journal") as measurement:
+            start = self._journal_offset
+            records, self._journal_offset = self._journal.read_from(start)
+            self._journal_stamp = journal_stamp
+            self._drop_torn_tail()
+            merged = [deserialize_patient(record, self._packed_records) for record in records]
+            changes: List[Patient] = []
+            with self._state_lock:
+                for patient in merged:
+                    if patient.patient_id in pending:
+                        continue
+                    changes.append(patient)
+                    self._patients[patient.patient_id] = patient
+                    self._name_index.upsert(patient.patient_id, patient.full_name)
+                self._generation += 1
+                self._changes.append((self._generation, changes))
+            measurement.bytes_read = self._journal_offset - start
+
+    def _changed_on_disk(self) -> bool:
+        if file_stamp(self._file_path) != self._snapshot_stamp:
+            return True
+        return self._journal is not None and file_stamp(self.journal_path) != self._journal_stamp
+
+    def _drop_torn_tail(self) -> None:
+        assert self._journal is not None
+        if self._journal.size() > self._journal_offset:
+            self._journal.truncate_after(self._journal_offset)
+            self._journal_stamp = file_stamp(self.journal_path)
+
+    def _journal_replaced(self, stamp: Optional[FileStamp]) -> bool:
+        if self._journal is None:
+            return False
+        if stamp is None or self._journal_stamp is None:
+            return stamp != self._journal_stamp and self._journal_offset > 0
+        return stamp.inode != self._journal_stamp.inode or stamp.size < self._journal_offset
+
+    def _pending_ids(self) -> Set[str]:
+        pending = set(self._batch_changes or ())
+        if self._write_behind is not None:
+            pending |= self._write_behind.dirty_ids()
+        return pending
+
+    def _exclusive(self) -> ContextManager[None]:
+        if self._file_lock is None:
+            return nullcontext()
+        return self._file_lock.hold()
 
     def _persist(self) -> None:
-        payload = [self._serialize_patient(patient) for patient in self._patients.values()]
-        self._file_path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        with measure(self._metrics, "repository.write_snapshot") as measurement:
+            self._write_snapshot(list(self._patients.values()))
+            self._snapshot_stamp = file_stamp(self._file_path)
+            measurement.bytes_written = self._snapshot_stamp.size if self._snapshot_stamp else 0
 
-    @staticmethod
-    def _serialize_patient(patient: Patient) -> dict:
-        return {
-            "patient_id": patient.patient_id,
-            "full_name": patient.full_name,
-            "phone": patient.phone,
-            "age": patient.age,
-            "gender": patient.gender,
-            "visits": [
-                {"note": visit.note, "created_at": visit.created_at.isoformat()}
-                for visit in patient.visits
-            ],
-            "appointments": [
-                {
-                    "scheduled_at": appointment.scheduled_at.isoformat(),
-                    "note": appointment.note,
-                }
-                for appointment in patient.appointments
-            ],
-        }
-
-    @staticmethod
-    def _deserialize_patient(payload: dict) -> Patient:
-        visits = [
-            Visit(note=item["note"], created_at=datetime.fromisoformat(item["created_at"]))
-            for item in payload.get("visits", [])
-        ]
-        appointments = [
-            Appointment(
-                scheduled_at=datetime.fromisoformat(item["scheduled_at"]),
-                note=item["note"],
-            )
-            for item in payload.get("appointments", [])
-        ]
-        return Patient(
-            patient_id=payload["patient_id"],
-            full_name=payload["full_name"],
-            phone=payload["phone"],
-            age=payload.get("age", 0),
-            gender=payload.get("gender", "Belirtilmedi"),
-            visits=visits,
-            appointments=appointments,
-        )
+    def _create_empty_snapshot(self) -> None:
+        self._file_path.write_text("[]", encoding="utf-8")
+
+    def _read_snapshot(self) -> Iterable[Patient]:
+        raw = self._file_path.read_text(encoding="utf-8")
+        return [deserialize_patient(item, self._packed_records) for item in json.loads(raw or "[]")]
+
+    def _write_snapshot(self, patients: Iterable[Patient]) -> None:
+        payload = [serialize_patient(patient) for patient in patients]
+        temp_path = self._file_path.with_name(self._file_path.name + ".tmp")
+        with temp_path.open("wb") as handle:
+            handle.write(json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"))
+            sync_file(handle)
+        replace_durably(temp_path, self._file_path)
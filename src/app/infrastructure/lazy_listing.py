@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Callable, Generic, Iterator, List, TypeVar
+
+from app.domain.entities import Patient
+
+K = TypeVar("K")
+
+
+class LazyPatientListing(Generic[K]):
+    def __init__(self, keys: List[K], load: Callable[[List[K]], Iterator[Patient]]) -> None:
+        self._keys = keys
+        self._load = load
+
+    def __iter__(self) -> Iterator[Patient]:
+        return self._load(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
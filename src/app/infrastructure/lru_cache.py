@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    def __init__(self, max_size: int) -> None:
+        if max_size < 1:
+            raise ValueError("Önbellek boyutu en az 1 olmalı.")
+        self._max_size = max_size
+        self._items: "OrderedDict[K, V]" = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def get(self, key: K) -> Optional[V]:
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
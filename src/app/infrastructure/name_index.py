@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.domain.text import turkish_sort_key
+
+SortKey = Tuple[str, str]
+
+
+class SortedNameIndex:
+    def __init__(self) -> None:
+        self._keys: List[SortKey] = []
+        self._names: Dict[str, Tuple[str, SortKey]] = {}
+
+    def rebuild(self, entries: Iterable[Tuple[str, str]]) -> None:
+        self._names = {
+            patient_id: (full_name, (turkish_sort_key(full_name), patient_id))
+            for patient_id, full_name in entries
+        }
+        self._keys = sorted(key for _, key in self._names.values())
+
+    def upsert(self, patient_id: str, full_name: str) -> None:
+        current = self._names.get(patient_id)
+        if current is not None:
+            if current[0] == full_name:
+                return
+            self._remove_key(current[1])
+        key = (turkish_sort_key(full_name), patient_id)
+        insort(self._keys, key)
+        self._names[patient_id] = (full_name, key)
+
+    def remove(self, patient_id: str) -> None:
+        current = self._names.pop(patient_id, None)
+        if current is not None:
+            self._remove_key(current[1])
+
+    def ids(self) -> Iterator[str]:
+        return (patient_id for _, patient_id in list(self._keys))
+
+    def page(self, after: Optional[SortKey], limit: int) -> List[SortKey]:
+        start = 0 if after is None else bisect_right(self._keys, after)
+        return self._keys[start:start + limit]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _remove_key(self, key: SortKey) -> None:
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from app.domain.entities import Appointment, Patient, Visit
+from app.domain.records import PackedAppointments, PackedVisits
+from app.domain.recurrence import RecurrenceRule, RecurringAppointment
+
+
+def serialize_patient(patient: Patient) -> dict:
+    payload = {
+        "patient_id": patient.patient_id,
+        "full_name": patient.full_name,
+        "phone": patient.phone,
+        "age": patient.age,
+        "gender": patient.gender,
+        "visits": [
+            {"note": visit.note, "created_at": visit.created_at.isoformat()}
+            for visit in patient.visits
+        ],
+        "appointments": [
+            {
+                "scheduled_at": appointment.scheduled_at.isoformat(),
+                "note": appointment.note,
+            }
+            for appointment in patient.appointments
+        ],
+    }
+    if patient.recurring:
+        payload["recurring"] = [serialize_series(series) for series in patient.recurring]
+    return payload
+
+
+def serialize_series(series: RecurringAppointment) -> dict:
+    rule = series.rule
+    return {
+        "starts_at": series.starts_at.isoformat(),
+        "note": series.note,
+        "frequency": rule.frequency,
+        "interval": rule.interval,
+        "weekdays": sorted(rule.weekdays),
+        "until": rule.until.isoformat() if rule.until is not None else None,
+        "count": rule.count,
+        "exceptions": sorted(day.isoformat() for day in rule.exceptions),
+    }
+
+
+def deserialize_series(payload: dict) -> RecurringAppointment:
+    until = payload.get("until")
+    rule = RecurrenceRule(
+        frequency=payload["frequency"],
+        interval=payload.get("interval", 1),
+        weekdays=frozenset(payload.get("weekdays", [])),
+        until=datetime.fromisoformat(until) if until else None,
+        count=payload.get("count"),
+        exceptions=frozenset(date.fromisoformat(day) for day in payload.get("exceptions", [])),
+    )
+    return RecurringAppointment(
+        starts_at=datetime.fromisoformat(payload["starts_at"]),
+        note=payload["note"],
+        rule=rule,
+    )
+
+
+def deserialize_patient(payload: dict, packed: bool = False) -> Patient:
+    visits = (
+        Visit(note=item["note"], created_at=datetime.fromisoformat(item["created_at"]))
+        for item in payload.get("visits", [])
+    )
+    appointments = (
+        Appointment(
+            scheduled_at=datetime.fromisoformat(item["scheduled_at"]),
+            note=item["note"],
+        )
+        for item in payload.get("appointments", [])
+    )
+    return Patient(
+        patient_id=payload["patient_id"],
+        full_name=payload["full_name"],
+        phone=payload["phone"],
+        age=payload.get("age", 0),
+        gender=payload.get("gender", "Belirtilmedi"),
+        visits=PackedVisits(visits) if packed else list(visits),
+        appointments=PackedAppointments(appointments) if packed else list(appointments),
+        recurring=[deserialize_series(item) for item in payload.get("recurring", [])],
+    )
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import ExitStack, contextmanager, nullcontext
+from pathlib import Path
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from app.domain.entities import Patient
+from app.domain.paging import PageCursor, PatientPage, next_cursor
+from app.domain.repositories import PatientRepository
+from app.infrastructure.file_stamp import FileStamp, file_stamp
+from app.infrastructure.index_cache import IndexCache
+from app.infrastructure.lazy_listing import LazyPatientListing
+from app.infrastructure.lru_cache import LruCache
+from app.infrastructure.name_index import SortedNameIndex
+from app.infrastructure.serialization import deserialize_patient, serialize_patient
+from app.infrastructure.sharing import InterProcessLock
+
+T = TypeVar("T")
+
+MANIFEST_NAME = "manifest.jsonl"
+LOCK_NAME = "manifest.lock"
+
+
+class ManifestEntry(NamedTuple):
+    patient_id: str
+    full_name: str
+    version: int
+
+
+class ShardedPatientRepository(PatientRepository):
+    supports_batching = True
+
+    def __init__(self, directory: Path, cache_size: int = 256) -> None:
+        self._directory = directory
+        self._cache: LruCache[str, Patient] = LruCache(cache_size)
+        self._entries: Dict[str, ManifestEntry] = {}
+        self._name_index = SortedNameIndex()
+        self._manifest_lines = 0
+        self._manifest_offset = 0
+        self._manifest_stamp: Optional[FileStamp] = None
+        self._generation = 0
+        self._lock = threading.RLock()
+        self._manifest_lock = threading.Lock()
+        self._patient_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._local = threading.local()
+        self._index_cache = IndexCache(self.manifest_path)
+        self._file_lock = InterProcessLock(self.lock_path)
+        self._load_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self._directory / MANIFEST_NAME
+
+    @property
+    def lock_path(self) -> Path:
+        return self._directory / LOCK_NAME
+
+    @property
+    def cached_count(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    @property
+    def generation(self) -> int:
+        self._poll()
+        return self._generation
+
+    def patient_path(self, patient_id: str) -> Path:
+        digest = hashlib.sha1(patient_id.encode("utf-8")).hexdigest()
+        return self._directory / digest[:2] / f"{digest}.json"
+
+    def changes_since(self, generation: int) -> Tuple[int, Optional[List[Patient]]]:
+        current = self.generation
+        return current, ([] if current == generation else None)
+
+    def add(self, patient: Patient) -> None:
+        self.save(patient)
+
+    def list_all(self) -> Iterable[Patient]:
+        self._poll()
+        with self._lock:
+            ordered = list(self._name_index.ids())
+        return LazyPatientListing(ordered, self._iter_patients)
+
+    def load_index(self, name: str, build: Callable[[Iterable[Patient]], T]) -> T:
+        with self._manifest_lock:
+            self._refresh_manifest()
+            stamp = self._manifest_stamp
+            token = (stamp.inode if stamp else None, self._manifest_offset)
+        return self._index_cache.load(name, token, lambda: build(self.list_all()))
+
+    def list_page(self, after: Optional[PageCursor], limit: int) -> PatientPage:
+        self._poll()
+        with self._lock:
+            keys = self._name_index.page(after, limit + 1)
+            total = len(self._name_index)
+        return PatientPage(
+            patients=list(self._iter_patients(patient_id for _, patient_id in keys[:limit])),
+            next_cursor=next_cursor(keys, limit),
+            total_estimate=total,
+        )
+
+    def get(self, patient_id: str) -> Patient | None:
+        pending = self._pending()
+        if pending is not None and patient_id in pending:
+            return pending[patient_id]
+        with self._lock:
+            cached = self._cache.get(patient_id)
+            if cached is not None or patient_id not in self._entries:
+                return cached
+        with self._patient_lock(patient_id):
+            try:
+                raw = self.patient_path(patient_id).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return None
+            patient = deserialize_patient(json.loads(raw))
+            with self._lock:
+                self._cache.put(patient_id, patient)
+        return patient
+
+    def save(self, patient: Patient) -> None:
+        pending = self._pending()
+        if pending is not None:
+            pending[patient.patient_id] = patient
+            return
+        self._write([patient])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        if self._pending() is not None:
+            yield
+            return
+        self._local.pending = {}
+        try:
+            yield
+            pending = list(self._local.pending.values())
+            self._local.pending = None
+            if pending:
+                self._write(pending)
+        finally:
+            self._local.pending = None
+
+    def compact(self) -> None:
+        with self._manifest_lock, self._file_lock.hold():
+            self._refresh_manifest()
+            with self._lock:
+                entries = list(self._entries.values())
+            temp_path = self.manifest_path.with_name(MANIFEST_NAME + ".tmp")
+            with temp_path.open("w", encoding="utf-8") as handle:
+                handle.writelines(_manifest_line(entry) for entry in entries)
+            os.replace(temp_path, self.manifest_path)
+            self._manifest_stamp = file_stamp(self.manifest_path)
+            self._manifest_offset = self._manifest_stamp.size if self._manifest_stamp else 0
+            self._manifest_lines = len(entries)
+
+    def for_update(self) -> ContextManager[None]:
+        return nullcontext()
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def _pending(self) -> Optional[Dict[str, Patient]]:
+        return getattr(self._local, "pending", None)
+
+    def _write(self, patients: List[Patient]) -> None:
+        with ExitStack() as stack:
+            for patient_id in sorted(patient.patient_id for patient in patients):
+                stack.enter_context(self._patient_lock(patient_id))
+            self._append_manifest(patients)
+            for patient in patients:
+                self._write_patient_file(patient)
+                with self._lock:
+                    self._cache.put(patient.patient_id, patient)
+        with self._lock:
+            garbage = self._manifest_lines - len(self._entries)
+        if garbage > max(1024, len(self._entries)):
+            self.compact()
+
+    def _append_manifest(self, patients: List[Patient]) -> None:
+        with self._manifest_lock, self._file_lock.hold():
+            self._refresh_manifest()
+            with self._lock:
+                entries = [
+                    ManifestEntry(
+                        patient.patient_id,
+                        patient.full_name,
+                        self._entries[patient.patient_id].version + 1
+                        if patient.patient_id in self._entries
+                        else 1,
+                    )
+                    for patient in patients
+                ]
+            payload = "".join(_manifest_line(entry) for entry in entries).encode("utf-8")
+            with self.manifest_path.open("ab", buffering=0) as handle:
+                handle.write(payload)
+                end = handle.tell()
+            with self._lock:
+                for entry in entries:
+                    self._entries[entry.patient_id] = entry
+                    self._name_index.upsert(entry.patient_id, entry.full_name)
+                self._manifest_lines += len(entries)
+            if end - len(payload) != self._manifest_offset:
+                return
+            self._manifest_offset = end
+            stamp = file_stamp(self.manifest_path)
+            if stamp is not None and stamp.size == end:
+                self._manifest_stamp = stamp
+
+    def _write_patient_file(self, patient: Patient) -> None:
+        path = self.patient_path(patient.patient_id)
+        path.parent.mkdir(exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(
+            json.dumps(serialize_patient(patient), ensure_ascii=False, separators=(",", ":")),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, path)
+
+    @contextmanager
+    def _patient_lock(self, patient_id: str) -> Iterator[None]:
+        with self._lock:
+            lock, users = self._patient_locks.get(patient_id) or (threading.Lock(), 0)
+            self._patient_locks[patient_id] = (lock, users + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, users = self._patient_locks[patient_id]
+                if users == 1:
+                    del self._patient_locks[patient_id]
+                else:
+                    self._patient_locks[patient_id] = (lock, users - 1)
+
+    def _iter_patients(self, patient_ids: Iterable[str]) -> Iterator[Patient]:
+        for patient_id in patient_ids:
+            patient = self.get(patient_id)
+            if patient is not None:
+                yield patient
+
+    def _load_manifest(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        if not self.manifest_path.exists():
+            self.manifest_path.write_text("", encoding="utf-8")
+        with self._manifest_lock:
+            self._refresh_manifest()
+            stamp = self._manifest_stamp
+            if stamp is not None and self._manifest_offset < stamp.size:
+                os.truncate(self.manifest_path, self._manifest_offset)
+                self._manifest_stamp = file_stamp(self.manifest_path)
+
+    def _poll(self) -> None:
+        with self._manifest_lock:
+            self._refresh_manifest()
+
+    def _refresh_manifest(self) -> None:
+        stamp = file_stamp(self.manifest_path)
+        previous = self._manifest_stamp
+        if stamp == previous:
+            return
+        replaced = (
+            stamp is None
+            or previous is None
+            or stamp.inode != previous.inode
+            or stamp.size < self._manifest_offset
+        )
+        entries, lines, end = self._read_manifest(0 if replaced else self._manifest_offset)
+        with self._lock:
+            if replaced:
+                changed = {
+                    patient_id
+                    for patient_id in self._entries.keys() | entries.keys()
+                    if self._entries.get(patient_id) != entries.get(patient_id)
+                }
+                self._entries = entries
+                self._manifest_lines = lines
+                self._name_index.rebuild(
+                    (entry.patient_id, entry.full_name) for entry in entries.values()
+                )
+            else:
+                changed = {
+                    patient_id
+                    for patient_id, entry in entries.items()
+                    if self._entries.get(patient_id) != entry
+                }
+                self._entries.update(entries)
+                self._manifest_lines += lines
+                for patient_id in changed:
+                    self._name_index.upsert(patient_id, entries[patient_id].full_name)
+            self._manifest_offset = end
+            self._manifest_stamp = stamp
+            if not changed:
+                return
+            for patient_id in changed:
+                self._cache.discard(patient_id)
+            self._generation += 1
+
+    def _read_manifest(self, start: int) -> Tuple[Dict[str, ManifestEntry], int, int]:
+        entries: Dict[str, ManifestEntry] = {}
+        lines = 0
+        end = start
+        try:
+            with self.manifest_path.open("rb") as handle:
+                handle.seek(start)
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        break
+                    lines += 1
+                    end += len(line)
+                    entry = _parse_manifest_line(line)
+                    if entry is not None:
+                        entries[entry.patient_id] = entry
+        except FileNotFoundError:
+            pass
+        return entries, lines, end
+
+
+def _manifest_line(entry: ManifestEntry) -> str:
+    return json.dumps(list(entry), ensure_ascii=False) + "\n"
+
+
+def _parse_manifest_line(line: bytes) -> Optional[ManifestEntry]:
+    try:
+        fields = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(fields, list) or len(fields) != len(ManifestEntry._fields):
+        return None
+    patient_id, full_name, version = fields
+    if not isinstance(patient_id, str) or not isinstance(full_name, str):
+        return None
+    if not isinstance(version, int):
+        return None
+    return ManifestEntry(patient_id, full_name, version)
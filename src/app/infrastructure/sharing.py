@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+@dataclass(frozen=True)
+class SharingOptions:
+    poll_interval_ms: int = 250
+
+
+class InterProcessLock:
+    def __init__(self, file_path: Path) -> None:
+        self._file_path = file_path
+        self._guard = threading.RLock()
+        self._handle: Optional[IO[bytes]] = None
+        self._depth = 0
+
+    @property
+    def file_path(self) -> Path:
+        return self._file_path
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        with self._guard:
+            if self._depth == 0:
+                self._acquire()
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._release()
+
+    def _acquire(self) -> None:
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self._file_path.open("a+b")
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                _lock_windows(handle)
+        except BaseException:
+            handle.close()
+            raise
+        self._handle = handle
+
+    def _release(self) -> None:
+        handle = self._handle
+        if handle is None:
+            return
+        self._handle = None
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            handle.close()
+
+
+def _lock_windows(handle: IO[bytes]) -> None:
+    while True:
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            time.sleep(0.05)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from app.domain.entities import Appointment, Patient, Visit
+from app.domain.paging import PageCursor, PatientPage, next_cursor
+from app.domain.repositories import PatientRepository
+from app.domain.text import turkish_sort_key
+from app.infrastructure.lazy_listing import LazyPatientListing
+from app.infrastructure.serialization import deserialize_series, serialize_series
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS patients (
+    patient_id TEXT PRIMARY KEY,
+    full_name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    gender TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS visits (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_id TEXT NOT NULL REFERENCES patients (patient_id),
+    note TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS appointments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_id TEXT NOT NULL REFERENCES patients (patient_id),
+    scheduled_at TEXT NOT NULL,
+    note TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recurring_appointments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_id TEXT NOT NULL REFERENCES patients (patient_id),
+    series TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_patients_name ON patients (name_key, patient_id);
+CREATE INDEX IF NOT EXISTS idx_visits_patient ON visits (patient_id, id);
+CREATE INDEX IF NOT EXISTS idx_appointments_patient ON appointments (patient_id, id);
+CREATE INDEX IF NOT EXISTS idx_appointments_time ON appointments (scheduled_at);
+CREATE INDEX IF NOT EXISTS idx_recurring_patient ON recurring_appointments (patient_id, id);
+"""
+_SCHEMA_VERSION = 1
+
+
+class SqlitePatientRepository(PatientRepository):
+    supports_batching = True
+
+    def __init__(self, file_path: Path) -> None:
+        self._file_path = file_path
+        self._in_batch = False
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(file_path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def changes_since(self, generation: int) -> Tuple[int, Optional[List[Patient]]]:
+        current = self.generation
+        return current, ([] if current == generation else None)
+
+    def add(self, patient: Patient) -> None:
+        self.save(patient)
+
+    def list_all(self) -> Iterable[Patient]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT patient_id, full_name, phone, age, gender FROM patients "
+                "ORDER BY name_key, patient_id"
+            ).fetchall()
+        return LazyPatientListing(rows, self._iter_patients)
+
+    def load_index(self, name: str, build: Callable[[Iterable[Patient]], T]) -> T:
+        return build(self.list_all())
+
+    def list_page(self, after: Optional[PageCursor], limit: int) -> PatientPage:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT patient_id, full_name, phone, age, gender, name_key FROM patients "
+                "WHERE (name_key, patient_id) > (?, ?) ORDER BY name_key, patient_id LIMIT ?",
+                (*(after or ("", "")), limit + 1),
+            ).fetchall()
+            total = self._connection.execute("SELECT MAX(rowid) FROM patients").fetchone()[0]
+            return PatientPage(
+                patients=[self._build_patient(row[:5]) for row in rows[:limit]],
+                next_cursor=next_cursor([(row[5], row[0]) for row in rows], limit),
+                total_estimate=total or 0,
+            )
+
+    def get(self, patient_id: str) -> Patient | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT patient_id, full_name, phone, age, gender FROM patients WHERE patient_id = ?",
+                (patient_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return self._build_patient(row)
+
+    def save(self, patient: Patient) -> None:
+        with self._lock, self._write_scope():
+            self._connection.execute(
+                "INSERT INTO patients (patient_id, full_name, name_key, phone, age, gender) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (patient_id) DO UPDATE SET full_name = excluded.full_name, "
+                "name_key = excluded.name_key, phone = excluded.phone, "
+                "age = excluded.age, gender = excluded.gender",
+                (
+                    patient.patient_id,
+                    patient.full_name,
+                    turkish_sort_key(patient.full_name),
+                    patient.phone,
+                    patient.age,
+                    patient.gender,
+                ),
+            )
+            stored_visits = self._count("visits", patient.patient_id)
+            self._connection.executemany(
+                "INSERT INTO visits (patient_id, note, created_at) VALUES (?, ?, ?)",
+                [
+                    (patient.patient_id, visit.note, visit.created_at.isoformat())
+                    for visit in list(patient.visits)[stored_visits:]
+                ],
+            )
+            stored_appointments = self._count("appointments", patient.patient_id)
+            self._connection.executemany(
+                "INSERT INTO appointments (patient_id, scheduled_at, note) VALUES (?, ?, ?)",
+                [
+                    (patient.patient_id, appointment.scheduled_at.isoformat(), appointment.note)
+                    for appointment in list(patient.appointments)[stored_appointments:]
+                ],
+            )
+            stored_series = self._count("recurring_appointments", patient.patient_id)
+            self._connection.executemany(
+                "INSERT INTO recurring_appointments (patient_id, series) VALUES (?, ?)",
+                [
+                    (patient.patient_id, json.dumps(serialize_series(series), ensure_ascii=False))
+                    for series in list(patient.recurring)[stored_series:]
+                ],
+            )
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        with self._lock:
+            if self._in_batch:
+                yield
+                return
+            self._in_batch = True
+            try:
+                with self._connection:
+                    yield
+            finally:
+                self._in_batch = False
+
+    def for_update(self) -> ContextManager[None]:
+        return nullcontext()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _write_scope(self) -> ContextManager[object]:
+        return nullcontext() if self._in_batch else self._connection
+
+    def _migrate(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        with self._connection:
+            rows = self._connection.execute("SELECT patient_id, full_name FROM patients").fetchall()
+            self._connection.executemany(
+                "UPDATE patients SET name_key = ? WHERE patient_id = ?",
+                [(turkish_sort_key(full_name), patient_id) for patient_id, full_name in rows],
+            )
+            self._connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _iter_patients(self, rows: list) -> Iterator[Patient]:
+        for row in rows:
+            with self._lock:
+                patient = self._build_patient(row)
+            yield patient
+
+    def _count(self, table: str, patient_id: str) -> int:
+        return self._connection.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE patient_id = ?", (patient_id,)
+        ).fetchone()[0]
+
+    def _build_patient(self, row: tuple) -> Patient:
+        patient_id, full_name, phone, age, gender = row
+        visits = [
+            Visit(note=note, created_at=datetime.fromisoformat(created_at))
+            for note, created_at in self._connection.execute(
+                "SELECT note, created_at FROM visits WHERE patient_id = ? ORDER BY id",
+                (patient_id,),
+            )
+        ]
+        appointments = [
+            Appointment(scheduled_at=datetime.fromisoformat(scheduled_at), note=note)
+            for scheduled_at, note in self._connection.execute(
+                "SELECT scheduled_at, note FROM appointments WHERE patient_id = ? ORDER BY id",
+                (patient_id,),
+            )
+        ]
+        recurring = [
+            deserialize_series(json.loads(series))
+            for (series,) in self._connection.execute(
+                "SELECT series FROM recurring_appointments WHERE patient_id = ? ORDER BY id",
+                (patient_id,),
+            )
+        ]
+        return Patient(
+            patient_id=patient_id,
+            full_name=full_name,
+            phone=phone,
+            age=age,
+            gender=gender,
+            visits=visits,
+            appointments=appointments,
+            recurring=recurring,
+        )
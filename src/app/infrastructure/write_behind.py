@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import atexit
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional, Set
+
+from app.domain.entities import Patient
+
+RETRY_MIN_DELAY_MS = 50
+RETRY_MAX_DELAY_MS = 30_000
+
+
+@dataclass(frozen=True)
+class WriteBehindOptions:
+    delay_ms: int = 500
+    max_dirty: int = 100
+
+    def __post_init__(self) -> None:
+        if self.delay_ms < 0 or self.max_dirty < 1:
+            raise ValueError("Geçersiz geciktirilmiş yazma ayarı.")
+
+
+class WriteBehindBuffer:
+    def __init__(
+        self,
+        options: WriteBehindOptions,
+        write: Callable[[List[Patient]], None],
+        lock: threading.RLock,
+    ) -> None:
+        self._options = options
+        self._write = write
+        self._lock = lock
+        self._dirty: Dict[str, Patient] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+        self._failures = 0
+        self._exit_hook = partial(_flush_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
+
+    @property
+    def dirty_count(self) -> int:
+        with self._lock:
+            return len(self._dirty)
+
+    def dirty_ids(self) -> Set[str]:
+        with self._lock:
+            return set(self._dirty)
+
+    def mark(self, patients: List[Patient]) -> None:
+        with self._lock:
+            for patient in patients:
+                self._dirty[patient.patient_id] = patient
+            if self._closed or len(self._dirty) >= self._options.max_dirty:
+                self.flush()
+            else:
+                self._schedule(self._options.delay_ms)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            patients = list(self._dirty.values())
+            self._dirty = {}
+            try:
+                self._write(patients)
+            except BaseException:
+                for patient in patients:
+                    self._dirty.setdefault(patient.patient_id, patient)
+                self._failures += 1
+                if not self._closed:
+                    self._schedule(self._retry_delay_ms())
+                raise
+            self._failures = 0
+
+    def close(self) -> None:
+        atexit.unregister(self._exit_hook)
+        with self._lock:
+            self._closed = True
+            self.flush()
+
+    def _schedule(self, delay_ms: float) -> None:
+        if self._timer is not None:
+            return
+        self._timer = threading.Timer(delay_ms / 1000, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _retry_delay_ms(self) -> float:
+        base = max(self._options.delay_ms, RETRY_MIN_DELAY_MS)
+        return min(base * 2 ** (self._failures - 1), RETRY_MAX_DELAY_MS)
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self.flush()
+
+
+def _flush_at_exit(buffer: "weakref.ref[WriteBehindBuffer]") -> None:
+    alive = buffer()
+    if alive is not None:
+        alive.flush()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+SuccessCallback = Callable[[Any], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+class ServiceWorker:
+    def __init__(self) -> None:
+        self._tasks: "queue.Queue[Optional[Tuple[Callable[[], Any], SuccessCallback, ErrorCallback, bool]]]" = (
+            queue.Queue()
+        )
+        self._results: "queue.Queue[Tuple[Callable[..., None], Any, bool]]" = queue.Queue()
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, name="service-worker", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(
+        self,
+        call: Callable[[], Any],
+        on_success: SuccessCallback,
+        on_error: ErrorCallback,
+        counted: bool = True,
+    ) -> None:
+        if counted:
+            self._pending += 1
+        self._tasks.put((call, on_success, on_error, counted))
+
+    def poll(self) -> int:
+        handled = 0
+        while True:
+            try:
+                callback, value, counted = self._results.get_nowait()
+            except queue.Empty:
+                return handled
+            if counted:
+                self._pending -= 1
+            handled += 1
+            callback(value)
+
+    def flush(self) -> None:
+        self._tasks.join()
+        self.poll()
+
+    def shutdown(self) -> None:
+        self.flush()
+        self._tasks.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                self._tasks.task_done()
+                return
+            call, on_success, on_error, counted = task
+            try:
+                result = call()
+            except Exception as exc:
+                self._results.put((on_error, exc, counted))
+            else:
+                self._results.put((on_success, result, counted))
+            finally:
+                self._tasks.task_done()
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Callable
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
 
+from app.application.attribute_index import PatientQuery
 from app.application.use_cases import (
     AddVisitRequest,
     PatientService,
-    RegisterPatientRequest,
     ScheduleAppointmentRequest,
+    build_recurrence_rule,
+    build_register_request,
 )
+from app.infrastructure.instrumentation import Metrics
+
+
+CLI_PAGE_SIZE = 20
+QUERY_LIMIT = 50
 
 
 @dataclass
@@ -20,8 +27,9 @@ class MenuItem:
 
 
 class CliApp:
-    def __init__(self, service: PatientService) -> None:
+    def __init__(self, service: PatientService, metrics: Optional[Metrics] = None) -> None:
         self._service = service
+        self._metrics = metrics
         self._menu = [
             MenuItem("1", "Sekreter: Hasta kaydı oluştur", self._register_patient),
             MenuItem("2", "Doktor: Hasta listesi", self._list_patients),
@@ -29,8 +37,13 @@ class CliApp:
             MenuItem("4", "Doktor: Muayene notlarını görüntüle", self._show_visits),
             MenuItem("5", "Sekreter: Randevu oluştur", self._schedule_appointment),
             MenuItem("6", "Doktor: Randevu listesini görüntüle", self._show_appointments),
-            MenuItem("0", "Çıkış", self._exit),
+            MenuItem("7", "Sekreter: Klinik ajandası", self._show_agenda),
+            MenuItem("8", "Doktor: Hasta sorgula", self._query_patients),
+            MenuItem("9", "Doktor: Muayene notlarında ara", self._search_notes),
         ]
+        if metrics is not None:
+            self._menu.append(MenuItem("10", "Performans istatistikleri", self._show_metrics))
+        self._menu.append(MenuItem("0", "Çıkış", self._exit))
         self._running = True
 
     def run(self) -> None:
@@ -53,19 +66,9 @@ class CliApp:
         phone = input("Telefon: ").strip()
         age = input("Yaş: ").strip()
         gender = input("Cinsiyet: ").strip()
-        if not age.isdigit():
-            print("Hata: Yaş sayısal olmalı.")
-            return
         try:
-            patient = self._service.register_patient(
-                RegisterPatientRequest(
-                    patient_id=patient_id,
-                    full_name=full_name,
-                    phone=phone,
-                    age=int(age),
-                    gender=gender or "Belirtilmedi",
-                )
-            )
+            request = build_register_request(patient_id, full_name, phone, age, gender)
+            patient = self._service.register_patient(request)
         except ValueError as exc:
             print(f"Hata: {exc}")
             return
@@ -73,16 +76,28 @@ class CliApp:
 
     def _list_patients(self) -> None:
         print("\nHasta Listesi")
-        patients = list(self._service.list_patients())
-        if not patients:
+        page = self._service.list_patients_page(limit=CLI_PAGE_SIZE)
+        if not page.patients:
             print("Henüz kayıt yok.")
             return
-        for patient in patients:
-            print(
-                f"- {patient.patient_id} | {patient.full_name} | {patient.phone} | "
-                f"Yaş: {patient.age} | Cinsiyet: {patient.gender} | "
-                f"Muayene: {len(patient.visits)} | Randevu: {len(patient.appointments)}"
+        shown = 0
+        while True:
+            for patient in page.patients:
+                print(
+                    f"- {patient.patient_id} | {patient.full_name} | {patient.phone} | "
+                    f"Yaş: {patient.age} | Cinsiyet: {patient.gender} | "
+                    f"Muayene: {len(patient.visits)} | Randevu: {len(patient.appointments)}"
+                )
+            shown += len(page.patients)
+            if page.next_cursor is None:
+                return
+            answer = input(
+                f"{shown}/{page.total_estimate} hasta gösterildi. "
+                "Devam için Enter, çıkmak için q: "
             )
+            if answer.strip().lower() == "q":
+                return
+            page = self._service.list_patients_page(page.next_cursor, CLI_PAGE_SIZE)
 
     def _add_visit(self) -> None:
         print("\nMuayene Notu Ekle")
@@ -98,8 +113,7 @@ class CliApp:
     def _show_visits(self) -> None:
         print("\nMuayene Notları")
         patient_id = input("Hasta numarası: ").strip()
-        patient = self._service.list_patients()
-        selected = next((item for item in patient if item.patient_id == patient_id), None)
+        selected = self._service.get_patient(patient_id)
         if selected is None:
             print("Hasta bulunamadı.")
             return
@@ -120,35 +134,137 @@ class CliApp:
         except ValueError:
             print("Hata: Tarih formatı geçersiz.")
             return
+        frequency = input("Tekrar (boş: yok, g: günlük, h: haftalık, a: aylık): ").strip()
         try:
+            recurrence = build_recurrence_rule(frequency, *self._recurrence_inputs(frequency))
             patient = self._service.schedule_appointment(
                 ScheduleAppointmentRequest(
                     patient_id=patient_id,
                     scheduled_at=scheduled_dt,
                     note=note,
+                    recurrence=recurrence,
                 )
             )
         except ValueError as exc:
             print(f"Hata: {exc}")
             return
+        if recurrence is not None:
+            print(f"Tekrarlayan randevu eklendi: {recurrence.describe()}")
+            return
         print(f"Randevu eklendi. Toplam randevu: {len(patient.appointments)}")
 
+    def _recurrence_inputs(self, frequency: str) -> Tuple[str, str, str, str, str]:
+        if not frequency:
+            return "", "", "", "", ""
+        interval = input("Kaç dönemde bir [1]: ")
+        weekdays = ""
+        if frequency.lower() == "h":
+            weekdays = input("Günler (1=Pzt ... 7=Paz, virgülle; boş: başlangıç günü): ")
+        count = input("Tekrar sayısı (boş: sınırsız): ")
+        until = input("Bitiş tarihi (YYYY-AA-GG, boş: yok): ")
+        exceptions = input("Hariç tutulacak tarihler (YYYY-AA-GG, virgülle): ")
+        return interval, weekdays, count, until, exceptions
+
     def _show_appointments(self) -> None:
         print("\nRandevu Listesi")
         patient_id = input("Hasta numarası: ").strip()
-        patient = self._service.list_patients()
-        selected = next((item for item in patient if item.patient_id == patient_id), None)
-        if selected is None:
+        patient = self._service.get_patient(patient_id)
+        if patient is None:
             print("Hasta bulunamadı.")
             return
-        if not selected.appointments:
+        for series in patient.recurring:
+            timestamp = series.starts_at.strftime("%Y-%m-%d %H:%M")
+            print(f"- Tekrarlayan [{timestamp}] {series.note or '-'}: {series.rule.describe()}")
+        appointments = self._service.patient_appointments(patient_id, series_from=datetime.now())
+        if not appointments:
             print("Randevu bulunamadı.")
             return
-        for appointment in sorted(selected.appointments, key=lambda item: item.scheduled_at):
+        for appointment in appointments:
             timestamp = appointment.scheduled_at.strftime("%Y-%m-%d %H:%M")
             note = appointment.note or "-"
             print(f"- [{timestamp}] {note}")
 
+    def _show_agenda(self) -> None:
+        print("\nKlinik Ajandası")
+        day_text = input("Tarih (YYYY-AA-GG, boş: bugün): ").strip()
+        span_text = input("Görünüm (g: gün, h: hafta) [g]: ").strip().lower()
+        try:
+            day = datetime.strptime(day_text, "%Y-%m-%d") if day_text else datetime.now()
+        except ValueError:
+            print("Hata: Tarih formatı geçersiz.")
+            return
+        start = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=7 if span_text == "h" else 1)
+        entries = self._service.agenda(start, end)
+        if not entries:
+            print("Bu aralıkta randevu yok.")
+            return
+        for entry in entries:
+            timestamp = entry.scheduled_at.strftime("%Y-%m-%d %H:%M")
+            note = entry.note or "-"
+            print(f"- [{timestamp}] {entry.patient_id} | {entry.full_name} | {note}")
+
+    def _query_patients(self) -> None:
+        print("\nHasta Sorgula (boş bırakılan koşul uygulanmaz)")
+        try:
+            min_age = _optional_int(input("En küçük yaş: "))
+            max_age = _optional_int(input("En büyük yaş: "))
+            gender = input("Cinsiyet: ").strip() or None
+            idle_days = _optional_int(input("Son kaç gündür muayene olmayanlar: "))
+            appointment_days = _optional_int(input("Kaç gün içinde randevusu olanlar: "))
+        except ValueError:
+            print("Hata: Sayısal değer girin.")
+            return
+        now = datetime.now()
+        spec = PatientQuery(
+            min_age=min_age,
+            max_age=max_age,
+            gender=gender,
+            not_visited_since=now - timedelta(days=idle_days) if idle_days is not None else None,
+            appointment_from=now if appointment_days is not None else None,
+            appointment_until=(
+                now + timedelta(days=appointment_days) if appointment_days is not None else None
+            ),
+        )
+        patients, plan = self._service.query_with_plan(spec, limit=QUERY_LIMIT)
+        print("Sorgu planı:")
+        for line in plan.describe():
+            print(f"  {line}")
+        if not patients:
+            print("Koşullara uyan hasta yok.")
+            return
+        for patient in patients:
+            print(
+                f"- {patient.patient_id} | {patient.full_name} | Yaş: {patient.age} | "
+                f"Cinsiyet: {patient.gender} | Muayene: {len(patient.visits)}"
+            )
+
+    def _search_notes(self) -> None:
+        print("\nMuayene Notlarında Ara (tam ifade için tırnak kullanın)")
+        query = input("Arama: ").strip()
+        if not query:
+            print("Hata: Arama ifadesi boş olamaz.")
+            return
+        hits = self._service.search_notes(query)
+        if not hits:
+            print("Eşleşen not bulunamadı.")
+            return
+        for hit in hits:
+            timestamp = hit.created_at.strftime("%Y-%m-%d %H:%M")
+            print(f"- {hit.patient_id} | {hit.full_name} | [{timestamp}] {hit.note}")
+
+    def _show_metrics(self) -> None:
+        assert self._metrics is not None
+        print("\nPerformans İstatistikleri")
+        print(self._metrics.report())
+        if input("Sayaçlar sıfırlansın mı? (e/h) [h]: ").strip().lower() == "e":
+            self._metrics.reset()
+
     def _exit(self) -> None:
         print("Çıkılıyor...")
         self._running = False
+
+
+def _optional_int(text: str) -> Optional[int]:
+    text = text.strip()
+    return int(text) if text else None
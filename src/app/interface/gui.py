@@ -1,18 +1,45 @@
 from __future__ import annotations
 
+import time
 import tkinter as tk
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from tkinter import messagebox, ttk
+from typing import Any, Callable, Optional
 
+from app.application.calendar_index import AgendaEntry
+from app.application.note_index import NoteHit
 from app.application.use_cases import (
     AddVisitRequest,
     PatientService,
     RegisterPatientRequest,
     ScheduleAppointmentRequest,
+    build_recurrence_rule,
 )
 from app.config import get_credentials_path
+from app.domain.entities import Appointment, Patient
+from app.domain.paging import PageCursor, PatientPage, cursor_for
 from app.infrastructure.credentials_store import CredentialsStore
+from app.infrastructure.instrumentation import Metrics, instrument
+from app.interface.background import ServiceWorker
+from app.interface.virtual_list import ListboxView, VirtualTreeview
+
+FILTER_DEBOUNCE_MS = 200
+SEARCH_LIMIT = 500
+NOTE_SEARCH_LIMIT = 100
+LIST_PAGE_SIZE = 200
+WORKER_POLL_MS = 50
+RECURRENCE_OPTIONS = {"Yok": "", "Günlük": "g", "Haftalık": "h", "Aylık": "a"}
+GUI_OPERATIONS = (
+    "_refresh_patient_list",
+    "_refresh_visit_list",
+    "_refresh_appointment_list",
+    "_refresh_agenda",
+    "_load_next_page",
+    "_show_window",
+    "_append_page",
+    "_search_notes",
+)
 
 
 @dataclass
@@ -22,20 +49,38 @@ class GuiAppState:
 
 
 class GuiApp:
-    def __init__(self, service: PatientService) -> None:
-        self._service = service
+    def __init__(
+        self,
+        load_service: Callable[[], PatientService],
+        metrics: Optional[Metrics] = None,
+        started_at: Optional[float] = None,
+    ) -> None:
+        self._service: PatientService
+        self._loaded = False
+        self._metrics = metrics
+        self._started_at = started_at if started_at is not None else time.perf_counter()
+        if metrics is not None:
+            instrument(self, metrics, "gui", GUI_OPERATIONS)
         self._state = GuiAppState()
+        self._filter_job: str | None = None
+        self._next_cursor: PageCursor | None = None
+        self._list_generation = 0
         self._credentials_store = CredentialsStore(get_credentials_path())
+        self._worker = ServiceWorker()
 
         self._root = tk.Tk()
         self._root.title("Hasta Kayıt Sistemi")
         self._root.geometry("900x720")
         self._root.minsize(860, 680)
         self._root.resizable(True, True)
+        self._root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self._build_layout()
-        self._refresh_patient_list()
+        self._worker.submit(load_service, self._on_service_loaded, self._on_service_error)
         self._update_auth_state()
+        self._update_pending_indicator()
+        self._root.after_idle(self._on_first_paint)
+        self._root.after(WORKER_POLL_MS, self._poll_worker)
 
     def run(self) -> None:
         self._root.mainloop()
@@ -59,6 +104,13 @@ class GuiApp:
         self._build_patient_tab(self._patient_tab)
         self._build_appointment_tab(self._appointment_tab)
 
+        status_bar = ttk.Frame(self._root, padding=(12, 0, 12, 8))
+        status_bar.pack(fill=tk.X)
+        self._status_label = ttk.Label(status_bar, text="")
+        self._status_label.pack(side=tk.LEFT)
+        self._pending_label = ttk.Label(status_bar, text="")
+        self._pending_label.pack(side=tk.RIGHT)
+
     def _build_login_tab(self, parent: ttk.Frame) -> None:
         parent.columnconfigure(1, weight=1)
 
@@ -66,7 +118,8 @@ class GuiApp:
             parent,
             text=(
                 "İlk açılışta kullanıcı adı ve şifre belirleyin. "
-                "Daha sonra aynı bilgilerle giriş yapın."
+                "Daha sonra aynı bilgilerle giriş yapın. Giriş yapan kullanıcı "
+                "yeni kullanıcı ekleyebilir."
             ),
             wraplength=600,
         )
@@ -104,6 +157,7 @@ class GuiApp:
         right_frame.grid(row=0, column=1, sticky=tk.NSEW)
 
         self._build_register_form(left_frame)
+        self._build_note_search(left_frame)
         self._build_patient_list(right_frame)
         self._build_visit_form(right_frame)
 
@@ -112,6 +166,7 @@ class GuiApp:
         appointment_frame = ttk.Frame(parent, padding=12)
         appointment_frame.grid(row=0, column=0, sticky=tk.NSEW)
         self._build_appointment_form(appointment_frame)
+        self._build_agenda(appointment_frame)
 
     def _build_register_form(self, parent: ttk.Frame) -> None:
         section = ttk.LabelFrame(parent, text="Sekreter: Hasta Kaydı", padding=12)
@@ -138,6 +193,23 @@ class GuiApp:
         submit_button = ttk.Button(section, text="Kaydı Oluştur", command=self._handle_register_patient)
         submit_button.grid(row=5, column=0, columnspan=2, pady=(8, 0))
 
+    def _build_note_search(self, parent: ttk.Frame) -> None:
+        section = ttk.LabelFrame(parent, text="Doktor: Notlarda Ara", padding=12)
+        section.pack(fill=tk.BOTH, expand=True, pady=(12, 0))
+
+        controls = ttk.Frame(section)
+        controls.pack(fill=tk.X)
+        self._note_query_entry = ttk.Entry(controls)
+        self._note_query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self._note_query_entry.bind("<Return>", lambda _event: self._search_notes())
+        ttk.Button(controls, text="Ara", command=self._search_notes).pack(side=tk.LEFT, padx=(8, 0))
+
+        self._note_result_list = tk.Listbox(section, width=40, height=8)
+        self._note_result_list.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
+        self._note_result_list.bind("<<ListboxSelect>>", self._on_note_result_select)
+        self._note_result_view = ListboxView(self._note_result_list)
+        self._note_result_ids: list[str] = []
+
     def _build_patient_list(self, parent: ttk.Frame) -> None:
         section = ttk.LabelFrame(parent, text="Doktor: Hasta Listesi", padding=12)
         section.pack(fill=tk.BOTH, expand=True)
@@ -151,8 +223,11 @@ class GuiApp:
         filter_entry.pack(side=tk.LEFT, padx=8, fill=tk.X, expand=True)
         filter_entry.bind("<KeyRelease>", self._on_filter_change)
 
+        list_frame = ttk.Frame(section)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
+
         columns = ("patient_id", "full_name", "age", "gender", "phone", "visit_count")
-        self._tree = ttk.Treeview(section, columns=columns, show="headings", height=8)
+        self._tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=8)
         self._tree.heading("patient_id", text="Hasta No")
         self._tree.heading("full_name", text="Ad Soyad")
         self._tree.heading("age", text="Yaş")
@@ -167,8 +242,17 @@ class GuiApp:
         self._tree.column("phone", width=110)
         self._tree.column("visit_count", width=80, anchor=tk.CENTER)
 
-        self._tree.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self._tree.bind("<<TreeviewSelect>>", self._on_patient_select)
+        self._patient_view: VirtualTreeview[Patient] = VirtualTreeview(
+            self._tree,
+            key=lambda patient: patient.patient_id,
+            render=self._patient_row,
+            scrollbar=scrollbar,
+            on_reach_end=self._load_next_page,
+        )
 
     def _build_visit_form(self, parent: ttk.Frame) -> None:
         section = ttk.LabelFrame(parent, text="Doktor: Muayene Notu", padding=12)
@@ -188,6 +272,7 @@ class GuiApp:
         ttk.Label(section, text="Notlar:").grid(row=3, column=0, sticky=tk.NW, pady=(8, 0))
         self._visit_list = tk.Listbox(section, width=48, height=6)
         self._visit_list.grid(row=3, column=1, pady=(8, 0), sticky=tk.W)
+        self._visit_view = ListboxView(self._visit_list)
 
     def _build_appointment_form(self, parent: ttk.Frame) -> None:
         section = ttk.LabelFrame(parent, text="Sekreter: Randevu", padding=12)
@@ -207,18 +292,55 @@ class GuiApp:
         self._appointment_note_entry = ttk.Entry(section, width=28)
         self._appointment_note_entry.grid(row=2, column=1, pady=(8, 0), sticky=tk.W)
 
+        ttk.Label(section, text="Tekrar:").grid(row=3, column=0, sticky=tk.W, pady=(8, 0))
+        recurrence_row = ttk.Frame(section)
+        recurrence_row.grid(row=3, column=1, pady=(8, 0), sticky=tk.W)
+        self._recurrence_choice = ttk.Combobox(
+            recurrence_row, values=tuple(RECURRENCE_OPTIONS), state="readonly", width=9
+        )
+        self._recurrence_choice.current(0)
+        self._recurrence_choice.pack(side=tk.LEFT)
+        ttk.Label(recurrence_row, text="Sayı:").pack(side=tk.LEFT, padx=(8, 4))
+        self._recurrence_count_entry = ttk.Entry(recurrence_row, width=5)
+        self._recurrence_count_entry.pack(side=tk.LEFT)
+        ttk.Label(recurrence_row, text="Bitiş:").pack(side=tk.LEFT, padx=(8, 4))
+        self._recurrence_until_entry = ttk.Entry(recurrence_row, width=11)
+        self._recurrence_until_entry.pack(side=tk.LEFT)
+
         add_button = ttk.Button(section, text="Randevu Ekle", command=self._handle_add_appointment)
-        add_button.grid(row=3, column=0, columnspan=2, pady=(8, 0))
+        add_button.grid(row=4, column=0, columnspan=2, pady=(8, 0))
 
-        ttk.Label(section, text="Randevular:").grid(row=4, column=0, sticky=tk.NW, pady=(8, 0))
+        ttk.Label(section, text="Randevular:").grid(row=5, column=0, sticky=tk.NW, pady=(8, 0))
         self._appointment_list = tk.Listbox(section, width=48, height=8)
-        self._appointment_list.grid(row=4, column=1, pady=(8, 0), sticky=tk.W)
+        self._appointment_list.grid(row=5, column=1, pady=(8, 0), sticky=tk.W)
+        self._appointment_view = ListboxView(self._appointment_list)
+
+    def _build_agenda(self, parent: ttk.Frame) -> None:
+        section = ttk.LabelFrame(parent, text="Klinik Ajandası", padding=12)
+        section.pack(fill=tk.BOTH, expand=True, pady=(12, 0))
+
+        controls = ttk.Frame(section)
+        controls.pack(fill=tk.X)
+        ttk.Label(controls, text="Tarih (YYYY-AA-GG):").pack(side=tk.LEFT)
+        self._agenda_date_entry = ttk.Entry(controls, width=12)
+        self._agenda_date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self._agenda_date_entry.pack(side=tk.LEFT, padx=8)
+        self._agenda_span = ttk.Combobox(
+            controls, values=("Gün", "Hafta"), state="readonly", width=8
+        )
+        self._agenda_span.current(0)
+        self._agenda_span.pack(side=tk.LEFT)
+        ttk.Button(controls, text="Göster", command=self._refresh_agenda).pack(side=tk.LEFT, padx=8)
 
-    def _update_auth_state(self) -> None:
-        credentials = self._credentials_store.load()
-        has_credentials = credentials is not None
+        self._agenda_list = tk.Listbox(section, height=8)
+        self._agenda_list.pack(fill=tk.BOTH, expand=True, pady=(8, 0))
+        self._agenda_view = ListboxView(self._agenda_list)
 
-        if has_credentials:
+    def _update_auth_state(self) -> None:
+        if self._state.logged_in:
+            self._register_button.configure(state=tk.NORMAL)
+            self._login_button.configure(state=tk.NORMAL)
+        elif self._credentials_store.has_users():
             self._auth_message.configure(text="Kayıtlı kullanıcı bulundu. Giriş yapın.")
             self._register_button.configure(state=tk.DISABLED)
             self._login_button.configure(state=tk.NORMAL)
@@ -227,7 +349,7 @@ class GuiApp:
             self._register_button.configure(state=tk.NORMAL)
             self._login_button.configure(state=tk.DISABLED)
 
-        self._set_protected_tabs_state(self._state.logged_in)
+        self._set_protected_tabs_state(self._state.logged_in and self._loaded)
 
     def _set_protected_tabs_state(self, enabled: bool) -> None:
         state = "normal" if enabled else "disabled"
@@ -242,12 +364,18 @@ class GuiApp:
             messagebox.showwarning("Eksik Bilgi", "Kullanıcı adı ve şifre girin.")
             return
 
-        if self._credentials_store.load() is not None:
-            messagebox.showwarning("Kayıt Var", "Kayıt zaten mevcut. Giriş yapın.")
+        if self._credentials_store.has_users() and not self._state.logged_in:
+            messagebox.showwarning(
+                "Kayıt Var", "Yeni kullanıcıyı yalnızca giriş yapmış bir kullanıcı ekleyebilir."
+            )
             return
 
-        self._credentials_store.save(username, password)
-        messagebox.showinfo("Başarılı", "Kullanıcı oluşturuldu. Giriş yapabilirsiniz.")
+        try:
+            self._credentials_store.add_user(username, password)
+        except ValueError as exc:
+            messagebox.showwarning("Kayıt Var", str(exc))
+            return
+        messagebox.showinfo("Başarılı", f"{username} kullanıcısı oluşturuldu.")
         self._username_entry.delete(0, tk.END)
         self._password_entry.delete(0, tk.END)
         self._update_auth_state()
@@ -262,16 +390,48 @@ class GuiApp:
 
         if self._credentials_store.verify(username, password):
             self._state.logged_in = True
-            self._auth_message.configure(text="Giriş başarılı.")
-            self._set_protected_tabs_state(True)
-            self._notebook.select(self._patient_tab)
+            self._password_entry.delete(0, tk.END)
+            self._update_auth_state()
+            if self._loaded:
+                self._auth_message.configure(text="Giriş başarılı.")
+                self._open_patient_tabs()
+            else:
+                self._auth_message.configure(text="Giriş başarılı. Kayıtlar yükleniyor...")
         else:
             messagebox.showerror("Hatalı Giriş", "Bilgiler hatalı. Tekrar deneyin.")
             self._password_entry.delete(0, tk.END)
 
+    def _open_patient_tabs(self) -> None:
+        self._set_protected_tabs_state(True)
+        self._notebook.select(self._patient_tab)
+        self._refresh_agenda()
+
+    def _on_first_paint(self) -> None:
+        self._record_startup("startup.first_paint")
+
+    def _on_service_loaded(self, service: PatientService) -> None:
+        self._service = service
+        self._loaded = True
+        elapsed = self._record_startup("startup.repository_ready")
+        self._refresh_patient_list()
+        self._set_status(f"Kayıtlar {elapsed:.2f} sn içinde yüklendi.")
+        if self._state.logged_in:
+            self._auth_message.configure(text="Giriş başarılı.")
+            self._open_patient_tabs()
+
+    def _on_service_error(self, exc: Exception) -> None:
+        self._set_status("Kayıtlar yüklenemedi.")
+        messagebox.showerror("Yükleme Hatası", f"Kayıtlar yüklenemedi: {exc}")
+
+    def _record_startup(self, name: str) -> float:
+        elapsed = time.perf_counter() - self._started_at
+        if self._metrics is not None:
+            self._metrics.observe(name, elapsed)
+        return elapsed
+
     def _handle_logout(self) -> None:
         self._state.logged_in = False
-        self._set_protected_tabs_state(False)
+        self._update_auth_state()
         self._auth_message.configure(text="Çıkış yapıldı.")
         self._notebook.select(self._login_tab)
 
@@ -287,16 +447,26 @@ class GuiApp:
             messagebox.showwarning("Eksik Bilgi", "Muayene notu girin.")
             return
 
-        try:
-            self._service.add_visit(AddVisitRequest(patient_id=patient_id, note=note))
-        except ValueError as exc:
+        self._note_text.delete("1.0", tk.END)
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M")
+        self._visit_view.set_lines(self._visit_view.lines + [f"[{timestamp}] {note}"])
+
+        def on_success(patient: Patient) -> None:
+            self._patient_view.update_item(patient)
+            if self._state.selected_patient_id == patient_id:
+                self._refresh_visit_list(patient_id)
+            self._set_status("Muayene notu eklendi.")
+
+        def on_error(exc: Exception) -> None:
+            if self._state.selected_patient_id == patient_id:
+                self._refresh_visit_list(patient_id)
             messagebox.showerror("Kayıt Hatası", str(exc))
-            return
 
-        self._note_text.delete("1.0", tk.END)
-        self._refresh_patient_list(selected_id=patient_id)
-        self._refresh_visit_list(patient_id)
-        messagebox.showinfo("Başarılı", "Muayene notu eklendi.")
+        self._submit(
+            lambda: self._service.add_visit(AddVisitRequest(patient_id=patient_id, note=note)),
+            on_success,
+            on_error,
+        )
 
     def _handle_add_appointment(self) -> None:
         patient_id = self._state.selected_patient_id
@@ -315,24 +485,48 @@ class GuiApp:
         except ValueError:
             messagebox.showwarning("Eksik Bilgi", "Tarih formatı YYYY-AA-GG SS:DD olmalı.")
             return
-
         try:
-            self._service.schedule_appointment(
-                ScheduleAppointmentRequest(
-                    patient_id=patient_id,
-                    scheduled_at=scheduled_dt,
-                    note=note,
-                )
+            recurrence = build_recurrence_rule(
+                RECURRENCE_OPTIONS[self._recurrence_choice.get()],
+                count=self._recurrence_count_entry.get(),
+                until=self._recurrence_until_entry.get(),
             )
         except ValueError as exc:
-            messagebox.showerror("Kayıt Hatası", str(exc))
+            messagebox.showwarning("Eksik Bilgi", str(exc))
             return
 
         self._appointment_entry.delete(0, tk.END)
         self._appointment_note_entry.delete(0, tk.END)
-        self._refresh_patient_list(selected_id=patient_id)
-        self._refresh_appointment_list(patient_id)
-        messagebox.showinfo("Başarılı", "Randevu eklendi.")
+        self._recurrence_choice.current(0)
+        self._recurrence_count_entry.delete(0, tk.END)
+        self._recurrence_until_entry.delete(0, tk.END)
+        if recurrence is None:
+            optimistic = f"[{scheduled_dt.strftime('%Y-%m-%d %H:%M')}] {note or '-'}"
+            self._appointment_view.set_lines(sorted(self._appointment_view.lines + [optimistic]))
+
+        def on_success(_patient: Patient) -> None:
+            if self._state.selected_patient_id == patient_id:
+                self._refresh_appointment_list(patient_id)
+            self._refresh_agenda()
+            self._set_status("Randevu eklendi.")
+
+        def on_error(exc: Exception) -> None:
+            if self._state.selected_patient_id == patient_id:
+                self._refresh_appointment_list(patient_id)
+            messagebox.showerror("Kayıt Hatası", str(exc))
+
+        self._submit(
+            lambda: self._service.schedule_appointment(
+                ScheduleAppointmentRequest(
+                    patient_id=patient_id,
+                    scheduled_at=scheduled_dt,
+                    note=note,
+                    recurrence=recurrence,
+                )
+            ),
+            on_success,
+            on_error,
+        )
 
     def _handle_register_patient(self) -> None:
         if not self._state.logged_in:
@@ -354,61 +548,164 @@ class GuiApp:
             messagebox.showwarning("Eksik Bilgi", "Yaş sayısal olmalı.")
             return
 
-        try:
-            self._service.register_patient(
-                RegisterPatientRequest(
-                    patient_id=patient_id,
-                    full_name=full_name,
-                    phone=phone,
-                    age=int(age_text),
-                    gender=gender,
-                )
-            )
-        except ValueError as exc:
+        request = RegisterPatientRequest(
+            patient_id=patient_id,
+            full_name=full_name,
+            phone=phone,
+            age=int(age_text),
+            gender=gender,
+        )
+        form = (
+            (self._patient_id_entry, patient_id),
+            (self._full_name_entry, full_name),
+            (self._phone_entry, phone),
+            (self._age_entry, age_text),
+            (self._gender_entry, self._gender_entry.get().strip()),
+        )
+        for entry, _ in form:
+            entry.delete(0, tk.END)
+
+        def on_success(_patient: Patient) -> None:
+            self._refresh_patient_list(selected_id=self._state.selected_patient_id)
+            self._set_status("Hasta kaydı oluşturuldu.")
+
+        def on_error(exc: Exception) -> None:
+            for entry, value in form:
+                entry.delete(0, tk.END)
+                entry.insert(0, value)
             messagebox.showerror("Kayıt Hatası", str(exc))
-            return
 
-        self._patient_id_entry.delete(0, tk.END)
-        self._full_name_entry.delete(0, tk.END)
-        self._phone_entry.delete(0, tk.END)
-        self._age_entry.delete(0, tk.END)
-        self._gender_entry.delete(0, tk.END)
-        self._refresh_patient_list()
-        messagebox.showinfo("Başarılı", "Hasta kaydı oluşturuldu.")
+        self._submit(lambda: self._service.register_patient(request), on_success, on_error)
+
+    def _submit(
+        self,
+        call: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        self._worker.submit(call, on_success, on_error)
+        self._update_pending_indicator()
+
+    def _read(self, call: Callable[[], Any], on_result: Callable[[Any], None]) -> None:
+        self._worker.submit(call, on_result, self._on_read_error, counted=False)
+
+    def _on_read_error(self, exc: Exception) -> None:
+        self._set_status(f"Kayıtlar okunamadı: {exc}")
+
+    def _poll_worker(self) -> None:
+        if self._worker.poll():
+            self._update_pending_indicator()
+        self._root.after(WORKER_POLL_MS, self._poll_worker)
+
+    def _update_pending_indicator(self) -> None:
+        pending = self._worker.pending
+        if not self._loaded:
+            self._pending_label.configure(text="Kayıtlar yükleniyor...")
+        elif pending:
+            self._pending_label.configure(text=f"Kaydedilmeyi bekleyen işlem: {pending}")
+        else:
+            self._pending_label.configure(text="Tüm değişiklikler kaydedildi.")
+
+    def _set_status(self, message: str) -> None:
+        self._status_label.configure(text=message)
+
+    def _on_close(self) -> None:
+        if self._worker.pending:
+            self._pending_label.configure(text="Bekleyen değişiklikler kaydediliyor...")
+            self._root.update_idletasks()
+        self._worker.shutdown()
+        self._root.destroy()
 
     def _refresh_patient_list(self, selected_id: str | None = None) -> None:
-        for item in self._tree.get_children():
-            self._tree.delete(item)
-
-        query = self._filter_var.get().lower().strip() if hasattr(self, "_filter_var") else ""
-        patients = list(self._service.list_patients())
-        for patient in patients:
-            if query and query not in patient.full_name.lower() and query not in patient.patient_id.lower():
-                continue
-            values = (
-                patient.patient_id,
-                patient.full_name,
-                str(patient.age),
-                patient.gender,
-                patient.phone,
-                str(len(patient.visits)),
+        self._list_generation += 1
+        query = self._filter_query()
+        if query:
+            self._read(
+                lambda: self._service.search(query, limit=SEARCH_LIMIT),
+                lambda patients: self._show_search_results(query, patients, selected_id),
             )
-            self._tree.insert("", tk.END, iid=patient.patient_id, values=values)
+            return
+        self._refresh_window(self._patient_view.offset, selected_id)
+
+    def _refresh_window(self, start: int, selected_id: str | None) -> None:
+        generation = self._list_generation
+        after = cursor_for(self._patient_view.item_at(start - 1)) if start else None
+        limit = self._patient_view.visible_rows
+        self._read(
+            lambda: self._service.list_patients_page(after, limit),
+            lambda page: self._show_window(generation, start, page, selected_id),
+        )
+
+    def _show_window(
+        self, generation: int, start: int, page: PatientPage, selected_id: str | None
+    ) -> None:
+        if generation != self._list_generation:
+            return
+        self._next_cursor = page.next_cursor
+        self._patient_view.replace_from(start, page.patients)
+        if start and selected_id and not self._patient_view.contains(selected_id):
+            self._refresh_window(0, selected_id)
+            return
+        self._select_patient(selected_id)
+
+    def _filter_query(self) -> str:
+        return self._filter_var.get().strip() if hasattr(self, "_filter_var") else ""
+
+    def _show_search_results(
+        self, query: str, patients: list[Patient], selected_id: str | None
+    ) -> None:
+        if query != self._filter_query():
+            return
+        self._next_cursor = None
+        self._show_patients(patients, selected_id)
+
+    def _show_patients(self, patients: list[Patient], selected_id: str | None) -> None:
+        self._patient_view.set_items(patients)
+        self._select_patient(selected_id)
 
-        if selected_id and self._tree.exists(selected_id):
-            self._tree.selection_set(selected_id)
-            self._tree.see(selected_id)
+    def _select_patient(self, selected_id: str | None) -> None:
+        if selected_id and self._patient_view.contains(selected_id):
+            self._patient_view.select(selected_id)
             self._state.selected_patient_id = selected_id
             self._selected_label.configure(text=selected_id)
             self._appointment_selected_label.configure(text=selected_id)
             self._refresh_visit_list(selected_id)
             self._refresh_appointment_list(selected_id)
         else:
+            self._patient_view.select(None)
             self._state.selected_patient_id = None
             self._selected_label.configure(text="-")
             self._appointment_selected_label.configure(text="-")
-            self._visit_list.delete(0, tk.END)
-            self._appointment_list.delete(0, tk.END)
+            self._visit_view.clear()
+            self._appointment_view.clear()
+
+    def _load_next_page(self) -> None:
+        cursor = self._next_cursor
+        if cursor is None:
+            return
+        self._next_cursor = None
+        generation = self._list_generation
+        self._read(
+            lambda: self._service.list_patients_page(cursor, LIST_PAGE_SIZE),
+            lambda page: self._append_page(generation, page),
+        )
+
+    def _append_page(self, generation: int, page: PatientPage) -> None:
+        if generation != self._list_generation:
+            return
+        self._next_cursor = page.next_cursor
+        self._patient_view.extend(page.patients)
+
+    @staticmethod
+    def _patient_row(patient: Patient) -> tuple[str, ...]:
+        return (
+            patient.patient_id,
+            patient.full_name,
+            str(patient.age),
+            patient.gender,
+            patient.phone,
+            str(len(patient.visits)),
+        )
 
     def _on_patient_select(self, _event: tk.Event) -> None:
         selected = self._tree.selection()
@@ -421,30 +718,94 @@ class GuiApp:
         self._refresh_visit_list(patient_id)
         self._refresh_appointment_list(patient_id)
 
+    def _search_notes(self) -> None:
+        query = self._note_query_entry.get().strip()
+        if not query:
+            self._note_result_ids = []
+            self._note_result_view.clear()
+            return
+        self._read(
+            lambda: self._service.search_notes(query, limit=NOTE_SEARCH_LIMIT),
+            lambda hits: self._show_note_hits(query, hits),
+        )
+
+    def _show_note_hits(self, query: str, hits: list[NoteHit]) -> None:
+        if query != self._note_query_entry.get().strip():
+            return
+        self._note_result_ids = [hit.patient_id for hit in hits]
+        self._note_result_view.set_lines(
+            [
+                f"{hit.patient_id} | {hit.full_name} | "
+                f"[{hit.created_at.strftime('%Y-%m-%d %H:%M')}] {hit.note}"
+                for hit in hits
+            ]
+            or ["Eşleşen not bulunamadı."]
+        )
+
+    def _on_note_result_select(self, _event: tk.Event) -> None:
+        selection = self._note_result_list.curselection()
+        if not selection or selection[0] >= len(self._note_result_ids):
+            return
+        patient_id = self._note_result_ids[selection[0]]
+        self._filter_var.set(patient_id)
+        self._refresh_patient_list(selected_id=patient_id)
+
     def _on_filter_change(self, _event: tk.Event) -> None:
+        if self._filter_job is not None:
+            self._root.after_cancel(self._filter_job)
+        self._filter_job = self._root.after(FILTER_DEBOUNCE_MS, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_job = None
         self._refresh_patient_list(selected_id=self._state.selected_patient_id)
 
     def _refresh_visit_list(self, patient_id: str) -> None:
-        self._visit_list.delete(0, tk.END)
-        patient = next(
-            (item for item in self._service.list_patients() if item.patient_id == patient_id),
-            None,
+        self._read(
+            lambda: self._service.get_patient(patient_id),
+            lambda patient: self._show_visits(patient_id, patient),
         )
+
+    def _show_visits(self, patient_id: str, patient: Patient | None) -> None:
+        if patient_id != self._state.selected_patient_id:
+            return
         if not patient:
+            self._visit_view.clear()
             return
+        lines = []
         for visit in patient.visits:
             timestamp = visit.created_at.strftime("%Y-%m-%d %H:%M")
-            self._visit_list.insert(tk.END, f"[{timestamp}] {visit.note}")
+            lines.append(f"[{timestamp}] {visit.note}")
+        self._visit_view.set_lines(lines)
 
     def _refresh_appointment_list(self, patient_id: str) -> None:
-        self._appointment_list.delete(0, tk.END)
-        patient = next(
-            (item for item in self._service.list_patients() if item.patient_id == patient_id),
-            None,
+        self._read(
+            lambda: self._service.patient_appointments(patient_id, series_from=datetime.now()),
+            lambda appointments: self._show_appointments(patient_id, appointments),
         )
-        if not patient:
+
+    def _show_appointments(self, patient_id: str, appointments: list[Appointment]) -> None:
+        if patient_id != self._state.selected_patient_id:
             return
-        for appointment in sorted(patient.appointments, key=lambda item: item.scheduled_at):
+        lines = []
+        for appointment in appointments:
             timestamp = appointment.scheduled_at.strftime("%Y-%m-%d %H:%M")
             note = appointment.note or "-"
-            self._appointment_list.insert(tk.END, f"[{timestamp}] {note}")
+            lines.append(f"[{timestamp}] {note}")
+        self._appointment_view.set_lines(lines)
+
+    def _refresh_agenda(self) -> None:
+        try:
+            day = datetime.strptime(self._agenda_date_entry.get().strip(), "%Y-%m-%d")
+        except ValueError:
+            messagebox.showwarning("Eksik Bilgi", "Tarih formatı YYYY-AA-GG olmalı.")
+            return
+        days = 7 if self._agenda_span.get() == "Hafta" else 1
+        self._read(lambda: self._service.agenda(day, day + timedelta(days=days)), self._show_agenda)
+
+    def _show_agenda(self, entries: list[AgendaEntry]) -> None:
+        lines = []
+        for entry in entries:
+            timestamp = entry.scheduled_at.strftime("%Y-%m-%d %H:%M")
+            note = entry.note or "-"
+            lines.append(f"[{timestamp}] {entry.patient_id} | {entry.full_name} | {note}")
+        self._agenda_view.set_lines(lines or ["Bu aralıkta randevu yok."])
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTreeview(Generic[T]):
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        key: Callable[[T], str],
+        render: Callable[[T], Tuple[str, ...]],
+        scrollbar: Optional[ttk.Scrollbar] = None,
+        on_reach_end: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._tree = tree
+        self._key = key
+        self._render = render
+        self._scrollbar = scrollbar
+        self._on_reach_end = on_reach_end
+        self._items: Sequence[T] = []
+        self._positions: Dict[str, int] = {}
+        self._rendered: Dict[str, Tuple[str, ...]] = {}
+        self._offset = 0
+        self._selected: Optional[str] = None
+        self._visible_rows = int(tree.cget("height"))
+        if scrollbar is not None:
+            scrollbar.configure(command=self._on_scrollbar)
+        tree.bind("<Configure>", self._on_configure, add="+")
+        tree.bind("<MouseWheel>", self._on_mouse_wheel, add="+")
+        tree.bind("<Button-4>", lambda _event: self._scroll_by(-3), add="+")
+        tree.bind("<Button-5>", lambda _event: self._scroll_by(3), add="+")
+        tree.bind("<Down>", lambda _event: self._step_selection(1))
+        tree.bind("<Up>", lambda _event: self._step_selection(-1))
+        tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    @property
+    def visible_rows(self) -> int:
+        return self._visible_rows
+
+    def item_at(self, position: int) -> T:
+        return self._items[position]
+
+    def set_items(self, items: Sequence[T]) -> None:
+        self._items = items
+        self._positions = {self._key(item): index for index, item in enumerate(items)}
+        self._offset = min(self._offset, self._max_offset())
+        self._render_window()
+
+    def replace_from(self, start: int, items: Sequence[T]) -> None:
+        self.set_items([*self._items[:start], *items])
+
+    def extend(self, items: Sequence[T]) -> None:
+        if not isinstance(self._items, list):
+            self._items = list(self._items)
+        start = len(self._items)
+        self._items.extend(items)
+        for index, item in enumerate(items, start):
+            self._positions[self._key(item)] = index
+        self._render_window()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def update_item(self, item: T) -> None:
+        iid = self._key(item)
+        position = self._positions.get(iid)
+        if position is None:
+            return
+        if isinstance(self._items, list):
+            self._items[position] = item
+        if iid in self._rendered:
+            values = self._render(item)
+            if values != self._rendered[iid]:
+                self._tree.item(iid, values=values)
+                self._rendered[iid] = values
+
+    def contains(self, iid: str) -> bool:
+        return iid in self._positions
+
+    def see(self, iid: str) -> None:
+        position = self._positions.get(iid)
+        if position is None:
+            return
+        if position < self._offset:
+            self._scroll_to(position)
+        elif position >= self._offset + self._visible_rows:
+            self._scroll_to(position - self._visible_rows + 1)
+
+    def select(self, iid: str | None) -> None:
+        self._selected = iid
+        if iid is None:
+            self._tree.selection_remove(*self._tree.selection())
+            return
+        self.see(iid)
+        if iid in self._rendered:
+            self._tree.selection_set(iid)
+            self._tree.focus(iid)
+
+    def _render_window(self) -> None:
+        window = self._items[self._offset:self._offset + self._visible_rows]
+        wanted = [(self._key(item), item) for item in window]
+        wanted_ids = {iid for iid, _ in wanted}
+        stale = [iid for iid in self._rendered if iid not in wanted_ids]
+        if stale:
+            self._tree.delete(*stale)
+            for iid in stale:
+                del self._rendered[iid]
+        for index, (iid, item) in enumerate(wanted):
+            values = self._render(item)
+            current = self._rendered.get(iid)
+            if current is None:
+                self._tree.insert("", index, iid=iid, values=values)
+            else:
+                if current != values:
+                    self._tree.item(iid, values=values)
+                if self._tree.index(iid) != index:
+                    self._tree.move(iid, "", index)
+            self._rendered[iid] = values
+        if self._selected in wanted_ids and self._selected not in self._tree.selection():
+            self._tree.selection_set(self._selected)
+        self._update_scrollbar()
+        near_end = self._offset + 2 * self._visible_rows >= len(self._items)
+        if near_end and self._on_reach_end is not None:
+            self._on_reach_end()
+
+    def _update_scrollbar(self) -> None:
+        if self._scrollbar is None:
+            return
+        total = len(self._items)
+        if total == 0:
+            self._scrollbar.set(0.0, 1.0)
+            return
+        first = self._offset / total
+        last = min(1.0, (self._offset + self._visible_rows) / total)
+        self._scrollbar.set(first, last)
+
+    def _max_offset(self) -> int:
+        return max(0, len(self._items) - self._visible_rows)
+
+    def _scroll_to(self, offset: int) -> None:
+        offset = max(0, min(offset, self._max_offset()))
+        if offset != self._offset:
+            self._offset = offset
+            self._render_window()
+
+    def _scroll_by(self, rows: int) -> str:
+        self._scroll_to(self._offset + rows)
+        return "break"
+
+    def _on_scrollbar(self, action: str, amount: str, unit: str | None = None) -> None:
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * len(self._items)))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mouse_wheel(self, event: tk.Event) -> str:
+        return self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_configure(self, event: tk.Event) -> None:
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT
+        rows = max(int(self._tree.cget("height")), int(event.height) // int(row_height) - 1)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._offset = min(self._offset, self._max_offset())
+            self._render_window()
+
+    def _on_select(self, _event: tk.Event) -> None:
+        selection = self._tree.selection()
+        if selection:
+            self._selected = selection[0]
+
+    def _step_selection(self, step: int) -> str | None:
+        focused = self._tree.focus()
+        position = self._positions.get(focused)
+        if position is None:
+            return None
+        target = position + step
+        if not 0 <= target < len(self._items):
+            return "break"
+        iid = self._key(self._items[target])
+        self.select(iid)
+        self._tree.event_generate("<<TreeviewSelect>>")
+        return "break"
+
+
+class ListboxView:
+    def __init__(self, listbox: tk.Listbox) -> None:
+        self._listbox = listbox
+        self._lines: List[str] = []
+
+    @property
+    def lines(self) -> List[str]:
+        return list(self._lines)
+
+    def set_lines(self, lines: Sequence[str]) -> None:
+        common = 0
+        limit = min(len(self._lines), len(lines))
+        while common < limit and self._lines[common] == lines[common]:
+            common += 1
+        if common < len(self._lines):
+            self._listbox.delete(common, tk.END)
+        if common < len(lines):
+            self._listbox.insert(tk.END, *lines[common:])
+        self._lines = list(lines)
+
+    def clear(self) -> None:
+        self.set_lines([])
@@ -1,16 +1,30 @@
 from __future__ import annotations
 
+import argparse
+from typing import List, Optional
+
 from app.application.use_cases import PatientService
-from app.config import get_data_path
-from app.infrastructure.json_repository import JsonPatientRepository
+from app.config import get_storage_settings
+from app.infrastructure.factory import create_repository
 from app.interface.cli import CliApp
+from app.profiling import create_metrics, instrument_service, print_report
 
 
-def main() -> None:
-    repository = JsonPatientRepository(get_data_path())
-    service = PatientService(repository)
-    app = CliApp(service)
-    app.run()
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Hasta Kayıt Sistemi")
+    parser.add_argument(
+        "--profile", action="store_true", help="İşlem sürelerini ölç ve çıkışta raporla"
+    )
+    args = parser.parse_args(argv)
+    metrics = create_metrics(args.profile)
+    repository = create_repository(get_storage_settings(), metrics)
+    service = instrument_service(PatientService(repository), metrics)
+    app = CliApp(service, metrics)
+    try:
+        app.run()
+    finally:
+        repository.close()
+        print_report(metrics)
 
 
 if __name__ == "__main__":
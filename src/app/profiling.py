@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import sys
+from typing import Optional
+
+from app.application.use_cases import PatientService
+from app.config import get_profiling_settings
+from app.infrastructure.instrumentation import Metrics, instrument
+
+SERVICE_OPERATIONS = (
+    "register_patient",
+    "list_patients",
+    "list_patients_page",
+    "get_patient",
+    "search",
+    "search_notes",
+    "query",
+    "query_with_plan",
+    "explain_query",
+    "add_visit",
+    "schedule_appointment",
+    "agenda",
+    "patient_appointments",
+    "next_appointment",
+)
+
+
+def create_metrics(profile: bool = False) -> Optional[Metrics]:
+    settings = get_profiling_settings(force=profile)
+    if not settings.enabled:
+        return None
+    return Metrics(slow_threshold_ms=settings.slow_threshold_ms)
+
+
+def instrument_service(service: PatientService, metrics: Optional[Metrics]) -> PatientService:
+    if metrics is not None:
+        instrument(service, metrics, "service", SERVICE_OPERATIONS)
+    return service
+
+
+def print_report(metrics: Optional[Metrics]) -> None:
+    if metrics is not None:
+        print("\nPerformans istatistikleri", file=sys.stderr)
+        print(metrics.report(), file=sys.stderr)
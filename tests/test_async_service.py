@@ -0,0 +1,140 @@
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from app.application.async_service import AsyncPatientService
+from app.application.use_cases import AddVisitRequest, PatientService, RegisterPatientRequest
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+class _TrackingService(PatientService):
+    def __init__(self, repository: JsonPatientRepository) -> None:
+        super().__init__(repository)
+        self._guard = threading.Lock()
+        self.active: Counter = Counter()
+        self.max_per_patient = 0
+        self.max_overall = 0
+
+    def add_visit(self, request: AddVisitRequest) -> Patient:
+        with self._guard:
+            self.active[request.patient_id] += 1
+            self.max_per_patient = max(self.max_per_patient, self.active[request.patient_id])
+            self.max_overall = max(self.max_overall, sum(self.active.values()))
+        try:
+            time.sleep(0.001)
+            return super().add_visit(request)
+        finally:
+            with self._guard:
+                self.active[request.patient_id] -= 1
+
+
+class _BlockingService(PatientService):
+    def __init__(self, repository: JsonPatientRepository) -> None:
+        super().__init__(repository)
+        self.release = threading.Event()
+
+    def add_visit(self, request: AddVisitRequest) -> Patient:
+        self.release.wait(5)
+        return super().add_visit(request)
+
+
+class TestAsyncPatientService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self._path = Path(self._temp_dir.name) / "patients.json"
+
+    async def test_concurrent_writes_are_serialized_per_patient(self) -> None:
+        service = _TrackingService(JsonPatientRepository(self._path))
+        async with AsyncPatientService(service, max_readers=4, max_writers=4) as facade:
+            patient_ids = [f"P-{number}" for number in range(8)]
+            await asyncio.gather(
+                *(
+                    facade.register_patient(
+                        RegisterPatientRequest(patient_id, patient_id, "1", 40, "Kadın")
+                    )
+                    for patient_id in patient_ids
+                )
+            )
+            writes = [
+                facade.add_visit(AddVisitRequest(patient_id, f"kontrol {round_number}"))
+                for round_number in range(25)
+                for patient_id in patient_ids
+            ]
+            reads = [facade.search_notes("kontrol", limit=5) for _ in range(50)]
+            results = await asyncio.gather(*writes, *reads)
+
+            self.assertEqual(len(results), 250)
+            self.assertEqual(service.max_per_patient, 1)
+            self.assertGreater(service.max_overall, 1)
+            for patient_id in patient_ids:
+                patient = await facade.get_patient(patient_id)
+                assert patient is not None
+                self.assertEqual(len(patient.visits), 25)
+            hits = await facade.search_notes("kontrol", limit=1000)
+            self.assertEqual(len(hits), 200)
+
+            patient = await asyncio.wait_for(
+                facade.add_visit(AddVisitRequest(patient_ids[0], "son")), timeout=5
+            )
+            self.assertEqual(len(patient.visits), 26)
+            stored = await facade.get_patient(patient_ids[0])
+            assert stored is not None
+            self.assertEqual(stored.visits[-1].note, "son")
+
+    async def test_duplicate_registration_fails_once(self) -> None:
+        async with AsyncPatientService(PatientService(JsonPatientRepository(self._path))) as facade:
+            request = RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın")
+            results = await asyncio.gather(
+                *(facade.register_patient(request) for _ in range(20)), return_exceptions=True
+            )
+
+        errors = [result for result in results if isinstance(result, ValueError)]
+        self.assertEqual(len(errors), 19)
+        self.assertEqual(str(errors[0]), "Bu hasta numarası zaten kayıtlı.")
+
+    async def test_reads_do_not_wait_behind_blocked_writes(self) -> None:
+        service = _BlockingService(JsonPatientRepository(self._path))
+        service.register_patient(RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın"))
+        async with AsyncPatientService(service, max_writers=1) as facade:
+            writes = [
+                asyncio.ensure_future(facade.add_visit(AddVisitRequest("P-1", f"not {number}")))
+                for number in range(3)
+            ]
+            await asyncio.sleep(0.01)
+
+            patient = await asyncio.wait_for(facade.get_patient("P-1"), timeout=1)
+            page = await asyncio.wait_for(facade.list_patients_page(limit=10), timeout=1)
+            self.assertIsNotNone(patient)
+            self.assertEqual(len(page.patients), 1)
+            self.assertFalse(any(write.done() for write in writes))
+
+            service.release.set()
+            await asyncio.gather(*writes)
+            patient = await facade.get_patient("P-1")
+            assert patient is not None
+            self.assertEqual(len(patient.visits), 3)
+
+    async def test_cancelled_write_keeps_the_patient_locked_until_it_finishes(self) -> None:
+        service = _BlockingService(JsonPatientRepository(self._path))
+        service.register_patient(RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın"))
+        async with AsyncPatientService(service, max_writers=2) as facade:
+            first = asyncio.ensure_future(facade.add_visit(AddVisitRequest("P-1", "birinci")))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            second = asyncio.ensure_future(facade.add_visit(AddVisitRequest("P-1", "ikinci")))
+            await asyncio.sleep(0.01)
+            self.assertFalse(second.done())
+
+            service.release.set()
+            patient = await second
+            self.assertEqual([visit.note for visit in patient.visits], ["birinci", "ikinci"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from app.application.attribute_index import PatientAttributeIndex, PatientQuery
+from app.application.use_cases import AddVisitRequest, PatientService, RegisterPatientRequest
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+_NOW = datetime(2024, 6, 3, 9, 0)
+
+
+def _patient(patient_id: str, name: str, age: int, gender: str) -> Patient:
+    return Patient(patient_id=patient_id, full_name=name, phone="1", age=age, gender=gender)
+
+
+def _clinic() -> list:
+    ayse = _patient("P-1", "Ayşe Kaya", 67, "Kadın")
+    ayse.add_visit(note="kontrol", created_at=_NOW - timedelta(days=500))
+    fatma = _patient("P-2", "Fatma Er", 72, "kadın")
+    fatma.add_visit(note="kontrol", created_at=_NOW - timedelta(days=30))
+    zehra = _patient("P-3", "Zehra Işık", 61, "KADIN")
+    zehra.add_appointment(scheduled_at=_NOW + timedelta(days=2), note="tahlil")
+    ali = _patient("P-4", "Ali Demir", 65, "Erkek")
+    ali.add_appointment(scheduled_at=_NOW + timedelta(days=3), note="kontrol")
+    ali.add_appointment(scheduled_at=_NOW + timedelta(days=30), note="kontrol")
+    deniz = _patient("P-5", "Deniz Can", 30, "Kadın")
+    return [ayse, fatma, zehra, ali, deniz]
+
+
+class TestPatientAttributeIndex(unittest.TestCase):
+    def test_women_over_sixty_without_recent_visit(self) -> None:
+        index = PatientAttributeIndex(_clinic())
+        spec = PatientQuery(min_age=60, gender="Kadın", not_visited_since=_NOW - timedelta(days=365))
+
+        patient_ids, plan = index.query(spec)
+
+        self.assertEqual(patient_ids, ["P-1", "P-3"])
+        self.assertEqual([step.index for step in plan.steps], ["yaş", "cinsiyet", "son muayene"])
+        self.assertEqual([step.method for step in plan.steps], ["indeks", "süzme", "süzme"])
+        self.assertEqual(plan.steps[-1].remaining, 2)
+
+    def test_appointments_this_week_use_the_most_selective_index_first(self) -> None:
+        index = PatientAttributeIndex(_clinic())
+        spec = PatientQuery(
+            gender="kadın", appointment_from=_NOW, appointment_until=_NOW + timedelta(days=7)
+        )
+
+        patient_ids, plan = index.query(spec)
+
+        self.assertEqual(patient_ids, ["P-3"])
+        self.assertEqual(plan.steps[0].index, "randevu")
+        self.assertEqual(plan.steps[0].estimated, 2)
+        self.assertEqual(len(plan.describe()), 2)
+
+    def test_add_replaces_and_remove_forgets_entries(self) -> None:
+        patients = _clinic()
+        index = PatientAttributeIndex(patients)
+        ali = patients[3]
+        ali.age = 40
+        index.add(ali)
+        index.remove("P-1")
+
+        patient_ids, _ = index.query(PatientQuery(min_age=60))
+
+        self.assertEqual(patient_ids, ["P-2", "P-3"])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.query(PatientQuery())[1].describe(), ["Koşul yok: tüm hastalar (4)"])
+
+
+class TestPatientServiceQuery(unittest.TestCase):
+    def test_query_reflects_changes_made_through_the_service(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            service.register_patient(RegisterPatientRequest("P-1", "Ayşe Kaya", "1", 67, "Kadın"))
+            cutoff = datetime.utcnow() - timedelta(days=365)
+            spec = PatientQuery(min_age=60, gender="Kadın", not_visited_since=cutoff)
+            self.assertEqual([patient.patient_id for patient in service.query(spec)], ["P-1"])
+
+            service.register_patient(RegisterPatientRequest("P-2", "Fatma Er", "1", 70, "Kadın"))
+            service.add_visit(AddVisitRequest("P-1", "kontrol"))
+
+            self.assertEqual([patient.patient_id for patient in service.query(spec)], ["P-2"])
+            self.assertEqual(service.explain_query(spec).total, 2)
+            patients, plan = service.query_with_plan(spec, limit=1)
+            self.assertEqual([patient.patient_id for patient in patients], ["P-2"])
+            self.assertEqual(plan.total, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import threading
+import unittest
+
+from app.interface.background import ServiceWorker
+
+
+class TestServiceWorker(unittest.TestCase):
+    def test_calls_run_off_thread_and_callbacks_run_on_poll(self) -> None:
+        worker = ServiceWorker()
+        threads = []
+        results = []
+        errors = []
+
+        def failing() -> None:
+            raise ValueError("Hasta bulunamadı.")
+
+        worker.submit(lambda: threads.append(threading.current_thread()) or 42, results.append, errors.append)
+        worker.submit(failing, results.append, errors.append)
+        worker.submit(lambda: "okuma", results.append, errors.append, counted=False)
+        self.assertEqual(worker.pending, 2)
+
+        worker.flush()
+        self.assertEqual(worker.pending, 0)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(results, [42, "okuma"])
+        self.assertEqual(str(errors[0]), "Hasta bulunamadı.")
+        worker.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from benchmarks.suite import Regression, compare_results
+
+
+def _results(**scales: dict) -> dict:
+    return {"results": scales}
+
+
+class TestCompareResults(unittest.TestCase):
+    def test_only_slowdowns_over_the_threshold_are_reported(self) -> None:
+        baseline = _results(**{"1000": {"load_s": 1.0, "add_visit_ms": 2.0, "search_ms": 4.0}})
+        current = _results(**{"1000": {"load_s": 1.2, "add_visit_ms": 2.6, "search_ms": 1.0}})
+
+        regressions = compare_results(current, baseline, threshold=0.25)
+
+        self.assertEqual(regressions, [Regression("1000", "add_visit_ms", 2.0, 2.6)])
+        self.assertAlmostEqual(regressions[0].ratio, 1.3)
+
+    def test_threshold_boundary_is_not_a_regression(self) -> None:
+        baseline = _results(**{"1000": {"load_s": 1.0}})
+
+        at_limit = _results(**{"1000": {"load_s": 1.25}})
+        over_limit = _results(**{"1000": {"load_s": 1.26}})
+
+        self.assertEqual(compare_results(at_limit, baseline, 0.25), [])
+        self.assertEqual(len(compare_results(over_limit, baseline, 0.25)), 1)
+
+    def test_missing_operations_and_scales_are_skipped(self) -> None:
+        baseline = _results(**{"1000": {"load_s": 1.0, "removed_ms": 1.0}})
+        current = _results(
+            **{
+                "1000": {"load_s": 1.0, "new_operation_ms": 50.0},
+                "10000": {"load_s": 90.0},
+            }
+        )
+
+        self.assertEqual(compare_results(current, baseline, threshold=0.25), [])
+
+    def test_file_size_is_not_compared(self) -> None:
+        baseline = _results(**{"1000": {"file_bytes": 100.0}})
+        current = _results(**{"1000": {"file_bytes": 500.0}})
+
+        self.assertEqual(compare_results(current, baseline, threshold=0.25), [])
+
+    def test_zero_baseline_has_infinite_ratio(self) -> None:
+        regressions = compare_results(
+            _results(**{"1000": {"load_s": 0.1}}), _results(**{"1000": {"load_s": 0.0}}), 0.25
+        )
+
+        self.assertEqual(regressions[0].ratio, float("inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
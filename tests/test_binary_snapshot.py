@@ -0,0 +1,70 @@
+import os
+import struct
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from app.domain.entities import Appointment, Patient, Visit
+from app.domain.records import PackedVisits
+from app.infrastructure.binary_repository import BinaryPatientRepository
+from app.infrastructure.binary_snapshot import MAGIC, read_snapshot, write_snapshot
+from app.infrastructure.journal import FSYNC_ON_CLOSE, JournalOptions
+
+
+def _patient(patient_id: str, name: str) -> Patient:
+    patient = Patient(patient_id=patient_id, full_name=name, phone="555", age=40, gender="Kadın")
+    patient.visits.append(Visit(note="Kontrol", created_at=datetime(2024, 1, 1, 10, 0, 0, 12)))
+    patient.visits.append(Visit(note="Kontrol", created_at=datetime(1969, 12, 31, 23, 59)))
+    patient.appointments.append(Appointment(scheduled_at=datetime(2024, 1, 2, 9, 30), note="İğne"))
+    return patient
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    def test_snapshot_round_trip_shares_repeated_strings(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.bin"
+            patients = [_patient("P-1", "Ada Lovelace"), _patient("P-2", "Şule Çınar")]
+            with patch("app.infrastructure.durable_files.os.fsync", wraps=os.fsync) as fsync:
+                write_snapshot(path, patients)
+            self.assertEqual(fsync.call_count, 2)
+
+            self.assertTrue(path.read_bytes().startswith(MAGIC))
+            self.assertEqual(path.read_bytes().count("Kontrol".encode("utf-8")), 1)
+            loaded = read_snapshot(path)
+            self.assertEqual(loaded, patients)
+            self.assertIs(loaded[0].gender, loaded[1].gender)
+            self.assertIs(loaded[0].visits[0].note, loaded[1].visits[1].note)
+
+            packed = read_snapshot(path, packed=True)
+            self.assertIsInstance(packed[0].visits, PackedVisits)
+            self.assertEqual(list(packed[1].visits), patients[1].visits)
+
+            data = bytearray(path.read_bytes())
+            struct.pack_into("<H", data, 4, 99)
+            path.write_bytes(bytes(data))
+            with self.assertRaises(ValueError):
+                read_snapshot(path)
+
+    def test_repository_replays_journal_on_top_of_binary_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.bin"
+            options = JournalOptions(fsync_policy=FSYNC_ON_CLOSE, background_compaction=False)
+            repo = BinaryPatientRepository(path, journal=options)
+            repo.add(_patient("P-1", "Ada Lovelace"))
+            repo.compact()
+            repo.add(_patient("P-2", "Grace Hopper"))
+            repo.close()
+
+            reloaded = BinaryPatientRepository(path, journal=options)
+            self.assertEqual(
+                [patient.patient_id for patient in reloaded.list_all()], ["P-1", "P-2"]
+            )
+            self.assertEqual(reloaded.get("P-2"), _patient("P-2", "Grace Hopper"))
+            self.assertEqual([patient.patient_id for patient in read_snapshot(path)], ["P-1"])
+            reloaded.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.application.importing import BulkImporter, parse_records, read_csv, read_jsonl
+from app.application.use_cases import PatientService
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+class TestBulkImport(unittest.TestCase):
+    def test_jsonl_import_commits_in_batches_and_reports_rejects(self) -> None:
+        source = io.StringIO(
+            '{"patient_id": "P-1", "full_name": "Ada Lovelace", "phone": "555", "age": 36, '
+            '"visits": [{"note": "İlk", "created_at": "2024-01-01T09:00:00"}]}\n'
+            '{"patient_id": "P-2", "full_name": "Grace Hopper", "age": "kırk"}\n'
+            "\n"
+            '{"type": "appointment", "patient_id": "P-1", "scheduled_at": "2024-02-01T10:00:00"}\n'
+            '{"type": "visit", "patient_id": "P-9", "note": "Yok"}\n'
+            '{"type": "appointment", "patient_id": "P-1", "scheduled_at": "dün"}\n'
+            '{"patient_id": "P-3", "full_name": \n'
+            "[1, 2]\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = JsonPatientRepository(Path(temp_dir) / "patients.json")
+            rejects = []
+            report = BulkImporter(PatientService(repo), batch_size=2, on_reject=rejects.append).run(
+                parse_records(read_jsonl(source))
+            )
+
+            self.assertEqual(report.accepted, 2)
+            self.assertEqual(report.rejected, 5)
+            self.assertEqual(report.batches, 4)
+            self.assertEqual(
+                [(item.line, item.message) for item in rejects],
+                [
+                    (2, "Yaş sayısal olmalı."),
+                    (5, "Hasta bulunamadı."),
+                    (6, "Tarih formatı geçersiz."),
+                    (7, "Geçersiz JSON: Expecting value"),
+                    (8, "Kayıt bir JSON nesnesi olmalı."),
+                ],
+            )
+
+            reloaded = JsonPatientRepository(Path(temp_dir) / "patients.json").get("P-1")
+            assert reloaded is not None
+            self.assertEqual(reloaded.visits[0].created_at, datetime(2024, 1, 1, 9, 0))
+            self.assertEqual(reloaded.appointments[0].scheduled_at, datetime(2024, 2, 1, 10, 0))
+
+    def test_reimporting_a_file_rejects_whole_records(self) -> None:
+        source = (
+            '{"patient_id": "P-1", "full_name": "Ada Lovelace", "age": 36, '
+            '"visits": [{"note": "İlk", "created_at": "2024-01-01T09:00:00"}], '
+            '"appointments": [{"scheduled_at": "2024-02-01T10:00:00"}]}\n'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            first = BulkImporter(service).run(parse_records(read_jsonl(io.StringIO(source))))
+            second = BulkImporter(service).run(parse_records(read_jsonl(io.StringIO(source))))
+
+            self.assertEqual((first.accepted, first.rejected), (1, 0))
+            self.assertEqual((second.accepted, second.rejected), (0, 1))
+            self.assertEqual(second.rejects[0].message, "Bu hasta numarası zaten kayıtlı.")
+            patient = service.get_patient("P-1")
+            assert patient is not None
+            self.assertEqual(len(patient.visits), 1)
+            self.assertEqual(len(patient.appointments), 1)
+            self.assertEqual(len(service.search_notes("ilk")), 1)
+
+    def test_wrong_typed_fields_reject_only_their_line(self) -> None:
+        source = io.StringIO(
+            '{"patient_id": "P-1", "full_name": "Ada", "age": 36, "visits": [1]}\n'
+            '{"patient_id": "P-2", "full_name": "Grace", "age": 40, "appointments": 5}\n'
+            '{"type": "series", "patient_id": "P-3", "starts_at": "2024-01-01T09:00:00", '
+            '"frequency": "weekly", "interval": "iki"}\n'
+            '{"type": "series", "patient_id": "P-3", "starts_at": "2024-01-01T09:00:00", '
+            '"frequency": "weekly", "weekdays": [{"gün": 1}]}\n'
+            '{"type": "series", "patient_id": "P-3", "starts_at": "2024-01-01T09:00:00", '
+            '"frequency": "weekly", "exceptions": 7}\n'
+            '{"type": "appointment", "patient_id": "P-3", "scheduled_at": ["2024"]}\n'
+            '{"patient_id": "P-3", "full_name": "Linus", "age": 50, "recurring": [{"starts_at": '
+            '"2024-01-01T09:00:00", "frequency": "weekly", "interval": null}]}\n'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            report = BulkImporter(service).run(parse_records(read_jsonl(source)))
+
+            self.assertEqual((report.accepted, report.rejected), (1, 6))
+            self.assertEqual(
+                [(item.line, item.message) for item in report.rejects],
+                [
+                    (1, "'visits' alanı JSON nesnelerinden oluşan bir liste olmalı."),
+                    (2, "'appointments' alanı JSON nesnelerinden oluşan bir liste olmalı."),
+                    (3, "'interval' alanı tam sayı olmalı."),
+                    (4, "'weekdays' alanı tam sayı olmalı."),
+                    (5, "'exceptions' alanı liste olmalı."),
+                    (6, "Tarih formatı geçersiz."),
+                ],
+            )
+            patient = service.get_patient("P-3")
+            assert patient is not None
+            self.assertEqual(patient.recurring[0].rule.interval, 1)
+
+    def test_csv_import_reads_typed_rows(self) -> None:
+        source = io.StringIO(
+            "type,patient_id,full_name,phone,age,gender,note,created_at,scheduled_at\n"
+            "patient,P-1,Ada Lovelace,555,36,,,,\n"
+            "visit,P-1,,,,,Kontrol,2024-01-02T08:30:00,\n"
+            ",P-1,Ada Tekrar,555,36,,,,\n"
+            "patient,P-2,Grace Hopper,555,45,Kadın,,,\n"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            report = BulkImporter(service).run(parse_records(read_csv(source)))
+
+            self.assertEqual((report.accepted, report.rejected), (3, 1))
+            self.assertEqual(report.rejects[0].line, 4)
+            self.assertEqual(report.rejects[0].message, "Bu hasta numarası zaten kayıtlı.")
+            patient = service.get_patient("P-1")
+            assert patient is not None
+            self.assertEqual(patient.gender, "Belirtilmedi")
+            self.assertEqual([visit.note for visit in patient.visits], ["Kontrol"])
+            self.assertEqual([item.patient_id for item in service.search("grace")], ["P-2"])
+
+    def test_import_module_runs_the_bulk_importer(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "hastalar.jsonl"
+            source.write_text(
+                '{"patient_id": "P-1", "full_name": "Ada Lovelace", "age": 36}\n', encoding="utf-8"
+            )
+            env = {key: value for key, value in os.environ.items() if not key.startswith("HASTA_")}
+            env["PYTHONPATH"] = str(Path(__file__).resolve().parents[1] / "src")
+            result = subprocess.run(
+                [sys.executable, "-m", "app.import", str(source)],
+                cwd=temp_dir,
+                env=env,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            repository = JsonPatientRepository(Path(temp_dir) / "data" / "patients.json")
+            self.assertIsNotNone(repository.get("P-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.application.calendar_index import AppointmentCalendar
+from app.application.use_cases import (
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+class TestAppointmentCalendar(unittest.TestCase):
+    def test_agenda_and_next_appointment(self) -> None:
+        ada = Patient(patient_id="P-1", full_name="Ada", phone="1", age=30, gender="Kadın")
+        ada.add_appointment(datetime(2024, 1, 3, 9, 0), "Kontrol")
+        ada.add_appointment(datetime(2024, 1, 1, 9, 0), "İlk")
+        calendar = AppointmentCalendar([ada])
+        grace = Patient(patient_id="P-2", full_name="Grace", phone="2", age=40, gender="Kadın")
+        grace.add_appointment(datetime(2024, 1, 1, 8, 0), "Sabah")
+        calendar.add(grace, grace.appointments[0])
+
+        day = calendar.agenda(datetime(2024, 1, 1), datetime(2024, 1, 2))
+        self.assertEqual([entry.full_name for entry in day], ["Grace", "Ada"])
+        self.assertEqual([item.note for item in calendar.for_patient("P-1")], ["İlk", "Kontrol"])
+        upcoming = calendar.next_for_patient("P-1", datetime(2024, 1, 2))
+        assert upcoming is not None
+        self.assertEqual(upcoming.note, "Kontrol")
+        self.assertIsNone(calendar.next_for_patient("P-1", datetime(2024, 2, 1)))
+
+    def test_service_keeps_agenda_current(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            service.register_patient(
+                RegisterPatientRequest(
+                    patient_id="P-1", full_name="Ada", phone="1", age=30, gender="Kadın"
+                )
+            )
+            self.assertEqual(service.agenda(datetime(2024, 1, 1), datetime(2024, 1, 8)), [])
+            service.schedule_appointment(
+                ScheduleAppointmentRequest(
+                    patient_id="P-1", scheduled_at=datetime(2024, 1, 5, 10, 0), note="Kontrol"
+                )
+            )
+            week = service.agenda(datetime(2024, 1, 1), datetime(2024, 1, 8))
+            self.assertEqual([entry.patient_id for entry in week], ["P-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,18 +1,25 @@
+import hashlib
 import json
 import tempfile
 import unittest
 from pathlib import Path
 
-from app.infrastructure.credentials_store import CredentialsStore
+from app.infrastructure.credentials_store import (
+    LEGACY_SHA256,
+    MIN_ITERATIONS,
+    PBKDF2_SHA256,
+    CredentialsStore,
+    calibrate_iterations,
+)
 
 
 class TestCredentialsStore(unittest.TestCase):
     def test_credentials_store_roundtrip(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             path = Path(temp_dir) / "credentials.json"
-            store = CredentialsStore(path)
+            store = CredentialsStore(path, iterations=1000)
 
-            self.assertIsNone(store.load())
+            self.assertFalse(store.has_users())
 
             store.save("user1", "secret")
             self.assertTrue(store.verify("user1", "secret"))
@@ -20,8 +27,51 @@ class TestCredentialsStore(unittest.TestCase):
             self.assertFalse(store.verify("other", "secret"))
 
             payload = json.loads(path.read_text(encoding="utf-8"))
-            self.assertEqual(payload["username"], "user1")
-            self.assertIn("password_hash", payload)
+            self.assertEqual([user["username"] for user in payload["users"]], ["user1"])
+            self.assertEqual(payload["users"][0]["algorithm"], PBKDF2_SHA256)
+            self.assertEqual(payload["users"][0]["iterations"], 1000)
+            self.assertIn("password_hash", payload["users"][0])
+
+    def test_multiple_users_and_external_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "credentials.json"
+            store = CredentialsStore(path, iterations=1000)
+            store.add_user("doktor", "a")
+            store.add_user("sekreter", "b")
+            with self.assertRaises(ValueError):
+                store.add_user("doktor", "c")
+
+            other = CredentialsStore(path, iterations=2000)
+            self.assertTrue(other.verify("sekreter", "b"))
+            other.add_user("hemşire", "c")
+            other.remove_user("doktor")
+
+            self.assertEqual(store.usernames(), ["hemşire", "sekreter"])
+            self.assertTrue(store.verify("hemşire", "c"))
+            self.assertFalse(store.verify("doktor", "a"))
+            self.assertEqual(store.get("hemşire").iterations, 2000)
+
+    def test_legacy_file_is_upgraded_on_login(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "credentials.json"
+            password_hash = hashlib.sha256("abcd:secret".encode("utf-8")).hexdigest()
+            path.write_text(
+                json.dumps({"username": "user1", "salt": "abcd", "password_hash": password_hash}),
+                encoding="utf-8",
+            )
+            store = CredentialsStore(path, iterations=1000)
+            self.assertEqual(store.get("user1").algorithm, LEGACY_SHA256)
+            self.assertFalse(store.verify("user1", "wrong"))
+            self.assertNotIn("users", json.loads(path.read_text(encoding="utf-8")))
+
+            self.assertTrue(store.verify("user1", "secret"))
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            self.assertEqual(payload["users"][0]["algorithm"], PBKDF2_SHA256)
+            self.assertTrue(CredentialsStore(path, iterations=1000).verify("user1", "secret"))
+
+    def test_calibration_respects_minimum(self) -> None:
+        self.assertEqual(calibrate_iterations(target_ms=0.0), MIN_ITERATIONS)
+        self.assertGreater(calibrate_iterations(target_ms=50.0), MIN_ITERATIONS)
 
 
 if __name__ == "__main__":
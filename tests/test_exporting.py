@@ -0,0 +1,96 @@
+import gzip
+import io
+import json
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+
+from app.application.importing import BulkImporter, parse_records, read_csv, read_jsonl
+from app.application.use_cases import PatientService
+from app.domain.entities import Patient
+from app.domain.recurrence import WEEKLY, RecurrenceRule
+from app.infrastructure.exporting import default_fields, iter_rows, write_csv, write_jsonl
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.serialization import serialize_series
+
+
+def _patient() -> Patient:
+    patient = Patient(patient_id="P-1", full_name="Ada Lovelace", phone="555", age=36, gender="Kadın")
+    patient.add_visit(note="İlk", created_at=datetime(2024, 1, 1, 9, 0))
+    patient.add_appointment(scheduled_at=datetime(2024, 2, 1, 10, 0), note="Kontrol")
+    return patient
+
+
+class TestExporting(unittest.TestCase):
+    def test_jsonl_rows_are_written_lazily_with_selected_fields(self) -> None:
+        consumed = []
+
+        def patients():
+            for patient in (_patient(), _patient()):
+                consumed.append(patient)
+                yield patient
+
+        rows = iter_rows(patients(), "visits", ["patient_id", "note"])
+        self.assertEqual(consumed, [])
+        stream = io.StringIO()
+        self.assertEqual(write_jsonl(rows, stream), 2)
+        first = json.loads(stream.getvalue().splitlines()[0])
+        self.assertEqual(first, {"patient_id": "P-1", "note": "İlk"})
+
+        with self.assertRaises(ValueError):
+            iter_rows([], "visits", ["phone"])
+
+    def test_gzip_csv_export_round_trips_through_import(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "export.csv.gz"
+            fields = default_fields("all", flat=True)
+            with gzip.open(target, "wt", encoding="utf-8", newline="") as stream:
+                self.assertEqual(write_csv(iter_rows([_patient()], "all", fields), stream, fields), 3)
+            with self.assertRaises(ValueError):
+                write_csv([], io.StringIO(), default_fields("patients"))
+
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            with gzip.open(target, "rt", encoding="utf-8", newline="") as stream:
+                report = BulkImporter(service).run(parse_records(read_csv(stream)))
+            self.assertEqual(report.rejected, 0)
+            restored = service.get_patient("P-1")
+            assert restored is not None
+            self.assertEqual(restored.gender, "Kadın")
+            self.assertEqual(restored.visits[0].created_at, datetime(2024, 1, 1, 9, 0))
+            self.assertEqual(restored.appointments[0].note, "Kontrol")
+
+    def test_recurring_series_round_trip_in_jsonl_and_csv(self) -> None:
+        patient = _patient()
+        patient.add_recurring_appointment(
+            starts_at=datetime(2024, 6, 3, 9, 0),
+            note="Fizik tedavi",
+            rule=RecurrenceRule(
+                WEEKLY, weekdays={0, 2}, count=6, exceptions={date(2024, 6, 5), date(2024, 6, 10)}
+            ),
+        )
+        for data_format in ("jsonl", "csv"):
+            with self.subTest(data_format=data_format), tempfile.TemporaryDirectory() as temp_dir:
+                stream = io.StringIO()
+                if data_format == "csv":
+                    fields = default_fields("all", flat=True)
+                    self.assertEqual(write_csv(iter_rows([patient], "all"), stream, fields), 4)
+                else:
+                    self.assertEqual(write_jsonl(iter_rows([patient], "all"), stream), 4)
+                stream.seek(0)
+                records = read_csv(stream) if data_format == "csv" else read_jsonl(stream)
+
+                service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+                report = BulkImporter(service).run(parse_records(records))
+                self.assertEqual(report.rejected, 0)
+                restored = service.get_patient("P-1")
+                assert restored is not None
+                self.assertEqual(
+                    [serialize_series(series) for series in restored.recurring],
+                    [serialize_series(series) for series in patient.recurring],
+                )
+                self.assertEqual(len(restored.appointments), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.domain.entities import Patient
+from app.infrastructure.indexed_repository import IndexedJsonPatientRepository
+
+
+def _patient(index: int) -> Patient:
+    return Patient(
+        patient_id=f"P-{index}",
+        full_name=f"Hasta {index}",
+        phone="555-0101",
+        age=30 + index,
+        gender="Kadın",
+    )
+
+
+class TestIndexedRepository(unittest.TestCase):
+    def test_loads_records_on_demand_into_bounded_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.jsonl"
+            repo = IndexedJsonPatientRepository(path, cache_size=2)
+            for index in range(5):
+                repo.add(_patient(index))
+            patient = repo.get("P-3")
+            assert patient is not None
+            patient.add_visit(note="Kontrol", created_at=datetime(2024, 1, 1, 10, 0))
+            repo.save(patient)
+            repo.close()
+
+            reloaded = IndexedJsonPatientRepository(path, cache_size=2)
+            self.assertEqual(reloaded.cached_count, 0)
+            self.assertEqual(
+                [item.patient_id for item in reloaded.list_all()],
+                ["P-0", "P-1", "P-2", "P-3", "P-4"],
+            )
+            self.assertLessEqual(reloaded.cached_count, 2)
+            loaded = reloaded.get("P-3")
+            assert loaded is not None
+            self.assertEqual(loaded.visits[0].note, "Kontrol")
+            reloaded.close()
+
+    def test_rebuilds_missing_index_and_compacts(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.jsonl"
+            repo = IndexedJsonPatientRepository(path)
+            repo.add(_patient(1))
+            repo.save(_patient(1))
+            repo.close()
+            repo.index_path.unlink()
+
+            rebuilt = IndexedJsonPatientRepository(path)
+            self.assertIsNotNone(rebuilt.get("P-1"))
+            rebuilt.compact()
+            self.assertEqual(len(path.read_bytes().splitlines()), 2)
+            rebuilt.close()
+            self.assertEqual(IndexedJsonPatientRepository(path).get("P-1").age, 31)
+
+    def test_index_left_from_before_a_compaction_is_rebuilt(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.jsonl"
+            repo = IndexedJsonPatientRepository(path)
+            for number in range(1, 4):
+                repo.add(_patient(number))
+                repo.save(_patient(number))
+            repo.close()
+            stale_index = repo.index_path.read_bytes()
+            compacted = IndexedJsonPatientRepository(path)
+            compacted.compact()
+            compacted.close()
+            repo.index_path.write_bytes(stale_index)
+
+            reopened = IndexedJsonPatientRepository(path)
+            self.assertEqual(
+                [patient.patient_id for patient in reopened.list_all()], ["P-1", "P-2", "P-3"]
+            )
+            self.assertEqual(reopened.get("P-3").age, 33)
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.application.use_cases import AddVisitRequest, PatientService
+from app.domain.entities import Patient
+from app.infrastructure.instrumentation import Metrics, SlowOperation, instrument
+from app.infrastructure.journal import FSYNC_ON_CLOSE, JournalOptions
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.profiling import instrument_service
+
+
+class TestMetrics(unittest.TestCase):
+    def test_histogram_percentiles_and_slow_log(self) -> None:
+        slow: list[SlowOperation] = []
+        metrics = Metrics(slow_threshold_ms=50, on_slow=slow.append)
+        for _ in range(98):
+            metrics.observe("service.search", 0.0008)
+        metrics.observe("service.search", 0.02)
+        metrics.observe("service.search", 0.3, bytes_read=2048)
+
+        stats = metrics.operations()[0]
+        self.assertEqual(stats.count, 100)
+        self.assertEqual(stats.bytes_read, 2048)
+        self.assertEqual(stats.percentile_ms(0.5), 1.0)
+        self.assertEqual(stats.percentile_ms(0.99), 25.0)
+        self.assertAlmostEqual(stats.max_ms, 300.0)
+        self.assertEqual([item.name for item in slow], ["service.search"])
+        self.assertEqual(metrics.slow_operations(), slow)
+        self.assertIn("service.search", metrics.report())
+
+        metrics.reset()
+        self.assertEqual(metrics.report(), "Henüz ölçüm yok.")
+
+    def test_instrumented_service_and_repository_record_io(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            JsonPatientRepository(path).add(
+                Patient(patient_id="P-1", full_name="Ada", phone="1", age=30, gender="Kadın")
+            )
+            metrics = Metrics(slow_threshold_ms=10_000)
+            repository = JsonPatientRepository(
+                path, journal=JournalOptions(fsync_policy=FSYNC_ON_CLOSE), metrics=metrics
+            )
+            instrument(repository, metrics, "repository", ("get", "save"))
+            service = instrument_service(PatientService(repository), metrics)
+            service.add_visit(AddVisitRequest(patient_id="P-1", note="Kontrol"))
+            repository.close()
+
+            stats = {item.name: item for item in metrics.operations()}
+            self.assertEqual(stats["repository.read_snapshot"].bytes_read, len(path.read_bytes()))
+            self.assertEqual(
+                stats["repository.append_journal"].bytes_written,
+                repository.journal_path.stat().st_size,
+            )
+            self.assertEqual(stats["service.add_visit"].count, 1)
+            self.assertEqual(stats["repository.save"].count, 1)
+            self.assertIn("repository.get", stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
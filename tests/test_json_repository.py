@@ -1,10 +1,24 @@
+import gc
+import os
+import stat
 import tempfile
+import threading
+import time
 import unittest
+import weakref
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from app.domain.entities import Appointment, Patient, Visit
+from app.infrastructure.journal import (
+    FSYNC_INTERVAL,
+    FSYNC_ON_CLOSE,
+    JournalOptions,
+    PatientJournal,
+)
 from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.write_behind import WriteBehindBuffer, WriteBehindOptions
 
 
 class TestJsonRepository(unittest.TestCase):
@@ -38,6 +52,212 @@ class TestJsonRepository(unittest.TestCase):
             self.assertEqual(len(loaded.appointments), 1)
             self.assertEqual(loaded.appointments[0].note, "Randevu")
 
+    def test_journal_mode_appends_and_replays_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            options = JournalOptions(fsync_policy=FSYNC_ON_CLOSE)
+            repo = JsonPatientRepository(path, journal=options)
+
+            patient = Patient(
+                patient_id="P-1",
+                full_name="Ada Lovelace",
+                phone="555-0101",
+                age=37,
+                gender="Kadın",
+            )
+            repo.add(patient)
+            patient.add_visit(note="Kontrol", created_at=datetime(2024, 1, 1, 10, 0))
+            repo.save(patient)
+            repo.close()
+
+            self.assertEqual(path.read_text(encoding="utf-8"), "[]")
+            self.assertEqual(len(repo.journal_path.read_bytes().splitlines()), 2)
+
+            reloaded = JsonPatientRepository(path, journal=options)
+            loaded = reloaded.get("P-1")
+            assert loaded is not None
+            self.assertEqual(len(loaded.visits), 1)
+
+            reloaded.compact()
+            reloaded.close()
+            self.assertEqual(reloaded.journal_path.read_bytes(), b"")
+            self.assertEqual(len(JsonPatientRepository(path).get("P-1").visits), 1)
+
+    def test_torn_journal_tail_is_truncated_before_the_next_append(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            options = JournalOptions(fsync_policy=FSYNC_ON_CLOSE)
+            repo = JsonPatientRepository(path, journal=options)
+            repo.add(Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın"))
+            repo.close()
+            with repo.journal_path.open("ab") as handle:
+                handle.write(b'{"patient_id":"P-2","full_na')
+
+            reopened = JsonPatientRepository(path, journal=options)
+            self.assertIsNone(reopened.get("P-2"))
+            reopened.add(
+                Patient(patient_id="P-3", full_name="Grace", phone="1", age=1, gender="Kadın")
+            )
+            reopened.close()
+
+            final = JsonPatientRepository(path, journal=options)
+            patient_ids = sorted(patient.patient_id for patient in final.list_all())
+            self.assertEqual(patient_ids, ["P-1", "P-3"])
+            self.assertEqual(len(final.journal_path.read_bytes().splitlines()), 2)
+            final.close()
+
+    def test_journal_compacts_after_threshold(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            options = JournalOptions(compact_threshold_bytes=1, background_compaction=False)
+            repo = JsonPatientRepository(path, journal=options)
+            repo.add(Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın"))
+            repo.close()
+
+            self.assertEqual(repo.journal_path.read_bytes(), b"")
+            self.assertIsNotNone(JsonPatientRepository(path).get("P-1"))
+
+    def test_compaction_syncs_the_snapshot_before_truncating_the_journal(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            options = JournalOptions(fsync_policy=FSYNC_ON_CLOSE, background_compaction=False)
+            repo = JsonPatientRepository(path, journal=options)
+            repo.add(Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın"))
+            events = []
+            real_fsync, real_replace = os.fsync, os.replace
+            truncate_before = repo._journal.truncate_before
+
+            def fsync(descriptor: int) -> None:
+                kind = "dir" if stat.S_ISDIR(os.fstat(descriptor).st_mode) else "file"
+                events.append(f"fsync-{kind}")
+                real_fsync(descriptor)
+
+            def replace(source, target) -> None:
+                events.append(f"replace-{Path(target).name}")
+                real_replace(source, target)
+
+            def truncate(offset: int) -> None:
+                events.append("truncate")
+                truncate_before(offset)
+
+            repo._journal.truncate_before = truncate
+            with patch("os.fsync", fsync), patch("os.replace", replace):
+                repo.compact()
+            repo.close()
+
+            self.assertEqual(
+                events[:4], ["fsync-file", "replace-patients.json", "fsync-dir", "truncate"]
+            )
+            self.assertIsNotNone(JsonPatientRepository(path).get("P-1"))
+
+    def test_interval_fsync_runs_after_the_last_append(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            options = JournalOptions(fsync_policy=FSYNC_INTERVAL, fsync_interval_ms=20)
+            journal = PatientJournal(Path(temp_dir) / "patients.json.log", options)
+            with patch("app.infrastructure.journal.os.fsync", wraps=os.fsync) as fsync:
+                journal.append([{"patient_id": "P-1"}])
+                self.assertEqual(fsync.call_count, 0)
+                deadline = time.monotonic() + 5
+                while not fsync.call_count and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                self.assertEqual(fsync.call_count, 1)
+            journal.close()
+
+    def test_close_waits_for_a_running_background_compaction(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = JsonPatientRepository(path, journal=JournalOptions(compact_threshold_bytes=1))
+            started = threading.Event()
+            release = threading.Event()
+            write_snapshot = repo._write_snapshot
+
+            def slow_snapshot(patients) -> None:
+                started.set()
+                release.wait(5)
+                write_snapshot(patients)
+
+            repo._write_snapshot = slow_snapshot
+            repo.add(Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın"))
+            self.assertTrue(started.wait(5))
+            closing = threading.Thread(target=repo.close, daemon=True)
+            closing.start()
+            time.sleep(0.05)
+            release.set()
+            closing.join(5)
+
+            self.assertFalse(closing.is_alive())
+            self.assertEqual(repo.journal_path.read_bytes(), b"")
+            self.assertIsNotNone(JsonPatientRepository(path).get("P-1"))
+
+    def test_write_behind_coalesces_saves_until_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            options = JournalOptions(fsync_policy=FSYNC_ON_CLOSE)
+            repo = JsonPatientRepository(
+                path, journal=options, write_behind=WriteBehindOptions(delay_ms=60_000, max_dirty=2)
+            )
+            patient = Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın")
+            repo.add(patient)
+            patient.add_visit(note="Kontrol", created_at=datetime(2024, 1, 1, 10, 0))
+            repo.save(patient)
+            self.assertFalse(repo.journal_path.exists())
+            self.assertEqual(len(repo.get("P-1").visits), 1)
+
+            repo.flush()
+            self.assertEqual(len(repo.journal_path.read_bytes().splitlines()), 1)
+
+            repo.add(Patient(patient_id="P-2", full_name="Bob", phone="2", age=2, gender="Erkek"))
+            repo.add(Patient(patient_id="P-3", full_name="Can", phone="3", age=3, gender="Erkek"))
+            self.assertEqual(len(repo.journal_path.read_bytes().splitlines()), 3)
+
+            repo.add(Patient(patient_id="P-4", full_name="Dağ", phone="4", age=4, gender="Erkek"))
+            repo.close()
+            self.assertEqual(len(list(JsonPatientRepository(path, journal=options).list_all())), 4)
+
+    def test_write_behind_flushes_after_delay(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = JsonPatientRepository(path, write_behind=WriteBehindOptions(delay_ms=20))
+            repo.add(Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın"))
+            self.assertEqual(path.read_text(encoding="utf-8"), "[]")
+            deadline = time.monotonic() + 5
+            while path.read_text(encoding="utf-8") == "[]" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertIsNotNone(JsonPatientRepository(path).get("P-1"))
+            repo.close()
+
+    def test_write_behind_retries_a_failed_flush(self) -> None:
+        written = []
+        attempts = []
+
+        def write(patients) -> None:
+            attempts.append(len(patients))
+            if len(attempts) == 1:
+                raise OSError("disk dolu")
+            written.extend(patient.patient_id for patient in patients)
+
+        options = WriteBehindOptions(delay_ms=0, max_dirty=1)
+        buffer = WriteBehindBuffer(options, write, threading.RLock())
+        with self.assertRaises(OSError):
+            buffer.mark([Patient(patient_id="P-1", full_name="Ada", phone="1", age=1, gender="Kadın")])
+        self.assertEqual(buffer.dirty_count, 1)
+        deadline = time.monotonic() + 5
+        while not written and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(written, ["P-1"])
+        self.assertEqual(buffer.dirty_count, 0)
+        buffer.close()
+
+    def test_write_behind_does_not_keep_the_repository_alive(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = JsonPatientRepository(
+                Path(temp_dir) / "patients.json", write_behind=WriteBehindOptions(delay_ms=60_000)
+            )
+            reference = weakref.ref(repo)
+            del repo
+            gc.collect()
+            self.assertIsNone(reference())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.application.note_index import VisitNoteIndex, parse_query, tokenize
+from app.application.use_cases import AddVisitRequest, PatientService, RegisterPatientRequest
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+def _patient(patient_id: str, *notes: str) -> Patient:
+    patient = Patient(
+        patient_id=patient_id, full_name=patient_id, phone="1", age=50, gender="Kadın"
+    )
+    for day, note in enumerate(notes, 1):
+        patient.add_visit(note=note, created_at=datetime(2024, 1, day))
+    return patient
+
+
+class TestVisitNoteIndex(unittest.TestCase):
+    def test_tokenizer_folds_turkish_case(self) -> None:
+        self.assertEqual(
+            tokenize("HİPERTANSİYON, Işık-ağrısı!"), ["hipertansiyon", "işik", "ağrisi"]
+        )
+        query = parse_query('"baş ağrısı" İLAÇ')
+        self.assertEqual(query.terms, ("baş", "ağrisi", "ilaç"))
+        self.assertEqual(query.phrases, (("baş", "ağrisi"),))
+
+    def test_ranks_by_term_frequency_and_requires_all_terms(self) -> None:
+        index = VisitNoteIndex(
+            [
+                _patient("P-1", "Kontrol muayenesi, şikayet yok", "Hipertansiyon takibi"),
+                _patient("P-2", "Hipertansiyon. Hipertansiyon ilacı değiştirildi"),
+                _patient("P-3", "Diyabet ve hipertansiyon birlikte"),
+            ]
+        )
+
+        matches = index.search("hipertansiyon")
+        self.assertEqual(matches[0][:2], ("P-2", 0))
+        self.assertEqual({match.patient_id for match in matches}, {"P-1", "P-2", "P-3"})
+        self.assertEqual(
+            [match[:2] for match in index.search("DİYABET hipertansiyon")], [("P-3", 0)]
+        )
+        self.assertEqual(index.search("diyabet astım"), [])
+        self.assertEqual(len(index), 4)
+
+    def test_pruned_top_k_matches_the_full_ranking(self) -> None:
+        words = ("kontrol", "tansiyon", "ağrı", "reçete", "tahlil")
+        notes = [
+            " ".join(words[(seed * step) % len(words)] for step in range(1, seed % 7 + 2))
+            for seed in range(200)
+        ]
+        index = VisitNoteIndex(_patient(f"P-{number}", note) for number, note in enumerate(notes))
+
+        for query in ("kontrol", "tansiyon ağrı", '"ağrı reçete"'):
+            ranking = index.search(query, limit=len(notes))
+            for limit in (1, 5, 20):
+                self.assertEqual(index.search(query, limit), ranking[:limit])
+
+    def test_phrase_query_checks_word_order(self) -> None:
+        index = VisitNoteIndex(
+            [
+                _patient("P-1", "Ağrı başta değil, baş dönmesi var"),
+                _patient("P-2", "Baş ağrısı"),
+            ]
+        )
+
+        self.assertEqual([match.patient_id for match in index.search('"baş ağrısı"')], ["P-2"])
+        self.assertEqual(index.search('"ağrısı baş"'), [])
+
+
+class TestPatientServiceNoteSearch(unittest.TestCase):
+    def test_new_visits_are_searchable_immediately(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            service.register_patient(RegisterPatientRequest("P-1", "Ayşe Kaya", "1", 67, "Kadın"))
+            service.add_visit(AddVisitRequest("P-1", "Rutin kontrol"))
+            self.assertEqual(service.search_notes("hipertansiyon"), [])
+
+            service.add_visit(
+                AddVisitRequest("P-1", "Hipertansiyon başlandı", datetime(2024, 5, 1))
+            )
+            with self.assertRaises(ValueError):
+                service.add_visit(AddVisitRequest("P-404", "Hipertansiyon"))
+
+            hits = service.search_notes("HİPERTANSİYON")
+            self.assertEqual(len(hits), 1)
+            self.assertEqual(hits[0].full_name, "Ayşe Kaya")
+            self.assertEqual(hits[0].created_at, datetime(2024, 5, 1))
+            self.assertEqual(hits[0].note, "Hipertansiyon başlandı")
+
+
+if __name__ == "__main__":
+    unittest.main()
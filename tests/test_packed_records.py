@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app.application.use_cases import AddVisitRequest, PatientService
+from app.domain.entities import Patient, Visit
+from app.domain.records import PackedAppointments, PackedVisits, pack_patient
+from app.infrastructure.json_repository import JsonPatientRepository
+
+
+class TestPackedRecords(unittest.TestCase):
+    def test_packed_visits_behave_like_a_list(self) -> None:
+        visits = [
+            Visit(note="İlk muayene", created_at=datetime(2024, 1, 1, 9, 0, 0, 250)),
+            Visit(note="", created_at=datetime(1965, 5, 4, 12, 30)),
+            Visit(note="Kontrol", created_at=datetime(2024, 3, 1, 10, 0)),
+        ]
+        packed = PackedVisits(visits)
+
+        self.assertEqual(packed, visits)
+        self.assertEqual(packed[-1], visits[-1])
+        self.assertEqual(packed[1:], visits[1:])
+        packed.insert(0, visits[2])
+        del packed[0]
+        self.assertEqual(list(packed), visits)
+        del packed[1:]
+        packed.append(visits[2])
+        self.assertEqual(list(packed), [visits[0], visits[2]])
+        self.assertLess(packed.payload_bytes(), 64)
+        with self.assertRaises(ValueError):
+            packed.append(Visit(note="", created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)))
+
+    def test_repository_packs_patients_and_rolls_back_transactions(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = JsonPatientRepository(path, packed_records=True)
+            patient = Patient(patient_id="P-1", full_name="Ada", phone="1", age=3, gender="Kadın")
+            repo.add(patient)
+            self.assertIsInstance(patient.visits, PackedVisits)
+            self.assertIsInstance(patient.appointments, PackedAppointments)
+
+            service = PatientService(repo)
+            created_at = datetime(2024, 1, 1) + timedelta(microseconds=7)
+            with self.assertRaises(RuntimeError):
+                with service.transaction():
+                    service.add_visit(AddVisitRequest("P-1", "Geri alınacak", created_at))
+                    raise RuntimeError
+            service.add_visit(AddVisitRequest("P-1", "Kalıcı", created_at))
+
+            reloaded = JsonPatientRepository(path, packed_records=True).get("P-1")
+            assert reloaded is not None
+            self.assertEqual(list(reloaded.visits), [Visit(note="Kalıcı", created_at=created_at)])
+            self.assertIs(reloaded.gender, pack_patient(patient).gender)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.application.use_cases import PatientService
+from app.domain.entities import Patient
+from app.domain.paging import cursor_for
+from app.infrastructure.indexed_repository import IndexedJsonPatientRepository
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.sharded_repository import ShardedPatientRepository
+from app.infrastructure.sqlite_repository import SqlitePatientRepository
+
+_PATIENTS = [
+    ("P-0", "Zeynep Kaya"),
+    ("P-1", "Çağla Demir"),
+    ("P-2", "İsmail Şahin"),
+    ("P-3", "Ahmet Yılmaz"),
+    ("P-4", "Cem Öztürk"),
+    ("P-5", "Ümit Işık"),
+    ("P-6", "Can Er"),
+    ("P-9", "Can Er"),
+]
+_REPOSITORIES = {
+    "json": lambda root: JsonPatientRepository(root / "patients.json"),
+    "indexed": lambda root: IndexedJsonPatientRepository(root / "patients.jsonl", cache_size=2),
+    "sharded": lambda root: ShardedPatientRepository(root / "patients", cache_size=2),
+    "sqlite": lambda root: SqlitePatientRepository(root / "patients.db"),
+}
+
+
+class TestKeysetPaging(unittest.TestCase):
+    def test_pages_follow_turkish_order_in_every_repository(self) -> None:
+        for backend, create in _REPOSITORIES.items():
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as temp_dir:
+                repo = create(Path(temp_dir))
+                for patient_id, name in _PATIENTS:
+                    repo.add(Patient(patient_id=patient_id, full_name=name, phone="1", age=3, gender="Kadın"))
+                service = PatientService(repo)
+                expected = [patient.patient_id for patient in service.list_patients()]
+
+                collected = []
+                page = service.list_patients_page(limit=3)
+                self.assertEqual(page.total_estimate, 8)
+                while True:
+                    collected.extend(patient.patient_id for patient in page.patients)
+                    if page.next_cursor is None:
+                        break
+                    self.assertEqual(page.next_cursor, cursor_for(page.patients[-1]))
+                    page = service.list_patients_page(page.next_cursor, 3)
+
+                self.assertEqual(collected, expected)
+                self.assertEqual(collected[:4], ["P-3", "P-6", "P-9", "P-4"])
+                self.assertEqual(len(page.patients), 2)
+                repo.close()
+
+    def test_rejects_non_positive_page_size(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = PatientService(JsonPatientRepository(Path(temp_dir) / "patients.json"))
+            with self.assertRaises(ValueError):
+                service.list_patients_page(limit=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
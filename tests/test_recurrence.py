@@ -0,0 +1,116 @@
+import tempfile
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+
+from app.application.use_cases import (
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+    build_recurrence_rule,
+)
+from app.domain.recurrence import DAILY, MONTHLY, WEEKLY, RecurrenceRule, RecurringAppointment
+from app.infrastructure.binary_repository import BinaryPatientRepository
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.sqlite_repository import SqlitePatientRepository
+
+_REPOSITORIES = {
+    "json": lambda root: JsonPatientRepository(root / "patients.json"),
+    "binary": lambda root: BinaryPatientRepository(root / "patients.bin"),
+    "sqlite": lambda root: SqlitePatientRepository(root / "patients.db"),
+}
+
+
+class TestRecurrenceRule(unittest.TestCase):
+    def test_weekly_rule_honours_weekdays_count_and_exceptions(self) -> None:
+        rule = RecurrenceRule(WEEKLY, weekdays={0, 2, 4}, count=5, exceptions={date(2024, 6, 10)})
+        series = RecurringAppointment(datetime(2024, 6, 5, 10, 0), "Fizik tedavi", rule)
+
+        self.assertEqual([moment.day for moment in series.occurrences()], [5, 7, 12, 14])
+        self.assertEqual(
+            list(series.occurrences(datetime(2024, 6, 8), datetime(2024, 6, 13))),
+            [datetime(2024, 6, 12, 10, 0)],
+        )
+
+    def test_monthly_rule_clamps_to_month_end(self) -> None:
+        series = RecurringAppointment(
+            datetime(2024, 1, 31, 9, 0), "Kontrol", RecurrenceRule(MONTHLY)
+        )
+
+        moments = list(series.occurrences(datetime(2024, 2, 1), datetime(2024, 5, 1)))
+
+        self.assertEqual([moment.day for moment in moments], [29, 31, 30])
+
+    def test_open_ended_series_seeks_directly_to_the_window(self) -> None:
+        series = RecurringAppointment(
+            datetime(2024, 1, 1, 9, 0), "İlaç", RecurrenceRule(DAILY, interval=3)
+        )
+
+        self.assertEqual(
+            series.next_after(datetime(2124, 1, 1)),
+            next(series.occurrences(datetime(2124, 1, 1))),
+        )
+        self.assertEqual(series.next_after(datetime(2024, 1, 2)), datetime(2024, 1, 4, 9, 0))
+
+    def test_builder_validates_input(self) -> None:
+        self.assertIsNone(build_recurrence_rule(""))
+        rule = build_recurrence_rule("h", "2", "1,3", "", "2024-12-31", "2024-07-01")
+        assert rule is not None
+        self.assertEqual(rule.weekdays, frozenset({0, 2}))
+        self.assertEqual(rule.until, datetime(2024, 12, 31, 23, 59, 59, 999999))
+        for arguments in (("x",), ("h", "", "8"), ("g", "iki"), ("a", "", "", "", "31-12-2024")):
+            with self.assertRaises(ValueError):
+                build_recurrence_rule(*arguments)
+
+
+class TestRecurringAppointments(unittest.TestCase):
+    def test_series_is_stored_once_and_expanded_in_every_repository(self) -> None:
+        for backend, create in _REPOSITORIES.items():
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as temp_dir:
+                root = Path(temp_dir)
+                repo = create(root)
+                service = PatientService(repo)
+                service.register_patient(RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın"))
+                service.register_patient(RegisterPatientRequest("P-2", "Grace", "2", 40, "Kadın"))
+                service.schedule_appointment(
+                    ScheduleAppointmentRequest("P-2", datetime(2024, 6, 4, 8, 0), "Tek")
+                )
+                service.schedule_appointment(
+                    ScheduleAppointmentRequest(
+                        "P-1",
+                        datetime(2024, 6, 3, 9, 0),
+                        "Fizik tedavi",
+                        recurrence=RecurrenceRule(WEEKLY, weekdays={0, 1}),
+                    )
+                )
+
+                week = service.agenda(datetime(2024, 6, 3), datetime(2024, 6, 10))
+                self.assertEqual(
+                    [(entry.scheduled_at.day, entry.patient_id) for entry in week],
+                    [(3, "P-1"), (4, "P-2"), (4, "P-1")],
+                )
+                repo.close()
+
+                repo = create(root)
+                reopened = PatientService(repo)
+                patient = reopened.get_patient("P-1")
+                assert patient is not None
+                self.assertEqual(len(patient.recurring), 1)
+                self.assertEqual(len(patient.appointments), 0)
+                upcoming = reopened.next_appointment("P-1", datetime(2030, 1, 2))
+                assert upcoming is not None
+                self.assertEqual(upcoming.scheduled_at, datetime(2030, 1, 7, 9, 0))
+                window = reopened.patient_appointments(
+                    "P-1", datetime(2024, 6, 10), datetime(2024, 6, 17)
+                )
+                self.assertEqual([item.scheduled_at.day for item in window], [10, 11])
+                later = reopened.patient_appointments("P-1", series_from=datetime(2030, 1, 1))
+                self.assertEqual(later[0].scheduled_at, datetime(2030, 1, 1, 9, 0))
+                self.assertLess(later[-1].scheduled_at, datetime(2031, 1, 2))
+                other = reopened.patient_appointments("P-2", series_from=datetime(2030, 1, 1))
+                self.assertEqual([item.note for item in other], ["Tek"])
+                repo.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from app.application.search_index import PatientSearchIndex
+from app.domain.entities import Patient
+
+
+def _patient(patient_id: str, full_name: str, phone: str) -> Patient:
+    return Patient(patient_id=patient_id, full_name=full_name, phone=phone, age=40, gender="Kadın")
+
+
+class TestPatientSearchIndex(unittest.TestCase):
+    def test_search_matches_names_ids_and_phones(self) -> None:
+        index = PatientSearchIndex(
+            [
+                _patient("P-1", "Işıl Şahin", "0532 111 22 33"),
+                _patient("P-2", "İlker Aşık", "0533-444-5566"),
+                _patient("P-3", "Ali Işık", "0212 999 00 11"),
+            ]
+        )
+
+        self.assertEqual(index.search("ışı"), ["P-3", "P-1"])
+        self.assertEqual(index.search("ILKER"), ["P-2"])
+        self.assertEqual(index.search("p-3"), ["P-3"])
+        self.assertEqual(index.search("4445566"), ["P-2"])
+        self.assertEqual(index.search("ı", limit=1), ["P-3"])
+        self.assertEqual(index.search("zzz"), [])
+
+    def test_readding_patient_replaces_old_terms(self) -> None:
+        index = PatientSearchIndex([_patient("P-1", "Ada", "1")])
+        index.add(_patient("P-1", "Grace", "1"))
+        self.assertEqual(index.search("ada"), [])
+        self.assertEqual(index.search("gra"), ["P-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Patient
+from app.infrastructure.serialization import deserialize_patient
+from app.infrastructure.sharded_repository import ShardedPatientRepository
+from app.infrastructure.sharing import InterProcessLock
+
+
+def _patient(index: int) -> Patient:
+    return Patient(
+        patient_id=f"P-{index}",
+        full_name=f"Hasta {index}",
+        phone="555-0101",
+        age=30 + index,
+        gender="Kadın",
+    )
+
+
+class TestShardedRepository(unittest.TestCase):
+    def test_visit_rewrites_only_the_patient_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory, cache_size=2)
+            for index in range(5):
+                repo.add(_patient(index))
+            other = repo.patient_path("P-1").read_bytes()
+            other_mtime = repo.patient_path("P-1").stat().st_mtime_ns
+
+            service = PatientService(repo)
+            service.add_visit(
+                AddVisitRequest(patient_id="P-3", note="Kontrol", created_at=datetime(2024, 1, 1))
+            )
+            self.assertEqual(repo.patient_path("P-1").read_bytes(), other)
+            self.assertEqual(repo.patient_path("P-1").stat().st_mtime_ns, other_mtime)
+            self.assertEqual(len(list(directory.glob("*/*.json"))), 5)
+            repo.close()
+
+            reloaded = ShardedPatientRepository(directory, cache_size=2)
+            self.assertEqual(reloaded.cached_count, 0)
+            self.assertEqual(
+                [item.patient_id for item in reloaded.list_all()],
+                ["P-0", "P-1", "P-2", "P-3", "P-4"],
+            )
+            self.assertLessEqual(reloaded.cached_count, 2)
+            self.assertEqual(reloaded.get("P-3").visits[0].note, "Kontrol")
+            self.assertIsNone(reloaded.get("P-404"))
+
+    def test_parallel_writers_and_manifest_compaction(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory)
+
+            def write(start: int) -> None:
+                for index in range(start, start + 20):
+                    repo.add(_patient(index))
+                    repo.save(_patient(index))
+
+            threads = [threading.Thread(target=write, args=(start,)) for start in (0, 20, 40)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(repo._patient_locks, {})
+
+            with self.assertRaises(RuntimeError):
+                with repo.batch():
+                    repo.add(_patient(99))
+                    raise RuntimeError
+            self.assertIsNone(repo.get("P-99"))
+
+            repo.compact()
+            self.assertEqual(len(repo.manifest_path.read_text(encoding="utf-8").splitlines()), 60)
+            reloaded = ShardedPatientRepository(directory)
+            self.assertEqual(len(list(reloaded.list_all())), 60)
+            self.assertIn('"P-7", "Hasta 7", 2', repo.manifest_path.read_text(encoding="utf-8"))
+
+    def test_compaction_waits_for_the_inter_process_lock(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory)
+            repo.add(_patient(1))
+            repo.save(_patient(1))
+            other = InterProcessLock(repo.lock_path)
+            with other.hold():
+                compaction = threading.Thread(target=repo.compact, daemon=True)
+                compaction.start()
+                compaction.join(0.1)
+                self.assertTrue(compaction.is_alive())
+                self.assertEqual(len(repo.manifest_path.read_bytes().splitlines()), 2)
+            compaction.join(5)
+
+            self.assertFalse(compaction.is_alive())
+            self.assertEqual(len(repo.manifest_path.read_bytes().splitlines()), 1)
+
+    def test_corrupt_manifest_lines_are_skipped(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory)
+            repo.add(_patient(1))
+            with repo.manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write('{"bozuk": true}\n["P-9", "Hasta 9"\n')
+            repo.add(_patient(2))
+            with repo.manifest_path.open("a", encoding="utf-8") as handle:
+                handle.write('["P-3", "Has')
+
+            reloaded = ShardedPatientRepository(directory)
+            self.assertEqual([item.patient_id for item in reloaded.list_all()], ["P-1", "P-2"])
+            self.assertTrue(repo.manifest_path.read_text(encoding="utf-8").endswith("1]\n"))
+            reloaded.add(_patient(3))
+            self.assertEqual(len(list(ShardedPatientRepository(directory).list_all())), 3)
+
+    def test_failed_patient_write_leaves_no_orphan_file(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory)
+            with patch.object(repo, "_write_patient_file", side_effect=OSError("disk dolu")):
+                with self.assertRaises(OSError):
+                    repo.add(_patient(1))
+            self.assertEqual(list(directory.glob("*/*.json")), [])
+            self.assertIn('"P-1"', repo.manifest_path.read_text(encoding="utf-8"))
+            self.assertEqual(list(ShardedPatientRepository(directory).list_all()), [])
+
+            repo.add(_patient(1))
+            self.assertEqual(
+                [item.patient_id for item in ShardedPatientRepository(directory).list_all()],
+                ["P-1"],
+            )
+
+    def test_changes_from_another_instance_bump_the_generation(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            first = ShardedPatientRepository(directory)
+            first.add(_patient(1))
+            second = ShardedPatientRepository(directory)
+            generation = second.generation
+            self.assertEqual(second.get("P-1").visits, [])
+            self.assertEqual(second.generation, generation)
+
+            updated = _patient(1)
+            updated.add_visit(note="Kontrol", created_at=datetime(2024, 1, 1))
+            first.save(updated)
+            first.add(_patient(2))
+            self.assertGreater(second.generation, generation)
+            self.assertEqual(second.get("P-1").visits[0].note, "Kontrol")
+            self.assertEqual([item.patient_id for item in second.list_all()], ["P-1", "P-2"])
+
+            generation = second.generation
+            first.compact()
+            self.assertEqual(second.generation, generation)
+            second.add(_patient(3))
+            self.assertEqual(second.generation, generation)
+            self.assertEqual(len(list(first.list_all())), 3)
+
+    def test_indexes_are_loaded_from_disk_without_reading_patient_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            directory = Path(temp_dir) / "patients"
+            repo = ShardedPatientRepository(directory)
+            service = PatientService(repo)
+            for index in range(3):
+                repo.add(_patient(index))
+            service.schedule_appointment(
+                ScheduleAppointmentRequest("P-1", datetime(2024, 1, 2, 9), "Kontrol")
+            )
+            week = (datetime(2024, 1, 1), datetime(2024, 1, 8))
+            self.assertEqual(len(service.agenda(*week)), 1)
+            self.assertEqual(service.search("Hasta 2")[0].patient_id, "P-2")
+
+            target = "app.infrastructure.sharded_repository.deserialize_patient"
+            with patch(target, wraps=deserialize_patient) as reads:
+                restarted = PatientService(ShardedPatientRepository(directory))
+                self.assertEqual(restarted.agenda(*week)[0].patient_id, "P-1")
+                self.assertEqual(reads.call_count, 0)
+
+                restarted.schedule_appointment(
+                    ScheduleAppointmentRequest("P-2", datetime(2024, 1, 3, 9), "Kontrol")
+                )
+                fresh = PatientService(ShardedPatientRepository(directory))
+                self.assertEqual(len(fresh.agenda(*week)), 2)
+                self.assertGreater(reads.call_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Patient
+from app.infrastructure.journal import FSYNC_ON_CLOSE, JournalOptions
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.sharing import SharingOptions
+from app.infrastructure.write_behind import WriteBehindOptions
+
+_JOURNAL = JournalOptions(fsync_policy=FSYNC_ON_CLOSE, keep_open=False, background_compaction=False)
+_SHARING = SharingOptions(poll_interval_ms=0)
+
+_WRITER = textwrap.dedent(
+    """
+    import sys
+    from pathlib import Path
+    from app.domain.entities import Patient
+    from app.infrastructure.journal import JournalOptions
+    from app.infrastructure.json_repository import JsonPatientRepository
+    from app.infrastructure.sharing import SharingOptions
+
+    repo = JsonPatientRepository(
+        Path(sys.argv[1]),
+        journal=JournalOptions(keep_open=False, compact_threshold_bytes=2048, background_compaction=False),
+        sharing=SharingOptions(poll_interval_ms=0),
+    )
+    for number in range(25):
+        patient_id = f"{sys.argv[2]}-{number}"
+        repo.add(Patient(patient_id=patient_id, full_name=patient_id, phone="1", age=1, gender="Kadın"))
+    repo.close()
+    """
+)
+
+
+def _patient(patient_id: str, name: str) -> Patient:
+    return Patient(patient_id=patient_id, full_name=name, phone="1", age=30, gender="Kadın")
+
+
+class TestSharedRepository(unittest.TestCase):
+    def test_instances_merge_each_others_changes_incrementally(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            first = JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING)
+            first.add(_patient("P-0", "Ada"))
+            second = JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING)
+            known = second.get("P-0")
+            service = PatientService(second)
+            self.assertEqual(service.search("grace"), [])
+
+            first.add(_patient("P-1", "Grace"))
+            self.assertIs(second.get("P-0"), known)
+            self.assertEqual([patient.patient_id for patient in service.search("grace")], ["P-1"])
+
+            second.add(_patient("P-2", "Linus"))
+            first.compact()
+            second.add(_patient("P-3", "Barbara"))
+            self.assertEqual(
+                sorted(patient.patient_id for patient in first.list_all()), ["P-0", "P-1", "P-2", "P-3"]
+            )
+            first.close()
+            second.close()
+
+            fresh = JsonPatientRepository(path, journal=_JOURNAL)
+            self.assertEqual(len(list(fresh.list_all())), 4)
+
+    def test_idle_polls_do_not_take_the_file_lock(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            first = JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING)
+            first.add(_patient("P-0", "Ada"))
+            second = JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING)
+            with patch.object(second._file_lock, "hold", wraps=second._file_lock.hold) as hold:
+                for _ in range(5):
+                    self.assertIsNotNone(second.get("P-0"))
+                self.assertEqual(hold.call_count, 0)
+
+                first.add(_patient("P-1", "Grace"))
+                self.assertIsNotNone(second.get("P-1"))
+                self.assertEqual(hold.call_count, 1)
+            first.close()
+            second.close()
+
+    def test_merged_records_update_built_indexes_in_place(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            first = PatientService(JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING))
+            first.register_patient(RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın"))
+            first.add_visit(AddVisitRequest("P-1", "Rutin kontrol", datetime(2024, 1, 1)))
+            second = PatientService(JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING))
+            self.assertEqual(len(second.search_notes("kontrol")), 1)
+            self.assertEqual(second.patient_appointments("P-1"), [])
+            self.assertEqual(second.search("grace"), [])
+            indexes = (second._notes, second._calendar, second._search_index)
+
+            first.add_visit(AddVisitRequest("P-1", "Kontrol, tansiyon", datetime(2024, 2, 1)))
+            first.schedule_appointment(
+                ScheduleAppointmentRequest("P-1", datetime(2030, 1, 1, 10), "Kontrol")
+            )
+            first.register_patient(RegisterPatientRequest("P-2", "Grace", "2", 40, "Kadın"))
+
+            self.assertEqual(len(second.search_notes("kontrol")), 2)
+            self.assertEqual(len(second.patient_appointments("P-1")), 1)
+            self.assertEqual([patient.patient_id for patient in second.search("grace")], ["P-2"])
+            current = (second._notes, second._calendar, second._search_index)
+            for before, after in zip(indexes, current):
+                self.assertIsNotNone(before)
+                self.assertIs(after, before)
+
+    def test_concurrent_processes_do_not_lose_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            JsonPatientRepository(path, journal=_JOURNAL, sharing=_SHARING).close()
+            env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1] / "src"))
+            writers = [
+                subprocess.Popen([sys.executable, "-c", _WRITER, str(path), name], env=env)
+                for name in ("A", "B", "C")
+            ]
+            for writer in writers:
+                self.assertEqual(writer.wait(timeout=60), 0)
+
+            loaded = JsonPatientRepository(path, journal=_JOURNAL)
+            self.assertEqual(len(list(loaded.list_all())), 75)
+
+    def test_updates_to_the_same_patient_from_two_instances_are_merged(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            sharing = SharingOptions(poll_interval_ms=60_000)
+            first = PatientService(JsonPatientRepository(path, journal=_JOURNAL, sharing=sharing))
+            first.register_patient(RegisterPatientRequest("P-1", "Ada", "1", 30, "Kadın"))
+            second_repository = JsonPatientRepository(path, journal=_JOURNAL, sharing=sharing)
+            second = PatientService(second_repository)
+            self.assertIsNotNone(second.get_patient("P-1"))
+
+            first.add_visit(AddVisitRequest("P-1", "Kontrol"))
+            second.schedule_appointment(
+                ScheduleAppointmentRequest("P-1", datetime(2030, 1, 1, 10), "Kontrol")
+            )
+            second_repository.close()
+
+            patient = JsonPatientRepository(path, journal=_JOURNAL).get("P-1")
+            assert patient is not None
+            self.assertEqual([visit.note for visit in patient.visits], ["Kontrol"])
+            self.assertEqual(len(patient.appointments), 1)
+
+    def test_write_behind_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(ValueError):
+                JsonPatientRepository(
+                    Path(temp_dir) / "patients.json",
+                    journal=_JOURNAL,
+                    sharing=_SHARING,
+                    write_behind=WriteBehindOptions(delay_ms=10),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
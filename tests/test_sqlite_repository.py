@@ -0,0 +1,86 @@
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Appointment, Patient, Visit
+from app.infrastructure.sqlite_repository import SqlitePatientRepository
+
+
+class TestSqliteRepository(unittest.TestCase):
+    def test_repository_persists_patient_data(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.db"
+            repo = SqlitePatientRepository(path)
+
+            patient = Patient(
+                patient_id="P-1",
+                full_name="Ada Lovelace",
+                phone="555-0101",
+                age=37,
+                gender="Kadın",
+            )
+            patient.visits.append(Visit(note="Kontrol", created_at=datetime(2024, 1, 1, 10, 0)))
+            patient.appointments.append(
+                Appointment(scheduled_at=datetime(2024, 1, 2, 9, 30), note="Randevu")
+            )
+            repo.add(patient)
+            repo.close()
+
+            reloaded = SqlitePatientRepository(path)
+            loaded = reloaded.get("P-1")
+            assert loaded is not None
+            self.assertEqual(loaded.full_name, "Ada Lovelace")
+            self.assertEqual(loaded.age, 37)
+            self.assertEqual(loaded.gender, "Kadın")
+            self.assertEqual(loaded.visits[0].note, "Kontrol")
+            self.assertEqual(loaded.visits[0].created_at, datetime(2024, 1, 1, 10, 0))
+            self.assertEqual(loaded.appointments[0].note, "Randevu")
+            listing = reloaded.list_all()
+            self.assertEqual([item.patient_id for item in listing], ["P-1"])
+            self.assertEqual([item.patient_id for item in listing], ["P-1"])
+            reloaded.close()
+
+    def test_patient_service_flow_appends_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.db"
+            repo = SqlitePatientRepository(path)
+            service = PatientService(repo)
+
+            service.register_patient(
+                RegisterPatientRequest(
+                    patient_id="P-2",
+                    full_name="Grace Hopper",
+                    phone="555-0202",
+                    age=45,
+                    gender="Kadın",
+                )
+            )
+            service.add_visit(AddVisitRequest(patient_id="P-2", note="Not 1"))
+            updated = service.add_visit(AddVisitRequest(patient_id="P-2", note="Not 2"))
+            self.assertEqual(len(updated.visits), 2)
+            scheduled = service.schedule_appointment(
+                ScheduleAppointmentRequest(
+                    patient_id="P-2",
+                    scheduled_at=datetime(2024, 1, 3, 14, 0),
+                    note="Kontrol",
+                )
+            )
+            self.assertEqual(len(scheduled.appointments), 1)
+            repo.close()
+
+            connection = sqlite3.connect(str(path))
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM visits").fetchone()[0], 2)
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            connection.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from app.domain.text import turkish_casefold, turkish_sort_key
+from app.infrastructure.name_index import SortedNameIndex
+
+
+class TestTurkishText(unittest.TestCase):
+    def test_casefold_handles_dotted_and_dotless_i(self) -> None:
+        self.assertEqual(turkish_casefold("IŞIK İNCE"), "ışık ince")
+
+    def test_sort_key_follows_turkish_alphabet(self) -> None:
+        names = ["Zeynep", "Çağla", "İlker", "Ümit", "Öykü", "Işıl", "Cem", "Şule", "Ozan", "Sena"]
+        ordered = sorted(names, key=turkish_sort_key)
+        self.assertEqual(
+            ordered,
+            ["Cem", "Çağla", "Işıl", "İlker", "Ozan", "Öykü", "Sena", "Şule", "Ümit", "Zeynep"],
+        )
+
+    def test_name_index_keeps_order_across_updates(self) -> None:
+        index = SortedNameIndex()
+        index.rebuild([("P-1", "Şule"), ("P-2", "Cem")])
+        index.upsert("P-3", "Çağla")
+        index.upsert("P-2", "Zeynep")
+        self.assertEqual(list(index.ids()), ["P-3", "P-1", "P-2"])
+        index.remove("P-1")
+        self.assertEqual(list(index.ids()), ["P-3", "P-2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+from unittest.mock import patch
+
+from app.application.use_cases import (
+    AddVisitRequest,
+    PatientService,
+    RegisterPatientRequest,
+    ScheduleAppointmentRequest,
+)
+from app.domain.entities import Patient
+from app.infrastructure.json_repository import JsonPatientRepository
+from app.infrastructure.sqlite_repository import SqlitePatientRepository
+
+
+class CountingRepository(JsonPatientRepository):
+    writes = 0
+
+    def _write_snapshot(self, patients: Iterable[Patient]) -> None:
+        self.writes += 1
+        super()._write_snapshot(patients)
+
+
+class BlockingRepository(JsonPatientRepository):
+    writing = threading.Event()
+    release = threading.Event()
+
+    def _write_snapshot(self, patients: Iterable[Patient]) -> None:
+        self.writing.set()
+        self.release.wait(5)
+        super()._write_snapshot(patients)
+
+
+def _register(service: PatientService, patient_id: str) -> None:
+    service.register_patient(
+        RegisterPatientRequest(
+            patient_id=patient_id, full_name="Ada", phone="1", age=30, gender="Kadın"
+        )
+    )
+
+
+class TestUnitOfWork(unittest.TestCase):
+    def test_transaction_commits_with_single_write(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = CountingRepository(path)
+            service = PatientService(repo)
+
+            with service.transaction():
+                _register(service, "P-1")
+                for hour in range(9, 19):
+                    service.schedule_appointment(
+                        ScheduleAppointmentRequest(
+                            patient_id="P-1", scheduled_at=datetime(2024, 1, 1, hour), note=""
+                        )
+                    )
+            self.assertEqual(repo.writes, 1)
+            self.assertEqual(len(JsonPatientRepository(path).get("P-1").appointments), 10)
+            self.assertEqual(len(service.agenda(datetime(2024, 1, 1), datetime(2024, 1, 2))), 10)
+
+    def test_transaction_rolls_back_on_error(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = CountingRepository(path)
+            service = PatientService(repo)
+            _register(service, "P-1")
+
+            with self.assertRaises(ValueError):
+                with service.transaction():
+                    service.add_visit(AddVisitRequest(patient_id="P-1", note="Not"))
+                    _register(service, "P-2")
+                    service.add_visit(AddVisitRequest(patient_id="P-404", note="Not"))
+
+            self.assertEqual(repo.writes, 1)
+            self.assertEqual(len(repo.get("P-1").visits), 0)
+            self.assertIsNone(repo.get("P-2"))
+            self.assertEqual(service.search("P-2"), [])
+
+    def test_uncommitted_changes_are_invisible_to_readers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = JsonPatientRepository(Path(temp_dir) / "patients.json")
+            service = PatientService(repo)
+            _register(service, "P-1")
+            stored = repo.get("P-1")
+
+            with service.transaction():
+                service.add_visit(AddVisitRequest(patient_id="P-1", note="Bir"))
+                self.assertEqual(len(repo.get("P-1").visits), 0)
+                self.assertEqual(len(service.get_patient("P-1").visits), 0)
+            self.assertEqual(len(repo.get("P-1").visits), 1)
+            self.assertEqual(len(stored.visits), 0)
+
+            with patch.object(repo, "_write_changes", side_effect=OSError("disk dolu")):
+                with self.assertRaises(OSError):
+                    service.add_visit(AddVisitRequest(patient_id="P-1", note="İki"))
+            self.assertEqual([visit.note for visit in repo.get("P-1").visits], ["Bir"])
+
+    def test_readers_do_not_wait_for_a_slow_write(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = BlockingRepository(Path(temp_dir) / "patients.json")
+            service = PatientService(repo)
+            repo.release.set()
+            _register(service, "P-1")
+            repo.writing.clear()
+            repo.release.clear()
+
+            writer = threading.Thread(
+                target=service.add_visit, args=(AddVisitRequest(patient_id="P-1", note="Bir"),)
+            )
+            writer.start()
+            self.assertTrue(repo.writing.wait(5))
+            try:
+                started = time.monotonic()
+                self.assertEqual(len(list(repo.list_all())), 1)
+                self.assertEqual(len(repo.list_page(None, 10).patients), 1)
+                self.assertIsNotNone(service.get_patient("P-1"))
+                self.assertLess(time.monotonic() - started, 1)
+            finally:
+                repo.release.set()
+                writer.join(5)
+            self.assertEqual(len(repo.get("P-1").visits), 1)
+
+    def test_nested_transaction_rolls_back_to_its_savepoint(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "patients.json"
+            repo = CountingRepository(path)
+            service = PatientService(repo)
+
+            with service.transaction():
+                _register(service, "P-1")
+                service.add_visit(AddVisitRequest(patient_id="P-1", note="Kalır"))
+                with self.assertRaises(ValueError):
+                    with service.transaction():
+                        service.add_visit(AddVisitRequest(patient_id="P-1", note="Geri alınır"))
+                        _register(service, "P-2")
+                        _register(service, "P-1")
+
+            self.assertEqual(repo.writes, 1)
+            reloaded = JsonPatientRepository(path)
+            self.assertEqual([visit.note for visit in reloaded.get("P-1").visits], ["Kalır"])
+            self.assertIsNone(reloaded.get("P-2"))
+
+    def test_sqlite_transaction_reuses_patient_within_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repo = SqlitePatientRepository(Path(temp_dir) / "patients.db")
+            service = PatientService(repo)
+            _register(service, "P-1")
+
+            with service.transaction():
+                service.add_visit(AddVisitRequest(patient_id="P-1", note="Bir"))
+                service.add_visit(AddVisitRequest(patient_id="P-1", note="İki"))
+
+            self.assertEqual([visit.note for visit in repo.get("P-1").visits], ["Bir", "İki"])
+            repo.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+from typing import Dict, List, Tuple
+
+from app.interface.virtual_list import ListboxView, VirtualTreeview
+
+
+class FakeTree:
+    def __init__(self, height: int) -> None:
+        self.height = height
+        self.children: List[str] = []
+        self.values: Dict[str, Tuple[str, ...]] = {}
+        self.selected: Tuple[str, ...] = ()
+        self.inserts = 0
+        self.updates = 0
+
+    def cget(self, _option: str) -> int:
+        return self.height
+
+    def bind(self, *_args, **_kwargs) -> None:
+        pass
+
+    def insert(self, _parent: str, index: int, iid: str, values: Tuple[str, ...]) -> None:
+        self.children.insert(index, iid)
+        self.values[iid] = values
+        self.inserts += 1
+
+    def item(self, iid: str, values: Tuple[str, ...]) -> None:
+        self.values[iid] = values
+        self.updates += 1
+
+    def index(self, iid: str) -> int:
+        return self.children.index(iid)
+
+    def move(self, iid: str, _parent: str, index: int) -> None:
+        self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def delete(self, *iids: str) -> None:
+        for iid in iids:
+            self.children.remove(iid)
+            del self.values[iid]
+
+    def selection(self) -> Tuple[str, ...]:
+        return tuple(iid for iid in self.selected if iid in self.children)
+
+    def selection_set(self, iid: str) -> None:
+        self.selected = (iid,)
+
+    def selection_remove(self, *_iids: str) -> None:
+        self.selected = ()
+
+    def focus(self, iid: str = "") -> str:
+        return iid
+
+
+class FakeListbox:
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.inserts = 0
+
+    def delete(self, first: int, _last: str) -> None:
+        del self.lines[first:]
+
+    def insert(self, _index: str, *lines: str) -> None:
+        self.lines.extend(lines)
+        self.inserts += len(lines)
+
+
+class TestVirtualTreeview(unittest.TestCase):
+    def test_only_visible_window_is_materialized(self) -> None:
+        tree = FakeTree(height=3)
+        view = VirtualTreeview(tree, key=lambda row: row[0], render=lambda row: row)
+        rows = [(f"P-{index}", str(index)) for index in range(100)]
+
+        view.set_items(rows)
+        self.assertEqual(tree.children, ["P-0", "P-1", "P-2"])
+
+        view.select("P-50")
+        self.assertEqual(tree.children, ["P-48", "P-49", "P-50"])
+        self.assertEqual(tree.selection(), ("P-50",))
+
+    def test_refresh_updates_only_changed_rows(self) -> None:
+        tree = FakeTree(height=3)
+        view = VirtualTreeview(tree, key=lambda row: row[0], render=lambda row: row)
+        view.set_items([("P-1", "0"), ("P-2", "0"), ("P-3", "0")])
+        tree.inserts = 0
+
+        view.set_items([("P-1", "0"), ("P-2", "1"), ("P-3", "0")])
+        self.assertEqual((tree.inserts, tree.updates), (0, 1))
+
+        view.update_item(("P-3", "5"))
+        self.assertEqual(tree.values["P-3"], ("P-3", "5"))
+        self.assertEqual((tree.inserts, tree.updates), (0, 2))
+
+    def test_replacing_from_the_window_keeps_the_rows_above(self) -> None:
+        tree = FakeTree(height=3)
+        view = VirtualTreeview(tree, key=lambda row: row[0], render=lambda row: row)
+        view.set_items([(f"P-{index}", "0") for index in range(10)])
+        view.select("P-6")
+        self.assertEqual(view.offset, 4)
+        self.assertEqual(view.item_at(view.offset - 1), ("P-3", "0"))
+
+        view.replace_from(view.offset, [("P-4", "1"), ("P-5", "1"), ("P-6", "1")])
+        self.assertEqual(len(view), 7)
+        self.assertEqual(tree.children, ["P-4", "P-5", "P-6"])
+        self.assertEqual(tree.values["P-5"], ("P-5", "1"))
+        self.assertTrue(view.contains("P-0"))
+        self.assertFalse(view.contains("P-9"))
+
+    def test_scrolling_near_the_end_requests_more_items(self) -> None:
+        tree = FakeTree(height=3)
+        requests: List[int] = []
+
+        def load_more() -> None:
+            requests.append(len(view))
+            if len(view) < 12:
+                view.extend([(f"P-{index}", str(index)) for index in range(len(view), len(view) + 6)])
+
+        view = VirtualTreeview(
+            tree, key=lambda row: row[0], render=lambda row: row, on_reach_end=load_more
+        )
+        view.set_items([(f"P-{index}", str(index)) for index in range(6)])
+        self.assertEqual(requests, [6])
+        self.assertEqual(len(view), 12)
+
+        view.select("P-11")
+        self.assertEqual(tree.children, ["P-9", "P-10", "P-11"])
+        self.assertEqual(requests, [6, 12])
+
+
+class TestListboxView(unittest.TestCase):
+    def test_appending_a_line_inserts_only_the_new_line(self) -> None:
+        listbox = FakeListbox()
+        view = ListboxView(listbox)
+        view.set_lines(["a", "b"])
+        view.set_lines(["a", "b", "c"])
+        self.assertEqual(listbox.lines, ["a", "b", "c"])
+        self.assertEqual(listbox.inserts, 3)
+
+        view.set_lines(["x"])
+        self.assertEqual(listbox.lines, ["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()